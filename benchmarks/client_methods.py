@@ -0,0 +1,180 @@
+""" Benchmarks the get_* methods of each client tier against an in-process fixer.io stand-in server.
+
+Run with `python -m benchmarks.client_methods`. Each method is called `--calls` times in a row and reports its
+throughput, p50 and p99 latency and the peak memory allocated per call, measured in a separate run with
+tracemalloc so that tracing doesn't slow the timed run. Runs are reproducible for a given `--seed`.
+"""
+import argparse
+import datetime
+import time
+import tracemalloc
+
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.free_client import FreeClient
+from fixerio.professional_client import ProfessionalClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+
+from .server import StandInServer
+from .stats import percentile
+
+TIERS = {
+    "free": FreeClient,
+    "basic": BasicClient,
+    "professional": ProfessionalClient,
+    "professional_plus": ProfessionalPlusClient,
+}
+
+# The calls of each method, given the number of the call, so repeated calls don't hit the same date.
+METHODS = {
+    "get_symbols": lambda client, i: client.get_symbols(),
+    "get_latest": lambda client, i: client.get_latest(),
+    "get_latest (symbols)": lambda client, i: client.get_latest(symbols=["USD", "GBP", "JPY"]),
+    "get_historical_rates": lambda client, i: client.get_historical_rates(_date(i)),
+    "get_historical_rates_many": lambda client, i: client.get_historical_rates_many(
+        _date(i * 30 + day) for day in range(30)),
+    "convert_amount": lambda client, i: client.convert_amount("GBP", "USD", 25),
+    "get_time_series": lambda client, i: client.get_time_series("2022-09-27", "2023-09-26"),
+    "get_time_series (matrix)": lambda client, i: client.get_time_series("2022-09-27", "2023-09-26",
+                                                                        as_matrix=True),
+    "get_fluctuation": lambda client, i: client.get_fluctuation("2023-01-01", "2023-06-01"),
+}
+
+
+def _date(day):
+    """ Gets a past date, `day` days before 2023-09-26. """
+    return (datetime.date(2023, 9, 26) - datetime.timedelta(days=day)).isoformat()
+
+
+def _method_name(method):
+    """ Gets the name of the client method a benchmark calls. """
+    return method.split(" ")[0]
+
+
+def create_client(tier, server, **kwargs):
+    """ Creates a client of a tier which sends its requests to a stand-in server.
+
+    :param tier: the tier's name, a key of :data:`TIERS`.
+    :type tier: str
+    :param server: the server.
+    :type server: StandInServer
+    :param kwargs: other arguments of the client.
+    :return: the client.
+    :rtype: FixerioClient
+    """
+    client = TIERS[tier]("benchmark-access-key", **kwargs)
+    client.base_url = server.base_url
+
+    return client
+
+
+def run_calls(client, method, calls):
+    """ Calls a method of a client many times in a row.
+
+    :param client: the client.
+    :type client: FixerioClient
+    :param method: the benchmark, a key of :data:`METHODS`.
+    :type method: str
+    :param calls: the number of calls.
+    :type calls: int
+    :return: the seconds each call took, and the number of calls which failed.
+    :rtype: tuple
+    """
+    call = METHODS[method]
+    latencies = []
+    errors = 0
+    for i in range(calls):
+        started = time.perf_counter()
+        try:
+            call(client, i)
+        except FixerioException:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+
+    return latencies, errors
+
+
+def peak_memory(client, method, calls):
+    """ Measures the peak memory allocated while calling a method of a client many times in a row.
+
+    :param client: the client.
+    :type client: FixerioClient
+    :param method: the benchmark, a key of :data:`METHODS`.
+    :type method: str
+    :param calls: the number of calls.
+    :type calls: int
+    :return: the peak number of bytes allocated.
+    :rtype: int
+    """
+    tracemalloc.start()
+    try:
+        run_calls(client, method, calls)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(tier, method, server, calls):
+    """ Benchmarks a method of a client tier.
+
+    :param tier: the tier's name, a key of :data:`TIERS`.
+    :type tier: str
+    :param method: the benchmark, a key of :data:`METHODS`.
+    :type method: str
+    :param server: the stand-in server the client sends its requests to.
+    :type server: StandInServer
+    :param calls: the number of timed calls.
+    :type calls: int
+    :return: the calls per second, the p50 and p99 latency in seconds, the peak bytes allocated per call,
+        the fraction of calls which failed and the number of requests per call.
+    :rtype: dict
+    """
+    with create_client(tier, server) as client:
+        run_calls(client, method, 1)
+        server.reset()
+        started = time.perf_counter()
+        latencies, errors = run_calls(client, method, calls)
+        elapsed = time.perf_counter() - started
+        requests = server.total_requests()
+        memory_calls = max(1, calls // 10)
+        memory = peak_memory(client, method, memory_calls)
+
+    latencies.sort()
+    return {
+        "throughput": calls / elapsed,
+        "p50": percentile(latencies, 0.5),
+        "p99": percentile(latencies, 0.99),
+        "memory": memory / memory_calls,
+        "errors": errors / calls,
+        "requests": requests / calls,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50, help="timed calls per method (default 50)")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency in ms (default 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="most random ms added to the latency (default 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failed (default 0)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the jitter and errors (default 0)")
+    parser.add_argument("--tier", action="append", choices=list(TIERS), help="tiers to benchmark (default all)")
+    parser.add_argument("--method", action="append", choices=list(METHODS), help="methods to benchmark (default all)")
+    args = parser.parse_args(argv)
+
+    print(f"{'tier':<18} {'method':<26} {'calls/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'KiB/call':>9} "
+          f"{'errors':>7} {'req/call':>8}")
+
+    with StandInServer(latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                       seed=args.seed) as server:
+        for tier in args.tier or TIERS:
+            for method in args.method or METHODS:
+                if not hasattr(TIERS[tier], _method_name(method)):
+                    continue
+                result = benchmark(tier, method, server, args.calls)
+                print(f"{tier:<18} {method:<26} {result['throughput']:>9.1f} {result['p50'] * 1000:>8.2f} "
+                      f"{result['p99'] * 1000:>8.2f} {result['memory'] / 1024:>9.1f} {result['errors']:>7.1%} "
+                      f"{result['requests']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
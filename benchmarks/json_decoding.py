@@ -0,0 +1,67 @@
+""" Compares the JSON decoders of `json_decoder` on responses of the size fixer.io sends for each endpoint.
+
+Run with `python -m benchmarks.json_decoding`.
+"""
+import argparse
+import json
+import timeit
+
+from fixerio.decoding import orjson, stdlib_loads
+
+from . import payloads
+
+
+def requests_loads(data):
+    """ Decodes a body as `requests.Response.json()` does, by decoding the bytes to a str first. """
+    return json.loads(data.decode('utf-8'))
+
+
+def endpoint_bodies():
+    """ Encodes a response of each endpoint, for all currencies.
+
+    :return: the body of each endpoint's response.
+    :rtype: dict
+    """
+    return {
+        "symbols": payloads.symbols_response(),
+        "latest": payloads.latest_response(),
+        "historical": payloads.historical_response("2023-09-26"),
+        "convert": payloads.convert_response("GBP", "USD", 25),
+        "timeseries": payloads.time_series_response("2022-09-27", "2023-09-26"),
+        "fluctuation": payloads.fluctuation_response("2023-01-01", "2023-06-01"),
+    }
+
+
+def decoders():
+    """ Gets the decoders to compare, by name. """
+    candidates = {"requests": requests_loads, "json (bytes)": stdlib_loads}
+    if orjson is not None:
+        candidates["orjson"] = orjson.loads
+
+    return candidates
+
+
+def seconds_per_decode(decoder, body, repeat, number):
+    """ Times a decoder on a body, taking the best of `repeat` runs of `number` decodes. """
+    return min(timeit.repeat(lambda: decoder(body), repeat=repeat, number=number)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs to take the best of (default 5)")
+    parser.add_argument("--seconds", type=float, default=0.2, help="seconds per run and endpoint (default 0.2)")
+    args = parser.parse_args(argv)
+
+    names = list(decoders())
+    print(f"{'endpoint':<12} {'KiB':>8} " + " ".join(f"{name + ' us':>16}" for name in names) + f" {'speedup':>8}")
+
+    for endpoint, response in endpoint_bodies().items():
+        body = json.dumps(response).encode('utf-8')
+        number = max(1, int(args.seconds / seconds_per_decode(requests_loads, body, 1, 1)))
+        timings = [seconds_per_decode(decoder, body, args.repeat, number) for decoder in decoders().values()]
+        print(f"{endpoint:<12} {len(body) / 1024:>8.1f} " + " ".join(f"{timing * 1e6:>16.1f}" for timing in timings)
+              + f" {timings[0] / min(timings[1:]):>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+""" Drives concurrent mixed traffic through one client against the in-process fixer.io stand-in server.
+
+Run with `python -m benchmarks.load_test`. `--workers` threads, or asyncio tasks with `--asyncio`, share one
+client and each make `--calls` calls of get_latest, convert_amount and get_historical_rates, in the proportions
+of `--mix`, over a few currencies and `--dates` dates so that calls overlap as they would in a service. It
+reports the latency of the calls and the amplification: the number of requests the server answered per call.
+Below 1, caching, coalescing and batching save quota; above 1, retries and hedging spend more of it.
+"""
+import argparse
+import asyncio
+import collections
+import datetime
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+
+from fixerio.async_client import AsyncBasicClient, AsyncFreeClient, AsyncProfessionalClient, \
+    AsyncProfessionalPlusClient
+from fixerio.exceptions import FixerioException
+from fixerio.retry import RetryPolicy
+
+from .client_methods import TIERS
+from .server import StandInServer
+from .stats import percentile
+
+ASYNC_TIERS = {
+    "free": AsyncFreeClient,
+    "basic": AsyncBasicClient,
+    "professional": AsyncProfessionalClient,
+    "professional_plus": AsyncProfessionalPlusClient,
+}
+
+# The currency lists of get_latest and get_historical_rates calls, and the pairs of convert_amount calls.
+SYMBOLS = [None, ["USD"], ["USD", "GBP"], ["GBP", "JPY", "CHF"], ["USD", "GBP", "JPY", "CHF", "CAD"]]
+PAIRS = [("GBP", "USD"), ("USD", "JPY"), ("EUR", "GBP"), ("CHF", "EUR")]
+
+DEFAULT_MIX = "latest=6,convert=2,historical=2"
+
+
+def parse_mix(mix):
+    """ Parses the proportions of each kind of call.
+
+    :param mix: comma-separated `kind=weight` pairs, with kinds `latest`, `convert` and `historical`.
+    :type mix: str
+    :return: the weight of each kind of call.
+    :rtype: dict
+    :raises ValueError: if a kind is unknown or a weight isn't a positive number.
+    """
+    weights = {}
+    for part in mix.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in ("latest", "convert", "historical"):
+            raise ValueError(f"Unknown kind of call in the mix: {kind!r}.")
+        weights[kind] = float(weight or 1)
+        if weights[kind] < 0:
+            raise ValueError(f"The weight of {kind!r} is negative.")
+
+    return weights
+
+
+def plan_calls(weights, calls, dates, seed):
+    """ Draws the calls of a worker.
+
+    :param weights: the weight of each kind of call.
+    :type weights: dict
+    :param calls: the number of calls.
+    :type calls: int
+    :param dates: the number of past dates historical calls are spread over.
+    :type dates: int
+    :param seed: the seed of the draw, so runs are reproducible.
+    :type seed: int
+    :return: the kind, method name and arguments of each call.
+    :rtype: list of tuple
+    """
+    generator = random.Random(seed)
+    kinds = generator.choices(list(weights), weights=list(weights.values()), k=calls)
+    planned = []
+    for kind in kinds:
+        if kind == "latest":
+            planned.append((kind, "get_latest", (), {"symbols": generator.choice(SYMBOLS)}))
+        elif kind == "convert":
+            from_ccy, to_ccy = generator.choice(PAIRS)
+            planned.append((kind, "convert_amount", (from_ccy, to_ccy, generator.choice((1, 10, 25, 100))), {}))
+        else:
+            date = (datetime.date(2023, 9, 26) - datetime.timedelta(days=generator.randrange(dates))).isoformat()
+            planned.append((kind, "get_historical_rates", (date,), {"symbols": generator.choice(SYMBOLS)}))
+
+    return planned
+
+
+class Results(object):
+    """ The latency and outcome of the calls of every worker. """
+
+    def __init__(self):
+        self.latencies = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind, latency, failed):
+        """ Records a call.
+
+        :param kind: the kind of call.
+        :type kind: str
+        :param latency: the seconds the call took.
+        :type latency: float
+        :param failed: whether the call raised FixerioException.
+        :type failed: bool
+        """
+        with self._lock:
+            self.latencies[kind].append(latency)
+            if failed:
+                self.errors[kind] += 1
+
+
+def run_threads(client, plans, results):
+    """ Makes the planned calls of each worker on its own thread. """
+    def work(plan):
+        for kind, method, args, kwargs in plan:
+            started = time.perf_counter()
+            try:
+                getattr(client, method)(*args, **kwargs)
+                failed = False
+            except FixerioException:
+                failed = True
+            results.record(kind, time.perf_counter() - started, failed)
+
+    threads = [threading.Thread(target=work, args=(plan,)) for plan in plans]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def run_tasks(client, plans, results):
+    """ Makes the planned calls of each worker in its own asyncio task. """
+    async def work(plan):
+        for kind, method, args, kwargs in plan:
+            started = time.perf_counter()
+            try:
+                await getattr(client, method)(*args, **kwargs)
+                failed = False
+            except FixerioException:
+                failed = True
+            results.record(kind, time.perf_counter() - started, failed)
+
+    async with client:
+        await asyncio.gather(*(work(plan) for plan in plans))
+
+
+def client_options(args, directory):
+    """ Gets the client arguments of the features under test.
+
+    :param args: the command line arguments.
+    :type args: argparse.Namespace
+    :param directory: a temporary directory for the historical rates store.
+    :type directory: str
+    :return: the keyword arguments of the client.
+    :rtype: dict
+    """
+    options = {"max_workers": args.workers, "coalesce": not args.no_coalesce, "rebase": args.rebase,
+               "local_conversion": args.local_conversion, "latest_cache": args.latest_cache or None}
+    if args.historical_store:
+        options["historical_store"] = os.path.join(directory, "rates.sqlite")
+    if args.batch_window:
+        options["batch_window"] = args.batch_window / 1000
+    if args.retries:
+        options["retry"] = RetryPolicy(max_attempts=args.retries + 1, backoff=0.05)
+
+    return options
+
+
+def report(results, elapsed, server):
+    """ Prints the latency of the calls and the requests the server answered per call. """
+    print(f"{'calls':<12} {'count':>7} {'errors':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    everything = []
+    for kind in sorted(results.latencies):
+        latencies = sorted(results.latencies[kind])
+        everything.extend(latencies)
+        _report_latencies(kind, latencies, results.errors[kind])
+    everything.sort()
+    _report_latencies("all", everything, sum(results.errors.values()))
+
+    upstream = server.total_requests()
+    print(f"\n{len(everything) / elapsed:.1f} calls/s over {elapsed:.2f}s")
+    print(f"upstream requests: {upstream} ("
+          + ", ".join(f"{endpoint} {count}" for endpoint, count in sorted(server.requests.items())) + ")")
+    print(f"amplification: {upstream / max(1, len(everything)):.3f} upstream requests per call")
+
+
+def _report_latencies(kind, latencies, errors):
+    print(f"{kind:<12} {len(latencies):>7} {errors:>7} "
+          + " ".join(f"{percentile(latencies, fraction) * 1000:>8.2f}" for fraction in (0.5, 0.9, 0.99, 1.0)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tier", choices=list(TIERS), default="basic", help="client tier (default basic)")
+    parser.add_argument("--workers", type=int, default=16, help="concurrent threads or tasks (default 16)")
+    parser.add_argument("--calls", type=int, default=50, help="calls per worker (default 50)")
+    parser.add_argument("--asyncio", action="store_true", help="use an asyncio client and tasks")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weights of each kind of call (default {DEFAULT_MIX})")
+    parser.add_argument("--dates", type=int, default=30, help="past dates of historical calls (default 30)")
+    parser.add_argument("--latency", type=float, default=20.0, help="server latency in ms (default 20)")
+    parser.add_argument("--jitter", type=float, default=10.0, help="most random ms added to the latency (default 10)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failed (default 0)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the calls, jitter and errors (default 0)")
+    features = parser.add_argument_group("client features")
+    features.add_argument("--latest-cache", action="store_true", help="cache latest rates in memory")
+    features.add_argument("--historical-store", action="store_true", help="store historical rates in SQLite")
+    features.add_argument("--rebase", action="store_true", help="request EUR rates and rebase locally")
+    features.add_argument("--local-conversion", action="store_true", help="convert with the rates of all currencies")
+    features.add_argument("--batch-window", type=float, default=0.0, help="batch rates requests for this many ms")
+    features.add_argument("--no-coalesce", action="store_true", help="don't share identical requests in flight")
+    features.add_argument("--retries", type=int, default=0, help="retries of transient errors (default 0)")
+    args = parser.parse_args(argv)
+
+    weights = parse_mix(args.mix)
+    if "convert" in weights and not hasattr(TIERS[args.tier], "convert_amount"):
+        parser.error(f"The {args.tier} plan has no convert_amount, remove convert from --mix.")
+    plans = [plan_calls(weights, args.calls, args.dates, args.seed + worker) for worker in range(args.workers)]
+
+    directory = tempfile.mkdtemp()
+    results = Results()
+    try:
+        with StandInServer(latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                           seed=args.seed) as server:
+            client = (ASYNC_TIERS if args.asyncio else TIERS)[args.tier]("load-test-access-key",
+                                                                         **client_options(args, directory))
+            client.base_url = server.base_url
+            started = time.perf_counter()
+            if args.asyncio:
+                asyncio.run(run_tasks(client, plans, results))
+            else:
+                with client:
+                    run_threads(client, plans, results)
+            elapsed = time.perf_counter() - started
+            report(results, elapsed, server)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
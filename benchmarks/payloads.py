@@ -0,0 +1,96 @@
+import datetime
+import random
+import string
+
+# Number of currencies fixer.io quotes.
+CURRENCY_COUNT = 170
+
+_MAJOR_CURRENCIES = ["EUR", "USD", "GBP", "JPY", "CHF", "CAD", "AUD", "CNY", "SEK", "NZD"]
+
+
+def _currencies(count=CURRENCY_COUNT, seed=0):
+    """ Makes up a reproducible list of three-letter currency codes, starting with the major currencies.
+
+    :param count: the number of currencies.
+    :type count: int
+    :param seed: the seed of the made-up codes.
+    :type seed: int
+    :return: the currency codes.
+    :rtype: list
+    """
+    generator = random.Random(seed)
+    currencies = list(_MAJOR_CURRENCIES)
+    while len(currencies) < count:
+        currency = "".join(generator.choice(string.ascii_uppercase) for _ in range(3))
+        if currency not in currencies:
+            currencies.append(currency)
+
+    return currencies[:count]
+
+
+CURRENCIES = _currencies()
+
+
+def _rates(generator, symbols=None):
+    """ Makes up rates for the currencies, with as many digits as fixer.io sends.
+
+    :param generator: the random generator.
+    :type generator: random.Random
+    :param symbols: the currencies, None for all.
+    :type symbols: list
+    :return: the rate of each currency.
+    :rtype: dict
+    """
+    return {symbol: round(generator.uniform(0.1, 2000), 6) for symbol in (symbols or CURRENCIES)}
+
+
+def symbols_response():
+    """ A response of the symbols endpoint. """
+    return {"success": True, "symbols": {symbol: f"{symbol} Currency Name" for symbol in CURRENCIES}}
+
+
+def latest_response(base="EUR", symbols=None, seed=0):
+    """ A response of the latest endpoint. """
+    return {"success": True, "timestamp": 1695832924, "base": base, "date": "2023-09-27",
+            "rates": _rates(random.Random(seed), symbols)}
+
+
+def historical_response(date, base="EUR", symbols=None, seed=0):
+    """ A response of the historical rates endpoint. """
+    return {"success": True, "historical": True, "date": date, "timestamp": 1695772799, "base": base,
+            "rates": _rates(random.Random(f"{seed}{date}"), symbols)}
+
+
+def convert_response(from_ccy, to_ccy, amount, date=None, seed=0):
+    """ A response of the convert endpoint. """
+    rate = random.Random(f"{seed}{from_ccy}{to_ccy}{date}").uniform(0.1, 2000)
+    return {"success": True, "query": {"from": from_ccy, "to": to_ccy, "amount": amount},
+            "info": {"timestamp": 1695832924, "rate": round(rate, 6)}, "historical": date is not None,
+            "date": date or "2023-09-27", "result": round(amount * rate, 6)}
+
+
+def _days(start_date, end_date):
+    """ Lists the dates between two dates, inclusive, in YYYY-MM-DD format. """
+    start = datetime.date.fromisoformat(str(start_date))
+    end = datetime.date.fromisoformat(str(end_date))
+    return [(start + datetime.timedelta(days=day)).isoformat() for day in range((end - start).days + 1)]
+
+
+def time_series_response(start_date, end_date, base="EUR", symbols=None, seed=0):
+    """ A response of the time series endpoint. """
+    generator = random.Random(seed)
+    return {"success": True, "timeseries": True, "start_date": str(start_date), "end_date": str(end_date),
+            "base": base, "rates": {date: _rates(generator, symbols) for date in _days(start_date, end_date)}}
+
+
+def fluctuation_response(start_date, end_date, base="EUR", symbols=None, seed=0):
+    """ A response of the fluctuation endpoint. """
+    start_rates = _rates(random.Random(f"{seed}{start_date}"), symbols)
+    end_rates = _rates(random.Random(f"{seed}{end_date}"), symbols)
+    return {"success": True, "fluctuation": True, "start_date": str(start_date), "end_date": str(end_date),
+            "base": base, "rates": {
+                symbol: {"start_rate": start_rates[symbol], "end_rate": end_rates[symbol],
+                         "change": round(end_rates[symbol] - start_rates[symbol], 6),
+                         "change_pct": round((end_rates[symbol] / start_rates[symbol] - 1) * 100, 6)}
+                for symbol in start_rates
+            }}
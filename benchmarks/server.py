@@ -0,0 +1,210 @@
+""" An in-process HTTP server which answers like fixer.io, to benchmark the clients offline.
+
+It serves `/symbols`, `/latest`, `/{date}`, `/convert`, `/timeseries` and `/fluctuation` under `/api`, with
+responses of the size fixer.io sends from :mod:`benchmarks.payloads`, and can add latency and inject errors.
+"""
+import collections
+import functools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from . import payloads
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _symbols(query):
+    """ Gets the currencies of a request, None for all. """
+    symbols = query.get("symbols")
+    return [symbol for symbol in symbols.split(",") if symbol in payloads.CURRENCIES] if symbols else None
+
+
+def response_for(endpoint, query):
+    """ Makes up the response of fixer.io to a request.
+
+    :param endpoint: the last part of the request path.
+    :type endpoint: str
+    :param query: the query parameters.
+    :type query: dict
+    :return: the response, None if the endpoint doesn't exist.
+    :rtype: dict
+    """
+    base = query.get("base", "EUR")
+    if endpoint == "symbols":
+        return payloads.symbols_response()
+    if endpoint == "latest":
+        return payloads.latest_response(base=base, symbols=_symbols(query))
+    if _DATE.fullmatch(endpoint):
+        return payloads.historical_response(endpoint, base=base, symbols=_symbols(query))
+    if endpoint == "convert":
+        return payloads.convert_response(query.get("from"), query.get("to"), float(query.get("amount", 1)),
+                                         date=query.get("date"))
+    if endpoint == "timeseries":
+        return payloads.time_series_response(query["start_date"], query["end_date"], base=base,
+                                             symbols=_symbols(query))
+    if endpoint == "fluctuation":
+        return payloads.fluctuation_response(query["start_date"], query["end_date"], base=base,
+                                             symbols=_symbols(query))
+
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def encoded_response(endpoint, query):
+    """ Encodes the response to a request once, so the server's time goes to sending it.
+
+    :param endpoint: the last part of the request path.
+    :type endpoint: str
+    :param query: the query parameters, as sorted pairs.
+    :type query: tuple
+    :return: the JSON body, None if the endpoint doesn't exist.
+    :rtype: bytes
+    """
+    response = response_for(endpoint, dict(query))
+
+    return json.dumps(response).encode('utf-8') if response is not None else None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """ Answers a request to the stand-in server. """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle's algorithm would delay by the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server.stand_in
+        url = urlsplit(self.path)
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+        query = tuple(sorted((key, value) for key, value in parse_qsl(url.query) if key != "access_key"))
+
+        status, body = server.answer(endpoint, query)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    """ Serves each connection on its own thread. """
+    daemon_threads = True
+    # socketserver's backlog of 5 drops concurrent connects, which clients retry after a second or more.
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # Clients close their pooled connections whenever they like, which isn't an error of the server.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandInServer(object):
+    """ A local HTTP server which answers like fixer.io, on a thread of the current process.
+
+    Point a client at it by setting the client's `base_url` to :attr:`base_url`::
+
+        with StandInServer(latency=0.05) as server:
+            client = BasicClient("key")
+            client.base_url = server.base_url
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=500, seed=0):
+        """
+        :param latency: the seconds the server waits before answering each request.
+        :type latency: float
+        :param jitter: the most seconds added at random to the latency of each request.
+        :type jitter: float
+        :param error_rate: the fraction of requests answered with an error.
+        :type error_rate: float
+        :param error_status: the HTTP status of errors, or 200 to answer them with an unsuccessful response.
+        :type error_status: int
+        :param seed: the seed of the jitter and the errors, so runs are reproducible.
+        :type seed: int
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = collections.Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """ The base URL of the endpoints, as :data:`fixerio.url.BASE_HTTP_URL`. """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        """ Starts serving on a free local port. """
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stand_in = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """ Stops serving. """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def answer(self, endpoint, query):
+        """ Answers a request, after the server's latency.
+
+        :param endpoint: the last part of the request path.
+        :type endpoint: str
+        :param query: the query parameters except the access key, as sorted pairs.
+        :type query: tuple
+        :return: the HTTP status and body of the response.
+        :rtype: tuple
+        """
+        with self._lock:
+            self.requests[endpoint if not _DATE.fullmatch(endpoint) else "historical"] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+
+        if failed:
+            error = {"success": False, "error": {"code": 500, "info": "Injected error."}}
+            return self.error_status, json.dumps(error).encode('utf-8')
+
+        body = encoded_response(endpoint, query)
+        if body is None:
+            return 404, json.dumps({"success": False, "error": {"code": 404, "type": "404_not_found"}}).encode()
+
+        return 200, body
+
+    def total_requests(self):
+        """ Gets the number of requests the server has answered.
+
+        :return: the number of requests.
+        :rtype: int
+        """
+        with self._lock:
+            return sum(self.requests.values())
+
+    def reset(self):
+        """ Forgets the requests the server has answered. """
+        with self._lock:
+            self.requests.clear()
@@ -0,0 +1,17 @@
+import math
+
+
+def percentile(values, fraction):
+    """ Gets a percentile of values, by the nearest-rank method.
+
+    :param values: the values, sorted in ascending order.
+    :type values: list
+    :param fraction: the percentile, between 0 and 1.
+    :type fraction: float
+    :return: the percentile, NaN if there are no values.
+    :rtype: float
+    """
+    if not values:
+        return math.nan
+
+    return values[min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))]
@@ -2,6 +2,7 @@ from .free_client import FreeClient
 from .basic_client import BasicClient
 from .professional_client import ProfessionalClient
 from .professional_plus_client import ProfessionalPlusClient
+from .async_client import AsyncFreeClient, AsyncBasicClient, AsyncProfessionalClient, AsyncProfessionalPlusClient
 from .url import BASE_HTTP_URL, BASE_HTTPS_URL
 
 __version__ = '1.0.0-alpha'
\ No newline at end of file
@@ -0,0 +1,798 @@
+import asyncio
+import contextvars
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .cache import payload_key
+from .batching import AsyncSymbolBatcher
+from .convert import convert, convert_many
+from .exceptions import CircuitOpen, FixerioException, FixerioTimeout
+from .fluctuation import fluctuation
+from .fixerio_client import FixerioClient
+from .metrics import endpoint_name
+from .free_client import FreeClient
+from .basic_client import BasicClient
+from .professional_client import ProfessionalClient
+from .professional_plus_client import ProfessionalPlusClient
+from .rate_matrix import RateMatrix, RateMatrixBuilder
+from .retry import NO_RETRY
+from .singleflight import AsyncSingleFlight
+from .store import HistoricalRatesStore
+from .streaming import STREAM_CHUNK_SIZE, TimeSeriesParser
+from .timeseries import merge_time_series, split_date_range
+
+
+class AsyncFixerioClient(FixerioClient):
+    """ An asyncio client for Fixer.io.
+
+    Payloads are created exactly as by :class:`FixerioClient`, but requests are sent over a non-blocking
+    aiohttp session, so every endpoint method returns an awaitable.
+    """
+    single_flight_class = AsyncSingleFlight
+    symbol_batcher_class = AsyncSymbolBatcher
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an asyncio client.")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass  # pragma: no cover
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """ Closes the pooled connections of the client's session, and of its historical rates store if the
+        client opened it, and writes the count of its quota.
+
+        The client can still be used afterwards, new connections are opened on the next request. Watched latest
+        rates are no longer refreshed until the next call which watches or serves them.
+        """
+        if self.refresher is not None:
+            await self.refresher.stop_async()
+
+        session = None
+        with self._session_lock:
+            if self._session is not None and self._owns_session:
+                session, self._session = self._session, None
+
+        if session is not None:
+            await session.close()
+
+        if self.quota is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.quota.flush)
+
+        if self._owns_historical_store:
+            self.historical_store.close()
+
+    def _create_session(self):
+        """ Creates a session which keeps up to `pool_size` connections alive for reuse.
+
+        :return: a new session.
+        :rtype: aiohttp.ClientSession
+        """
+        if aiohttp is None:
+            raise ImportError("The asyncio clients require aiohttp: pip install fixerio-client[async]")
+
+        connector = aiohttp.TCPConnector(limit=self.pool_size)
+
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _request(self, url, payload, cache=None, batch=False, refresh=False):
+        """ Gets a response from the cache or else sends a GET request for it.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param batch: whether the request is for latest or historical rates, which can be batched.
+        :type batch: bool
+        :param refresh: whether the request is for latest rates, which the client's refresher can refresh.
+        :type refresh: bool
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        if self.hooks is None:
+            return await self._cached_request(url, payload, cache=cache, batch=batch, refresh=refresh)
+
+        started = time.perf_counter()
+        try:
+            response = await self._cached_request(url, payload, cache=cache, batch=batch, refresh=refresh)
+        except BaseException as ex:
+            self.hooks.on_complete(url, payload, time.perf_counter() - started, ex)
+            raise
+        self.hooks.on_complete(url, payload, time.perf_counter() - started)
+
+        return response
+
+    async def _cached_request(self, url, payload, cache=None, batch=False, refresh=False):
+        """ Gets a response from the cache or else sends a GET request for it, see :meth:`_request`.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param batch: whether the request is for latest or historical rates, which can be batched.
+        :type batch: bool
+        :param refresh: whether the request is for latest rates, which the client's refresher can refresh.
+        :type refresh: bool
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        send = self._send_batched if batch else self._send
+
+        if cache is None:
+            with self._call_deadline():
+                return await send(url, payload)
+
+        response = await self._use_cache(cache, self._lookup, url, payload, cache, refresh)
+        if response is not None:
+            return response
+
+        try:
+            with self._call_deadline():
+                response = await send(url, cache.fetch_payload(url, payload))
+        except CircuitOpen:
+            response = await self._use_cache(cache, self._stale_response, url, payload, cache)
+            if response is None:
+                raise
+            return response
+
+        return await self._use_cache(cache, cache.save, url, payload, response)
+
+    async def _use_cache(self, cache, function, *args):
+        """ Calls a function which reads or writes a cache. A historical rates store waits on SQLite, even for
+        another process's writes, so it's used on a thread of the event loop's default executor.
+
+        :param cache: the cache.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param function: the function.
+        :type function: callable
+        :return: the function's result.
+        """
+        if not isinstance(getattr(cache, 'cache', cache), HistoricalRatesStore):
+            return function(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run,
+                                                                function, *args)
+
+    def _start_refresher(self):
+        """ Starts refreshing the watched latest rates in a task of the running event loop, unless it's running. """
+        self.refresher.start_async(self._refresh_latest, self.refresh_interval)
+
+    async def _refresh_latest(self, url, payload):
+        """ Requests watched latest rates and saves them in the latest cache.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the response sent by fixer.io.
+        :rtype: dict
+        :raises FixerioException: if any error making the request, or if it's unsuccessful.
+        """
+        cache = self._rates_cache(self.latest_cache)
+        # Refreshes complete like calls, so the hooks see those which fail in the background.
+        started = time.perf_counter()
+        try:
+            with self._call_deadline():
+                response = await self._send(url, cache.fetch_payload(url, payload))
+            response = self._save_refreshed(url, payload, cache, response)
+        except BaseException as ex:
+            if self.hooks is not None:
+                self.hooks.on_complete(url, payload, time.perf_counter() - started, ex)
+            raise
+        if self.hooks is not None:
+            self.hooks.on_complete(url, payload, time.perf_counter() - started)
+
+        return response
+
+    async def _unwatch_latest(self, symbols=None, base=None):
+        """ Stops refreshing latest rates in the background. They're kept in the cache until they expire.
+
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        """
+        super()._unwatch_latest(symbols=symbols, base=base)
+
+    def _typed(self, result_class, response):
+        """ Converts the awaited response to a typed result if the client returns typed results.
+
+        :param result_class: the type of the result.
+        :type result_class: type
+        :param response: the response.
+        :type response: awaitable
+        :return: the result, or the response if the client returns dicts.
+        :rtype: awaitable
+        """
+        if not self.typed_results:
+            return response
+
+        async def typed():
+            return result_class.from_response(await response)
+
+        return typed()
+
+    async def _send(self, url, payload):
+        """ Sends a GET request, or awaits an identical request already in flight and shares its response.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        if self._in_flight is None:
+            return await self._fetch(url, payload)
+
+        return await self._in_flight.do(payload_key(url, payload), lambda: self._fetch(url, payload),
+                                        timeout=self._remaining())
+
+    async def _fetch(self, url, payload, stream=False):
+        """ Sends a GET request over the client's session, retrying transient errors with the client's retry
+        policy, and fails fast while the circuit breaker is open.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param stream: return the response before its body is read, instead of the decoded body.
+        :type stream: bool
+        :return: the decoded JSON response, or the response with an unread body.
+        :rtype: dict or aiohttp.ClientResponse
+        :raises FixerioException: if any error making a request.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises CircuitOpen: if fixer.io is unavailable.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        retry = self.retry or NO_RETRY
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+        if stream:
+            get = self._get_stream
+        elif self.hedge is not None:
+            get = self._hedged_get
+        else:
+            get = self._get
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await get(url, payload)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                transient, retry_after = self._transient_error(ex, retry)
+                delay = retry.delay(attempt, retry_after) if transient else None
+                if delay is None:
+                    self._record_outcome(transient)
+                    if isinstance(ex, asyncio.TimeoutError):
+                        raise FixerioTimeout(str(ex) or "The request timed out.")
+                    raise FixerioException(str(ex))
+                self._check_retry_deadline(delay, ex)
+                await asyncio.sleep(delay)
+            else:
+                self._record_outcome(False)
+                return response
+
+    async def _acquire_quota(self):
+        """ Counts a request against the client's quota and waits for its token bucket. The count is written to
+        the quota's file on the event loop's default executor.
+
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises FixerioTimeout: if the call's deadline passes before the request can be sent.
+        """
+        wait = self.quota.reserve(max_wait=self._remaining())
+        if self.quota.flush_due():
+            await asyncio.get_running_loop().run_in_executor(None, self.quota.flush)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _get(self, url, payload):
+        """ Sends a GET request over the client's session once.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises aiohttp.ClientError: if any error making a request.
+        :raises asyncio.TimeoutError: if the request times out.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises FixerioTimeout: if the call's deadline passes before the request can be sent.
+        """
+        if self.quota is not None:
+            await self._acquire_quota()
+
+        connect, read = self._connect_read_timeouts()
+        timeout = aiohttp.ClientTimeout(total=self._remaining(), connect=connect, sock_read=read)
+
+        if self.hooks is not None:
+            self.hooks.on_send(url, payload)
+
+        started = time.perf_counter()
+        try:
+            async with self._get_session().get(url, params=payload, timeout=timeout) as response:
+                if self.hooks is not None:
+                    self.hooks.on_first_byte(url, payload, time.perf_counter() - started)
+
+                response.raise_for_status()
+
+                if self.metrics is None and self.hooks is None:
+                    return await self._decode(response)
+
+                body = await response.read()
+                latency = time.perf_counter() - started
+                decode_started = time.perf_counter()
+                result = await self._decode(response, body)
+                decode_seconds = time.perf_counter() - decode_started
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._record_request(url, started, error=True)
+            raise
+
+        if self.hooks is not None:
+            self.hooks.on_decode(url, payload, len(body), decode_seconds)
+        if self.metrics is not None:
+            self.metrics.record_request(self.tier, endpoint_name(url), latency, size=len(body),
+                                        decode_seconds=decode_seconds, error=not self._successful(result))
+
+        return result
+
+    async def _decode(self, response, body=None):
+        """ Decodes a JSON response body with the client's decoder.
+
+        :param response: the response.
+        :type response: aiohttp.ClientResponse
+        :param body: the body of the response, if it has been read.
+        :type body: bytes
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises aiohttp.ClientPayloadError: if the body isn't JSON.
+        """
+        try:
+            if self.json_decoder is None:
+                # Once the body has been read, response.json() only decodes it.
+                return await response.json(content_type=None)
+
+            return self.json_decoder(body if body is not None else await response.read())
+        except ValueError as ex:
+            # Fails like a broken body, so the error goes through the retry policy as any request error.
+            raise aiohttp.ClientPayloadError(f"Invalid JSON response: {ex}")
+
+    async def _get_stream(self, url, payload):
+        """ Sends a GET request over the client's session once, without reading the response body.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the response, which the caller must release.
+        :rtype: aiohttp.ClientResponse
+        :raises aiohttp.ClientError: if any error making a request.
+        :raises asyncio.TimeoutError: if the request times out.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises FixerioTimeout: if the call's deadline passes before the request can be sent.
+        """
+        if self.quota is not None:
+            await self._acquire_quota()
+
+        connect, read = self._connect_read_timeouts()
+        timeout = aiohttp.ClientTimeout(total=self._remaining(), connect=connect, sock_read=read)
+
+        if self.hooks is not None:
+            self.hooks.on_send(url, payload)
+
+        started = time.perf_counter()
+        try:
+            response = await self._get_session().get(url, params=payload, timeout=timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._record_request(url, started, error=True)
+            raise
+
+        if self.hooks is not None:
+            self.hooks.on_first_byte(url, payload, time.perf_counter() - started)
+
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientError:
+            self._record_request(url, started, error=True)
+            response.release()
+            raise
+
+        return response
+
+    async def _hedged_get(self, url, payload):
+        """ Sends a GET request, and an identical one if the first doesn't answer within the hedge delay.
+        The first successful response wins and the other request is cancelled. Both requests count against
+        the quota.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises aiohttp.ClientError: if every request fails.
+        :raises asyncio.TimeoutError: if every request times out.
+        """
+        started = asyncio.get_running_loop().time()
+        tasks = {asyncio.ensure_future(self._get(url, payload))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge.delay())
+            if not done and self.hedge.try_hedge():
+                tasks.add(asyncio.ensure_future(self._get(url, payload)))
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedge.record(asyncio.get_running_loop().time() - started)
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _transient_error(ex, retry):
+        """ Checks whether a request error is transient, so the request may succeed if sent again.
+
+        :param ex: the error.
+        :type ex: aiohttp.ClientError or asyncio.TimeoutError
+        :param retry: the retry policy, which tells the transient HTTP statuses.
+        :type retry: RetryPolicy
+        :return: whether the error is transient, and the response's Retry-After header.
+        :rtype: tuple
+        """
+        if isinstance(ex, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return True, None
+
+        if not isinstance(ex, aiohttp.ClientResponseError):
+            return False, None
+
+        return retry.is_transient(ex.status), (ex.headers or {}).get('Retry-After')
+
+    async def _local_convert(self, from_ccy, to_ccy, amount, date=None):
+        """ Converts an amount from one currency to another with the rates of all currencies.
+
+        :param from_ccy: the three-letter currency code of the currency you would like to convert from.
+        :type from_ccy: str
+        :param to_ccy: the three-letter currency code of the currency you would like to convert to.
+        :type to_ccy: str
+        :param amount: the amount to be converted.
+        :type amount: int or float
+        :param date: specify a date to use historical rates for this conversion.
+        :type date: str (in YYYY-MM-DD format)
+        :return: your conversion result.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return convert(await self._all_rates(date), from_ccy, to_ccy, amount, date=date)
+
+    async def _convert_many(self, from_ccys, to_ccys, amounts, dates=None):
+        """ Converts many amounts locally at once, requesting the rates of all currencies once per date.
+
+        :param from_ccys: the three-letter currency codes of the currencies to convert from.
+        :type from_ccys: list or tuple or numpy.ndarray
+        :param to_ccys: the three-letter currency codes of the currencies to convert to.
+        :type to_ccys: list or tuple or numpy.ndarray
+        :param amounts: the amounts to be converted.
+        :type amounts: list or tuple or numpy.ndarray
+        :param dates: the date of each conversion, None for the latest rates.
+        :type dates: list or tuple or numpy.ndarray
+        :return: the converted amounts, NaN where a currency is unknown.
+        :rtype: numpy.ndarray
+        :raises FixerioException: if any error making a request.
+        """
+        dates = self._conversion_dates(dates)
+
+        unique_dates = list(set(dates)) if dates is not None else [None]
+        responses = dict(zip(unique_dates, await asyncio.gather(*(self._all_rates(date) for date in unique_dates))))
+
+        return convert_many(self._check_rates(responses), from_ccys, to_ccys, amounts, dates=dates)
+
+    async def _stream_rows(self, url, payload, parser):
+        """ Sends a GET request for a time series and parses the response body as it arrives.
+        The request is neither cached nor shared with identical requests in flight.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param parser: the parser of the response, which keeps the fields other than the rates.
+        :type parser: TimeSeriesParser
+        :return: the `(date, rates)` rows of the response.
+        :rtype: async generator
+        :raises FixerioException: if any error making a request, or if the request is unsuccessful.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        # The latency of a streamed request lasts until its whole body has been read.
+        started = time.perf_counter()
+        try:
+            with self._call_deadline():
+                response = await self._fetch(url, payload, stream=True)
+        except FixerioException as ex:
+            self._complete_stream(url, payload, started, error=ex)
+            raise
+
+        size = 0
+        decode_seconds = 0.0
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                decode_started = time.perf_counter()
+                rows = parser.feed(chunk)
+                decode_seconds += time.perf_counter() - decode_started
+                for row in rows:
+                    yield row
+            parser.close()
+        except (aiohttp.ClientError, asyncio.TimeoutError, FixerioException) as ex:
+            self._record_request(url, started, size=size, decode_seconds=decode_seconds, error=True)
+            if isinstance(ex, asyncio.TimeoutError):
+                error = FixerioTimeout(str(ex) or "The request timed out.")
+            elif isinstance(ex, aiohttp.ClientError):
+                error = FixerioException(str(ex))
+            else:
+                error = ex
+            self._complete_stream(url, payload, started, size=size, decode_seconds=decode_seconds, error=error)
+            raise error
+        finally:
+            response.release()
+
+        self._record_request(url, started, size=size, decode_seconds=decode_seconds)
+        self._complete_stream(url, payload, started, size=size, decode_seconds=decode_seconds)
+
+    async def _iter_time_series(self, start_date, end_date, symbols=None, base=None):
+        """ Streams daily historical rates between two dates of your choice. Time frames longer than 365 days
+        are split into windows, which are requested one after another.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the `(date, rates)` rows of the time series, in date order.
+        :rtype: async generator
+        :raises FixerioException: if any error making a request, or if a request is unsuccessful.
+        """
+        for window_start, window_end in split_date_range(start_date, end_date):
+            url, payload = self._time_series_request(window_start, window_end, symbols=symbols, base=base)
+            async for row in self._stream_rows(url, payload, TimeSeriesParser()):
+                yield row
+
+    async def _stream_matrix(self, start_date, end_date, symbols=None, base=None):
+        """ Streams daily historical rates between two dates, at most 365 days apart, into a matrix.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the rates of the time series.
+        :rtype: RateMatrix
+        :raises FixerioException: if any error making a request, or if the request is unsuccessful.
+        """
+        url, payload = self._time_series_request(start_date, end_date, symbols=symbols, base=base)
+        parser = TimeSeriesParser()
+        builder = RateMatrixBuilder()
+        async for date, rates in self._stream_rows(url, payload, parser):
+            builder.append(date, rates)
+
+        return builder.build(base=parser.fields.get('base'))
+
+    async def _windowed_time_series(self, start_date, end_date, symbols=None, base=None, as_matrix=False,
+                                    stream=False):
+        """ Gets daily historical rates between two dates of your choice. Time frames longer than 365 days are
+        split into windows, which are requested concurrently, up to `max_workers` at a time, and merged.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :param as_matrix: return the rates as a :class:`RateMatrix` instead of a response dict.
+        :type as_matrix: bool
+        :param stream: parse each response into the matrix as it arrives, without building nested dicts.
+        :type stream: bool
+        :return: the time series of exchange rates for the currencies you have requested.
+        :rtype: dict or RateMatrix
+        :raises FixerioException: if any error making a request.
+        :raises ValueError: if streaming without `as_matrix`.
+        """
+        windows = split_date_range(start_date, end_date)
+        if stream:
+            if not as_matrix:
+                raise ValueError("Streaming time series requires as_matrix=True, or use iter_time_series.")
+            return RateMatrix.concatenate(await self._gather_concurrently(
+                self._stream_matrix(window_start, window_end, symbols=symbols, base=base)
+                for window_start, window_end in windows
+            ))
+
+        if len(windows) <= 1:
+            response = await self._time_series(start_date, end_date, symbols=symbols, base=base)
+        else:
+            response = merge_time_series(await self._gather_concurrently(
+                self._time_series(window_start, window_end, symbols=symbols, base=base)
+                for window_start, window_end in windows
+            ))
+
+        return RateMatrix.from_time_series(response) if as_matrix else response
+
+    async def _computed_fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Computes the starting and ending rates with absolute and percentage changes over the fluctuation
+        timeframe from the rates of all currencies on both dates, read through the latest cache or historical store.
+
+        :param start_date: the start date of your preferred fluctuation timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred fluctuation timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate and fluctuation data for the currencies you have requested.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        start_date, end_date = self._conversion_dates([start_date, end_date])
+
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
+
+        start_rates, end_rates = await asyncio.gather(self._all_rates(start_date), self._all_rates(end_date))
+
+        return fluctuation(start_rates, end_rates, symbols=symbols, base=base)
+
+    async def _gather_concurrently(self, coroutines):
+        """ Awaits coroutines, running up to `max_workers` of them at a time.
+
+        :param coroutines: the coroutines to await.
+        :type coroutines: iterable
+        :return: the results, in the order of the coroutines.
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
+
+    async def _historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates, requesting the dates missing from the cache concurrently, up to
+        `max_workers` at a time.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the historical exchange rate data of each date, by date in YYYY-MM-DD format, in the order of the
+            dates.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        dates = self._unique_dates(dates)
+
+        return dict(zip(dates, await self._gather_concurrently(
+            self._historical_rates(date, symbols=symbols, base=base) for date in dates
+        )))
+
+    def _iter_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates, requesting the dates missing from the cache concurrently, up to
+        `max_workers` at a time, and yields the rates of each date as soon as they arrive.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the date, in YYYY-MM-DD format, and its historical exchange rate data, in order of completion.
+        :rtype: async generator of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._iter_concurrently(lambda date: self._historical_rates(date, symbols=symbols, base=base),
+                                       self._unique_dates(dates))
+
+    async def _iter_concurrently(self, function, items):
+        """ Awaits a coroutine function with each item, running up to `max_workers` at a time, and yields the
+        results as they are returned. Pending calls are cancelled if the generator is closed early.
+
+        :param function: the coroutine function to call.
+        :type function: callable
+        :param items: the items to call the function with.
+        :type items: iterable
+        :return: each item and its result, in order of completion.
+        :rtype: async generator of tuple
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def limited(item):
+            async with semaphore:
+                return item, await function(item)
+
+        tasks = [asyncio.ensure_future(limited(item)) for item in items]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _backfill(self, start_date, end_date, base=None, time_series=False):
+        """ Requests the rates of all currencies for the dates between two dates which are missing from the
+        historical rates store, so synchronising a range only costs requests for the new dates.
+
+        :param start_date: the first date to have rates for.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date to have rates for. Dates from today on are skipped.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param time_series: request missing dates from the time series endpoint, instead of one by one.
+        :type time_series: bool
+        :return: the first and last date of each range which was missing.
+        :rtype: list of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        store = self.historical_store
+        ranges, pending = await self._use_cache(store, self._backfill_requests, start_date, end_date, base,
+                                                time_series)
+
+        await self._use_cache(store, self._save_backfill,
+                              await self._gather_concurrently(self._request(*request) for request in pending))
+
+        return ranges
+
+
+class AsyncFreeClient(AsyncFixerioClient, FreeClient):
+    """ An asyncio client for the Fixer.io Free Plan. """
+
+
+class AsyncBasicClient(AsyncFixerioClient, BasicClient):
+    """ An asyncio client for the Fixer.io Basic Plan. """
+
+
+class AsyncProfessionalClient(AsyncFixerioClient, ProfessionalClient):
+    """ An asyncio client for the Fixer.io Professional Plan. """
+
+
+class AsyncProfessionalPlusClient(AsyncFixerioClient, ProfessionalPlusClient):
+    """ An asyncio client for the Fixer.io Professional Plus Plan. """
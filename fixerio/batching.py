@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+
+from .cache import split_symbols
+from .exceptions import FixerioTimeout
+
+
+def limit_symbols(response, symbols):
+    """ Limits the currencies of a latest or historical rates response.
+
+    :param response: a latest or historical rates response.
+    :type response: dict
+    :param symbols: comma-separated currency codes to limit output currencies, or None for all currencies.
+    :type symbols: str or list or tuple
+    :return: a copy of the response, with only the requested currencies.
+    :rtype: dict
+    """
+    if not isinstance(response, dict) or not isinstance(response.get('rates'), dict):
+        return response
+
+    rates = response['rates']
+    symbols = split_symbols(symbols)
+    if symbols is None:
+        return dict(response, rates=dict(rates))
+
+    return dict(response, rates={symbol: rates[symbol] for symbol in symbols if symbol in rates})
+
+
+class _Batch(object):
+    """ The requests for the currencies of one base and date which are collected into one request. """
+    __slots__ = ('symbols', 'all_symbols', 'done', 'response', 'error', 'waiters')
+
+    def __init__(self):
+        self.symbols = set()
+        self.all_symbols = False
+        self.done = None
+        self.response = None
+        self.error = None
+        self.waiters = 0
+
+    def add(self, symbols):
+        """ Adds the currencies of a request to the batch.
+
+        :param symbols: comma-separated currency codes, or None for all currencies.
+        :type symbols: str or list or tuple
+        """
+        symbols = split_symbols(symbols)
+        if symbols is None:
+            self.all_symbols = True
+        else:
+            self.symbols.update(symbols)
+
+    def request_symbols(self):
+        """ Gets the currencies to request for the batch.
+
+        :return: the union of the currencies of the requests, or None for all currencies.
+        :rtype: str
+        """
+        if self.all_symbols:
+            return None
+
+        return ','.join(sorted(self.symbols))
+
+
+class SymbolBatcher(object):
+    """ Collects the requests of many threads for rates of the same base and date during a short window, and
+    sends one request for the union of their currencies.
+
+    The first request for a key opens a batch and waits for `window` seconds before sending the request. Each
+    request of the batch gets the response limited to its own currencies.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: the number of seconds to collect requests for before sending one.
+        :type window: float
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._batches = {}
+
+    def do(self, key, symbols, function, timeout=None):
+        """ Adds a request to the open batch for its key, or opens one, and waits for the batch's response.
+
+        :param key: a key identifying the request, regardless of its currencies.
+        :type key: tuple
+        :param symbols: comma-separated currency codes to limit output currencies, or None for all currencies.
+        :type symbols: str or list or tuple
+        :param function: sends the request for the currencies passed to it, or all currencies if None.
+        :type function: callable
+        :param timeout: the maximum number of seconds to wait for the batch's response, or None to wait until
+            it completes.
+        :type timeout: float
+        :return: the response for the request's currencies.
+        :rtype: dict
+        :raises FixerioTimeout: if the batch's response doesn't come within the timeout.
+        """
+        with self._lock:
+            batch = self._batches.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._batches[key] = _Batch()
+                batch.done = threading.Event()
+            batch.add(symbols)
+
+        if leader:
+            try:
+                try:
+                    time.sleep(self.window)
+                finally:
+                    with self._lock:
+                        del self._batches[key]
+
+                batch.response = function(batch.request_symbols())
+            except BaseException as ex:
+                batch.error = ex
+                raise
+            finally:
+                batch.done.set()
+        else:
+            if not batch.done.wait(timeout):
+                raise FixerioTimeout("The batched request didn't complete before the deadline.")
+            if batch.error is not None:
+                raise batch.error
+
+        return limit_symbols(batch.response, symbols)
+
+
+class AsyncSymbolBatcher(object):
+    """ Collects the requests of many tasks for rates of the same base and date during a short window, and
+    sends one request for the union of their currencies.
+
+    The first request for a key opens a batch, whose own task waits for `window` seconds before sending the
+    request. Each request of the batch gets the response limited to its own currencies. Cancelling a request
+    doesn't cancel the batch unless no other request awaits it.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: the number of seconds to collect requests for before sending one.
+        :type window: float
+        """
+        self.window = window
+        self._batches = {}
+
+    async def do(self, key, symbols, function, timeout=None):
+        """ Adds a request to the open batch for its key, or opens one, and awaits the batch's response.
+
+        :param key: a key identifying the request, regardless of its currencies.
+        :type key: tuple
+        :param symbols: comma-separated currency codes to limit output currencies, or None for all currencies.
+        :type symbols: str or list or tuple
+        :param function: a coroutine function which sends the request for the currencies passed to it, or all
+            currencies if None.
+        :type function: callable
+        :param timeout: the maximum number of seconds to wait for the batch's response, or None to wait until
+            it completes.
+        :type timeout: float
+        :return: the response for the request's currencies.
+        :rtype: dict
+        :raises FixerioTimeout: if the batch's response doesn't come within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get((loop, key))
+        leader = batch is None
+        if leader:
+            batch = self._batches[(loop, key)] = _Batch()
+            batch.done = loop.create_task(self._send((loop, key), batch, function))
+            # Waiters may all be gone by the time the request fails, don't log the exception as never retrieved.
+            batch.done.add_done_callback(lambda done: done.cancelled() or done.exception())
+        batch.add(symbols)
+
+        batch.waiters += 1
+        try:
+            if leader:
+                return limit_symbols(await asyncio.shield(batch.done), symbols)
+            return limit_symbols(await asyncio.wait_for(asyncio.shield(batch.done), timeout), symbols)
+        except asyncio.TimeoutError:
+            if leader:
+                raise
+            raise FixerioTimeout("The batched request didn't complete before the deadline.")
+        except asyncio.CancelledError:
+            if batch.waiters == 1:
+                # Requests arriving from now on open a new batch rather than join the cancelled one.
+                self._close((loop, key), batch)
+                batch.done.cancel()
+            raise
+        finally:
+            batch.waiters -= 1
+
+    async def _send(self, key, batch, function):
+        """ Sends the request of a batch once its window is over.
+
+        :param key: the key of the batch.
+        :type key: tuple
+        :param batch: the batch.
+        :type batch: _Batch
+        :param function: a coroutine function which sends the request for the currencies passed to it.
+        :type function: callable
+        :return: the response for the batch's currencies.
+        :rtype: dict
+        """
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            self._close(key, batch)
+
+        return await function(batch.request_symbols())
+
+    def _close(self, key, batch):
+        """ Stops adding requests to a batch.
+
+        :param key: the key of the batch.
+        :type key: tuple
+        :param batch: the batch.
+        :type batch: _Batch
+        """
+        if self._batches.get(key) is batch:
+            del self._batches[key]
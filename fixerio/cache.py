@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+def split_symbols(symbols):
+    """ Splits comma-separated currency codes.
+
+    :param symbols: comma-separated currency codes, or None for all currencies.
+    :type symbols: str or list or tuple
+    :return: the upper case currency codes, or None for all currencies.
+    :rtype: list
+    """
+    if isinstance(symbols, (list, tuple)):
+        symbols = ','.join(symbols)
+
+    if not symbols:
+        return None
+
+    return [symbol.strip().upper() for symbol in str(symbols).split(',') if symbol.strip()]
+
+
+def payload_key(url, payload):
+    """ Creates a hashable key for a request which doesn't depend on the order or case of currency codes.
+
+    :param url: the endpoint URL.
+    :type url: str
+    :param payload: the query parameters created by `_create_payload`.
+    :type payload: dict
+    :return: a key identifying the request.
+    :rtype: tuple
+    """
+    items = []
+    for name, value in payload.items():
+        if name == 'access_key':
+            continue
+
+        if name == 'symbols':
+            value = ','.join(sorted(set(split_symbols(value) or ())))
+        elif name in ('base', 'from', 'to'):
+            value = str(value).upper()
+
+        items.append((name, value))
+
+    return url, tuple(sorted(items))
+
+
+def copy_response(response):
+    """ Copies a response and its nested mappings, so callers can't modify a cached response.
+
+    :param response: a decoded JSON response.
+    :type response: dict
+    :return: a copy of the response.
+    :rtype: dict
+    """
+    return {key: (dict(value) if isinstance(value, dict) else value) for key, value in response.items()}
+
+
+class TTLCache(object):
+    """ A thread-safe, bounded LRU cache of responses which expire with fixer.io's update schedule. """
+
+    def __init__(self, ttl, maxsize=256, min_ttl=None, max_stale=None):
+        """
+        :param ttl: the number of seconds between fixer.io rate updates.
+        :type ttl: int or float
+        :param maxsize: the maximum number of responses kept, the least recently used are evicted first.
+        :type maxsize: int
+        :param min_ttl: the minimum number of seconds a response is kept, even if fixer.io's next update is late.
+            Defaults to a tenth of `ttl`.
+        :type min_ttl: int or float
+        :param max_stale: the number of seconds an expired response can still be served while fixer.io is
+            unavailable, or None for as long as it's kept.
+        :type max_stale: int or float
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.min_ttl = min_ttl if (min_ttl is not None) else ttl / 10
+        self.max_stale = max_stale
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, stale=False, max_stale=None):
+        """ Gets an unexpired response.
+
+        :param key: the request key.
+        :type key: tuple
+        :param stale: also get an expired response, within `max_stale`.
+        :type stale: bool
+        :param max_stale: the number of seconds an expired response can be served for this lookup, which only
+            shortens the cache's `max_stale`.
+        :type max_stale: int or float
+        :return: a copy of the cached response or None if there isn't an unexpired one.
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, response = entry
+            now = time.time()
+            if self.max_stale is not None and expires_at + self.max_stale <= now:
+                del self._entries[key]
+                return None
+
+            # Expired responses are kept until evicted, to serve while fixer.io is unavailable.
+            if expires_at <= now and (not stale or (max_stale is not None and expires_at + max_stale <= now)):
+                return None
+
+            self._entries.move_to_end(key)
+
+        return copy_response(response)
+
+    def set(self, key, response):
+        """ Caches a successful response until fixer.io's next update after the response's `timestamp`.
+
+        :param key: the request key.
+        :type key: tuple
+        :param response: a decoded JSON response.
+        :type response: dict
+        """
+        if not isinstance(response, dict) or response.get('success') is False:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl
+
+        timestamp = response.get('timestamp')
+        if isinstance(timestamp, (int, float)):
+            expires_at = min(expires_at, max(timestamp + self.ttl, now + self.min_ttl))
+
+        with self._lock:
+            self._entries[key] = (expires_at, copy_response(response))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def lookup(self, url, payload):
+        """ Looks a request up in the cache.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the cached response or None if there isn't one.
+        :rtype: dict
+        """
+        return self.get(payload_key(url, payload))
+
+    def lookup_stale(self, url, payload, max_stale=None):
+        """ Looks a request up in the cache, including expired responses.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param max_stale: the number of seconds an expired response can be served, which only shortens the
+            cache's `max_stale`.
+        :type max_stale: int or float
+        :return: the cached response or None if there isn't one.
+        :rtype: dict
+        """
+        return self.get(payload_key(url, payload), stale=True, max_stale=max_stale)
+
+    def fetch_payload(self, url, payload):
+        """ Gets the query parameters to send when a request isn't cached.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :return: the query parameters to send.
+        :rtype: dict
+        """
+        return payload
+
+    def save(self, url, payload, response):
+        """ Caches the response to a request.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :param response: the response to the query parameters given by `fetch_payload`.
+        :type response: dict
+        :return: the response for the request.
+        :rtype: dict
+        """
+        self.set(payload_key(url, payload), response)
+
+        return response
+
+    def clear(self):
+        """ Removes all cached responses. """
+        with self._lock:
+            self._entries.clear()
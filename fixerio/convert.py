@@ -0,0 +1,115 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .store import DEFAULT_BASE
+
+
+def _rate(response, ccy):
+    """ Gets the rate of a currency against the base currency of a rates response.
+
+    :param response: a latest or historical rates response.
+    :type response: dict
+    :param ccy: a three-letter currency code.
+    :type ccy: str
+    :return: the rate or None if the currency is unknown.
+    :rtype: float
+    """
+    if ccy == (response.get('base') or DEFAULT_BASE).upper():
+        return 1.0
+
+    return response['rates'].get(ccy)
+
+
+def convert(response, from_ccy, to_ccy, amount, date=None):
+    """ Converts an amount from one currency to another with the rates of a response for all currencies.
+
+    :param response: a latest or historical rates response.
+    :type response: dict
+    :param from_ccy: the three-letter currency code of the currency you would like to convert from.
+    :type from_ccy: str
+    :param to_ccy: the three-letter currency code of the currency you would like to convert to.
+    :type to_ccy: str
+    :param amount: the amount to be converted.
+    :type amount: int or float
+    :param date: the date of historical rates used for this conversion.
+    :type date: str (in YYYY-MM-DD format)
+    :return: the conversion result, in the shape of a fixer.io convert response.
+    :rtype: dict
+    """
+    if not isinstance(response, dict) or not response.get('success') or not isinstance(response.get('rates'), dict):
+        return response
+
+    from_rate = _rate(response, from_ccy.upper())
+    if not from_rate:
+        return {"success": False, "error": {"code": 401, "type": "invalid_from_currency"}}
+
+    to_rate = _rate(response, to_ccy.upper())
+    if to_rate is None:
+        return {"success": False, "error": {"code": 402, "type": "invalid_to_currency"}}
+
+    rate = to_rate / from_rate
+
+    result = {
+        "success": True,
+        "query": {"from": from_ccy, "to": to_ccy, "amount": amount},
+        "info": {"timestamp": response.get('timestamp'), "rate": rate},
+    }
+    if date is not None:
+        result["historical"] = True
+    result["date"] = response.get('date')
+    result["result"] = amount * rate
+
+    return result
+
+
+def convert_many(responses, from_ccys, to_ccys, amounts, dates=None):
+    """ Converts many amounts at once with NumPy.
+
+    :param responses: rates responses for all currencies by date, with None as the date of the latest rates.
+    :type responses: dict
+    :param from_ccys: the three-letter currency codes of the currencies to convert from.
+    :type from_ccys: list or tuple or numpy.ndarray
+    :param to_ccys: the three-letter currency codes of the currencies to convert to.
+    :type to_ccys: list or tuple or numpy.ndarray
+    :param amounts: the amounts to be converted.
+    :type amounts: list or tuple or numpy.ndarray
+    :param dates: the date of each conversion in YYYY-MM-DD format, or None to use the latest rates for all.
+    :type dates: list or tuple or numpy.ndarray
+    :return: the converted amounts, NaN where a currency is unknown.
+    :rtype: numpy.ndarray
+    """
+    if np is None:
+        raise ImportError("Converting many amounts requires numpy: pip install fixerio-client[numpy]")
+
+    from_ccys = np.char.upper(np.asarray(from_ccys, dtype=str))
+    to_ccys = np.char.upper(np.asarray(to_ccys, dtype=str))
+    amounts = np.asarray(amounts, dtype=np.float64)
+    results = np.full(amounts.shape, np.nan)
+
+    if dates is not None:
+        dates = np.asarray(dates, dtype=object)
+
+    for date, response in responses.items():
+        rows = np.ones(amounts.shape, dtype=bool) if dates is None else (dates == date)
+        if not rows.any():
+            continue
+
+        base = (response.get('base') or DEFAULT_BASE).upper()
+        # The last element is the NaN rate of unknown currencies.
+        symbols = {symbol: index for index, symbol in enumerate(response['rates'])}
+        rates = np.fromiter(response['rates'].values(), dtype=np.float64, count=len(symbols))
+        rates = np.append(rates, np.nan)
+        if base not in symbols:
+            symbols[base] = len(rates)
+            rates = np.append(rates, 1.0)
+
+        def indices(ccys):
+            codes, inverse = np.unique(ccys[rows], return_inverse=True)
+            code_indices = np.array([symbols.get(code, len(response['rates'])) for code in codes], dtype=np.intp)
+            return code_indices[inverse]
+
+        results[rows] = amounts[rows] * rates[indices(to_ccys)] / rates[indices(from_ccys)]
+
+    return results
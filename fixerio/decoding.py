@@ -0,0 +1,27 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def stdlib_loads(data):
+    """ Decodes a JSON response body with the json module, which detects the encoding of bytes itself.
+
+    :param data: the response body.
+    :type data: bytes or str
+    :return: the decoded JSON.
+    :rtype: dict
+    :raises ValueError: if the body isn't JSON.
+    """
+    return json.loads(data)
+
+
+def fastest_loads():
+    """ Gets the fastest installed JSON decoder which decodes bytes directly, without decoding a str first.
+
+    :return: `orjson.loads` if orjson is installed, else :func:`stdlib_loads`.
+    :rtype: callable
+    """
+    return orjson.loads if orjson is not None else stdlib_loads
@@ -1,3 +1,18 @@
 class FixerioException(BaseException):
     """ Class for all fixer.io GET request exceptions. """
     pass
+
+
+class QuotaExceeded(FixerioException):
+    """ Raised before sending a request which would exceed the plan's request quota or rate limit. """
+    pass
+
+
+class CircuitOpen(FixerioException):
+    """ Raised instead of sending a request while fixer.io is unavailable. """
+    pass
+
+
+class FixerioTimeout(FixerioException):
+    """ Raised when a request times out, or a call runs past its deadline. """
+    pass
@@ -1,14 +1,53 @@
+import contextlib
+import contextvars
 import datetime
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 import requests
-from .exceptions import FixerioException
+from requests.adapters import HTTPAdapter
+from .batching import SymbolBatcher
+from .cache import TTLCache, payload_key
+from .convert import convert, convert_many
+from .decoding import fastest_loads
+from .exceptions import CircuitOpen, FixerioException, FixerioTimeout
+from .fluctuation import fluctuation
+from .hedging import HedgePolicy
+from .hooks import chain_hooks
+from .metrics import MetricsRegistry, endpoint_name
+from .quota import QuotaScheduler
+from .rate_matrix import RateMatrix, RateMatrixBuilder
+from .rebase import RebasingCache
+from .refresher import LatestRatesRefresher
+from .results import ConversionResult, FluctuationResult, HistoricalRates, LatestRates
+from .retry import NO_RETRY, CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight
+from .store import DEFAULT_BASE, HistoricalRatesStore
+from .streaming import STREAM_CHUNK_SIZE, TimeSeriesParser
+from .timeouts import DEFAULT_TIMEOUT, current_timeouts, timeouts
+from .timeseries import merge_time_series, missing_ranges, split_date_range, to_date
 from .url import BASE_HTTP_URL
 
 
 class FixerioClient(object):
     """ A client for Fixer.io. """
     base_url = BASE_HTTP_URL
+    # Number of seconds between updates of the latest rates on the plan.
+    refresh_interval = 3600
+    # Number of requests per month on the plan.
+    monthly_quota = 100
+    # The plan's label in metrics.
+    tier = "default"
+    # Coalesces concurrent identical requests, see `coalesce`.
+    single_flight_class = SingleFlight
+    # Collects latest and historical rates requests into one request, see `batch_window`.
+    symbol_batcher_class = SymbolBatcher
 
-    def __init__(self, access_key, symbols=None, base=None):
+    def __init__(self, access_key, symbols=None, base=None, pool_size=10, session=None, latest_cache=None,
+                 historical_store=None, rebase=False, local_conversion=False, max_workers=4, coalesce=True,
+                 batch_window=None, quota=None, retry=None, circuit_breaker=None, timeout=DEFAULT_TIMEOUT,
+                 deadline=None, hedge=None, json_decoder=None, typed_results=False, metrics=None,
+                 hooks=None, refresh_latest=False):
         """
         :param access_key: your API Key.
         :type access_key: str or unicode
@@ -16,10 +55,787 @@ class FixerioClient(object):
         :type symbols: list or tuple
         :param base: currency symbol for base currency. The default base currency is EUR.
         :type base: str
+        :param pool_size: the maximum number of keep-alive connections kept open to fixer.io.
+        :type pool_size: int
+        :param session: a session to send requests with. A session passed in is never closed by the client.
+        :type session: requests.Session
+        :param latest_cache: `True` to cache latest rates until the plan's next rate update, or a cache to use.
+        :type latest_cache: bool or TTLCache
+        :param historical_store: the path of a SQLite database, or a store, to keep historical rates in.
+        :type historical_store: str or HistoricalRatesStore
+        :param rebase: request latest and historical rates of all currencies for the EUR base only, and compute
+            the rates for other base currencies and limited output currencies locally.
+        :type rebase: bool
+        :param local_conversion: convert amounts locally with the rates of all currencies, instead of requesting
+            each conversion. Use with `latest_cache` and `historical_store` to only request rates once per date.
+        :type local_conversion: bool
+        :param max_workers: the maximum number of requests a single call sends concurrently.
+        :type max_workers: int
+        :param coalesce: send one request for concurrent identical calls, and share its response between them.
+        :type coalesce: bool
+        :param batch_window: the number of seconds, e.g. 0.005, to collect concurrent latest and historical rates
+            requests for the same base and date, and send one request for the union of their currencies.
+            None sends each request immediately.
+        :type batch_window: float
+        :param quota: `True` to count requests against the plan's monthly quota and reject requests beyond it,
+            the number of requests allowed per month, or a scheduler to use.
+        :type quota: bool or int or QuotaScheduler
+        :param retry: `True` to retry requests which fail with transient errors with the default policy, or a
+            policy to use.
+        :type retry: bool or RetryPolicy
+        :param circuit_breaker: `True` to fail requests fast while fixer.io is unavailable with the default
+            breaker, or a breaker to use.
+        :type circuit_breaker: bool or CircuitBreaker
+        :param timeout: the number of seconds to wait for a connection and between bytes of a response, as one
+            number or a (connect, read) tuple. None waits forever.
+        :type timeout: float or tuple
+        :param deadline: the number of seconds each request may take, including retries and waits for the quota
+            and for identical or batched requests of other callers.
+        :type deadline: float
+        :param hedge: `True` to send a second, identical request when the first is slower than most recent
+            requests, within a budget, with the default policy, or a policy to use. The first response wins.
+        :type hedge: bool or HedgePolicy
+        :param json_decoder: `True` to decode responses with the fastest installed JSON library, orjson if it is
+            installed, or a function decoding a response body from bytes. None decodes responses with requests.
+        :type json_decoder: bool or callable
+        :param typed_results: return latest and historical rates, conversions and fluctuations as compact objects
+            with `__slots__` and array-backed rates (see :mod:`fixerio.results`) instead of dicts. Unsuccessful
+            responses then raise :class:`FixerioException`.
+        :type typed_results: bool
+        :param metrics: `True` to record the requests and cache lookups of the client in a new registry, or a
+            registry to record them in, which can be shared by many clients.
+        :type metrics: bool or MetricsRegistry
+        :param hooks: callbacks on the stages of the client's calls, with their timings, for tracing and
+            profiling (see :class:`fixerio.hooks.RequestHooks`), or a list of them to call in order.
+        :type hooks: RequestHooks or list
+        :param refresh_latest: `True` to refresh the latest rates of watched requests in the background on the
+            plan's update schedule, or a refresher to use (see :class:`fixerio.refresher.LatestRatesRefresher`).
+            Watched requests are then answered from the `latest_cache`, which is created if not given, even just
+            after the rates expire. Each refresh counts against the quota.
+        :type refresh_latest: bool or LatestRatesRefresher
         """
         self.access_key = access_key
         self.symbols = symbols
         self.base = base
+        self.pool_size = pool_size
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+
+        self.refresher = LatestRatesRefresher() if (refresh_latest is True) else (refresh_latest or None)
+        if self.refresher is not None and not latest_cache:
+            latest_cache = True
+
+        if latest_cache is True:
+            latest_cache = TTLCache(self.refresh_interval)
+        self.latest_cache = latest_cache if (latest_cache is not False) else None
+
+        self._owns_historical_store = isinstance(historical_store, str)
+        if self._owns_historical_store:
+            historical_store = HistoricalRatesStore(historical_store)
+        self.historical_store = historical_store
+        self.rebase = rebase
+        self.local_conversion = local_conversion
+        self.max_workers = max_workers
+        self._in_flight = self.single_flight_class() if coalesce else None
+        self._batcher = self.symbol_batcher_class(batch_window) if batch_window is not None else None
+
+        if quota is True:
+            quota = QuotaScheduler(self.monthly_quota)
+        elif isinstance(quota, int) and not isinstance(quota, bool):
+            quota = QuotaScheduler(quota)
+        self.quota = quota or None
+
+        self.retry = RetryPolicy() if (retry is True) else (retry or None)
+        self.circuit_breaker = CircuitBreaker() if (circuit_breaker is True) else (circuit_breaker or None)
+        self.timeout = timeout
+        self.deadline = deadline
+        self.hedge = HedgePolicy() if (hedge is True) else (hedge or None)
+        self._hedge_executor = None
+        self._executor = None
+        self._workers = threading.local()
+        self.json_decoder = fastest_loads() if (json_decoder is True) else (json_decoder or None)
+        self.typed_results = typed_results
+        self.metrics = MetricsRegistry() if (metrics is True) else (metrics or None)
+        self.hooks = chain_hooks(hooks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ Closes the pooled connections of the client's session, and of its historical rates store if the
+        client opened it, and writes the count of its quota.
+
+        The client can still be used afterwards, new connections are opened on the next request. Watched latest
+        rates are no longer refreshed until the next call which watches or serves them.
+        """
+        if self.refresher is not None:
+            self.refresher.stop()
+
+        with self._session_lock:
+            if self._session is not None and self._owns_session:
+                self._session.close()
+                self._session = None
+
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False)
+                self._hedge_executor = None
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        if self.quota is not None:
+            self.quota.flush()
+
+        if self._owns_historical_store:
+            self.historical_store.close()
+
+    def _create_session(self):
+        """ Creates a session which keeps up to `pool_size` connections alive for reuse.
+
+        :return: a new session.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    def _get_session(self):
+        """ Gets the session shared by all requests of this client, creating it on first use.
+
+        :return: the client's session.
+        :rtype: requests.Session
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+
+        return session
+
+    def _request(self, url, payload, cache=None, batch=False, refresh=False):
+        """ Gets a response from the cache or else sends a GET request for it.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param batch: whether the request is for latest or historical rates, which can be batched.
+        :type batch: bool
+        :param refresh: whether the request is for latest rates, which the client's refresher can refresh.
+        :type refresh: bool
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        if self.hooks is None:
+            return self._cached_request(url, payload, cache=cache, batch=batch, refresh=refresh)
+
+        started = time.perf_counter()
+        try:
+            response = self._cached_request(url, payload, cache=cache, batch=batch, refresh=refresh)
+        except BaseException as ex:
+            self.hooks.on_complete(url, payload, time.perf_counter() - started, ex)
+            raise
+        self.hooks.on_complete(url, payload, time.perf_counter() - started)
+
+        return response
+
+    def _cached_request(self, url, payload, cache=None, batch=False, refresh=False):
+        """ Gets a response from the cache or else sends a GET request for it, see :meth:`_request`.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param batch: whether the request is for latest or historical rates, which can be batched.
+        :type batch: bool
+        :param refresh: whether the request is for latest rates, which the client's refresher can refresh.
+        :type refresh: bool
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        send = self._send_batched if batch else self._send
+
+        if cache is None:
+            with self._call_deadline():
+                return send(url, payload)
+
+        response = self._lookup(url, payload, cache, refresh=refresh)
+        if response is not None:
+            return response
+
+        try:
+            with self._call_deadline():
+                response = send(url, cache.fetch_payload(url, payload))
+        except CircuitOpen:
+            response = self._stale_response(url, payload, cache)
+            if response is None:
+                raise
+            return response
+
+        return cache.save(url, payload, response)
+
+    def _lookup(self, url, payload, cache, refresh=False):
+        """ Looks a response up in a cache, recording the lookup in the client's metrics and hooks.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :param refresh: whether the request is for latest rates, which the client's refresher can refresh.
+        :type refresh: bool
+        :return: the cached response, or None.
+        :rtype: dict
+        """
+        started = time.perf_counter()
+        response = cache.lookup(url, payload)
+        if response is None and refresh and self.refresher is not None:
+            response = self._stale_while_refreshing(url, payload, cache)
+
+        if self.metrics is not None:
+            self.metrics.record_cache(self.tier, endpoint_name(url), response is not None)
+        if self.hooks is not None:
+            self.hooks.on_cache_lookup(url, payload, response is not None, time.perf_counter() - started)
+
+        return response
+
+    def _stale_while_refreshing(self, url, payload, cache):
+        """ Gets the expired response of a watched latest rates request, within the refresher's `max_stale`,
+        and refreshes the watched requests at once.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: the latest rates cache.
+        :type cache: TTLCache or RebasingCache
+        :return: the expired response, or None if the request isn't watched or its response is too stale.
+        :rtype: dict
+        """
+        if not self.refresher.watches(payload_key(url, cache.fetch_payload(url, payload))):
+            return None
+
+        response = cache.lookup_stale(url, payload, max_stale=self.refresher.max_stale)
+        if response is not None:
+            self._start_refresher()
+            self.refresher.wake()
+
+        return response
+
+    def _start_refresher(self):
+        """ Starts refreshing the watched latest rates on a background thread, unless it's running. """
+        self.refresher.start(self._refresh_latest, self.refresh_interval)
+
+    def _refresh_latest(self, url, payload):
+        """ Requests watched latest rates and saves them in the latest cache.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the response sent by fixer.io.
+        :rtype: dict
+        :raises FixerioException: if any error making the request, or if it's unsuccessful.
+        """
+        cache = self._rates_cache(self.latest_cache)
+        # Refreshes complete like calls, so the hooks see those which fail in the background.
+        started = time.perf_counter()
+        try:
+            with self._call_deadline():
+                response = self._send(url, cache.fetch_payload(url, payload))
+            response = self._save_refreshed(url, payload, cache, response)
+        except BaseException as ex:
+            if self.hooks is not None:
+                self.hooks.on_complete(url, payload, time.perf_counter() - started, ex)
+            raise
+        if self.hooks is not None:
+            self.hooks.on_complete(url, payload, time.perf_counter() - started)
+
+        return response
+
+    def _save_refreshed(self, url, payload, cache, response):
+        """ Saves refreshed latest rates in the latest cache.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: the latest rates cache.
+        :type cache: TTLCache or RebasingCache
+        :param response: the response sent by fixer.io.
+        :type response: dict
+        :return: the response.
+        :rtype: dict
+        :raises FixerioException: if the response is unsuccessful.
+        """
+        if not self._successful(response):
+            raise FixerioException(f"Latest rates refresh failed: {response.get('error')}")
+
+        cache.save(url, payload, response)
+
+        return response
+
+    def _call_deadline(self):
+        """ Starts the client's deadline for a request, which only shortens the deadline set by the caller.
+
+        :return: a context manager for the request.
+        :rtype: contextlib.AbstractContextManager
+        """
+        if self.deadline is None:
+            return contextlib.nullcontext()
+
+        return timeouts(deadline=self.deadline)
+
+    @staticmethod
+    def _remaining():
+        """ Gets the time left until the deadline of the call.
+
+        :return: the number of seconds left, or None if there is no deadline.
+        :rtype: float
+        :raises FixerioTimeout: if the deadline has passed.
+        """
+        call = current_timeouts()
+
+        return call.remaining() if (call is not None) else None
+
+    def _connect_read_timeouts(self):
+        """ Gets the timeouts of the next request, from the client's and the call's timeouts and deadline.
+
+        :return: the number of seconds to wait for a connection and between bytes of the response, each None
+            to wait forever.
+        :rtype: tuple
+        :raises FixerioTimeout: if the deadline has passed.
+        """
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+
+        call = current_timeouts()
+        if call is None:
+            return connect, read
+
+        connect = call.connect if (call.connect is not None) else connect
+        read = call.read if (call.read is not None) else read
+
+        remaining = call.remaining()
+        if remaining is not None:
+            connect = remaining if (connect is None) else min(connect, remaining)
+            read = remaining if (read is None) else min(read, remaining)
+
+        return connect, read
+
+    def _stale_response(self, url, payload, cache):
+        """ Gets an expired cached response to answer a request with while the circuit breaker is open.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param cache: a cache of responses for the endpoint.
+        :type cache: TTLCache or HistoricalRatesStore or RebasingCache
+        :return: the expired response, or None if there isn't one or the breaker doesn't serve stale responses.
+        :rtype: dict
+        """
+        if not self.circuit_breaker.serve_stale:
+            return None
+
+        return cache.lookup_stale(url, payload)
+
+    def _rates_cache(self, cache):
+        """ Gets the cache for a latest or historical rates request, which rebases responses in rebase mode.
+
+        :param cache: the cache or store of the endpoint, or None.
+        :type cache: TTLCache or HistoricalRatesStore
+        :return: the cache to request with.
+        :rtype: TTLCache or HistoricalRatesStore or RebasingCache
+        """
+        if self.rebase:
+            return RebasingCache(cache)
+
+        return cache
+
+    def _send(self, url, payload):
+        """ Sends a GET request, or waits for an identical request already in flight and shares its response.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        if self._in_flight is None:
+            return self._fetch(url, payload)
+
+        return self._in_flight.do(payload_key(url, payload), lambda: self._fetch(url, payload),
+                                  timeout=self._remaining())
+
+    def _send_batched(self, url, payload):
+        """ Sends a latest or historical rates request in the open batch for its base and date.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response, limited to the request's currencies.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        if self._batcher is None:
+            return self._send(url, payload)
+
+        symbols = payload.get('symbols')
+        payload = {key: value for key, value in payload.items() if key != 'symbols'}
+
+        def send(batch_symbols):
+            return self._send(url, payload if batch_symbols is None else dict(payload, symbols=batch_symbols))
+
+        return self._batcher.do(payload_key(url, payload), symbols, send, timeout=self._remaining())
+
+    def _fetch(self, url, payload, stream=False):
+        """ Sends a GET request over the client's session, retrying transient errors with the client's retry
+        policy, and fails fast while the circuit breaker is open.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param stream: return the response before its body is read, instead of the decoded body.
+        :type stream: bool
+        :return: the decoded JSON response, or the response with an unread body.
+        :rtype: dict or requests.Response
+        :raises FixerioException: if any error making a request.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises CircuitOpen: if fixer.io is unavailable.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        retry = self.retry or NO_RETRY
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+        if stream:
+            get = self._get_stream
+        elif self.hedge is not None:
+            get = self._hedged_get
+        else:
+            get = self._get
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = get(url, payload)
+            except requests.exceptions.RequestException as ex:
+                transient, retry_after = self._transient_error(ex, retry)
+                delay = retry.delay(attempt, retry_after) if transient else None
+                if delay is None:
+                    self._record_outcome(transient)
+                    if isinstance(ex, requests.exceptions.Timeout):
+                        raise FixerioTimeout(str(ex))
+                    raise FixerioException(str(ex))
+                self._check_retry_deadline(delay, ex)
+                time.sleep(delay)
+            else:
+                self._record_outcome(False)
+                return response
+
+    def _get(self, url, payload):
+        """ Sends a GET request over the client's session once.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises requests.exceptions.RequestException: if any error making a request.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises FixerioTimeout: if the call's deadline passes before the request can be sent.
+        """
+        if self.quota is not None:
+            self.quota.acquire(max_wait=self._remaining())
+
+        if self.hooks is not None:
+            self.hooks.on_send(url, payload)
+
+        started = time.perf_counter()
+        try:
+            response = self._get_session().get(url, params=payload, timeout=self._connect_read_timeouts())
+            if self.hooks is not None:
+                self.hooks.on_first_byte(url, payload, response.elapsed.total_seconds())
+
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self._record_request(url, started, error=True)
+            raise
+
+        if self.metrics is None and self.hooks is None:
+            return self._decode(response)
+
+        latency = time.perf_counter() - started
+        decode_started = time.perf_counter()
+        try:
+            result = self._decode(response)
+        except requests.exceptions.RequestException:
+            self._record_request(url, started, error=True)
+            raise
+        decode_seconds = time.perf_counter() - decode_started
+        size = len(response.content)
+
+        if self.hooks is not None:
+            self.hooks.on_decode(url, payload, size, decode_seconds)
+        if self.metrics is not None:
+            self.metrics.record_request(self.tier, endpoint_name(url), latency, size=size,
+                                        decode_seconds=decode_seconds, error=not self._successful(result))
+
+        return result
+
+    def _record_request(self, url, started, size=0, decode_seconds=0.0, error=False):
+        """ Records a request in the client's metrics, if it has any.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param started: the `time.perf_counter()` when the request was sent.
+        :type started: float
+        :param size: the number of bytes of the response body.
+        :type size: int
+        :param decode_seconds: the number of seconds spent decoding the response body.
+        :type decode_seconds: float
+        :param error: whether the request failed or the response was unsuccessful.
+        :type error: bool
+        """
+        if self.metrics is not None:
+            self.metrics.record_request(self.tier, endpoint_name(url), time.perf_counter() - started, size=size,
+                                        decode_seconds=decode_seconds, error=error)
+
+    @staticmethod
+    def _successful(response):
+        """ Checks whether a decoded response is successful.
+
+        :param response: the decoded response.
+        :type response: dict
+        :return: whether fixer.io answered the request.
+        :rtype: bool
+        """
+        return isinstance(response, dict) and bool(response.get('success'))
+
+    def _decode(self, response):
+        """ Decodes a JSON response body with the client's decoder.
+
+        :param response: the response.
+        :type response: requests.Response
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises requests.exceptions.RequestException: if the body isn't JSON.
+        """
+        if self.json_decoder is None:
+            return response.json()
+
+        try:
+            return self.json_decoder(response.content)
+        except ValueError as ex:
+            # Fails like response.json(), so the error goes through the retry policy as any request error.
+            raise requests.exceptions.RequestException(f"Invalid JSON response: {ex}", response=response)
+
+    def _get_stream(self, url, payload):
+        """ Sends a GET request over the client's session once, without reading the response body.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the response, which the caller must close.
+        :rtype: requests.Response
+        :raises requests.exceptions.RequestException: if any error making a request.
+        :raises QuotaExceeded: if the request would exceed the client's quota.
+        :raises FixerioTimeout: if the call's deadline passes before the request can be sent.
+        """
+        if self.quota is not None:
+            self.quota.acquire(max_wait=self._remaining())
+
+        if self.hooks is not None:
+            self.hooks.on_send(url, payload)
+
+        started = time.perf_counter()
+        try:
+            response = self._get_session().get(url, params=payload, timeout=self._connect_read_timeouts(),
+                                               stream=True)
+        except requests.exceptions.RequestException:
+            self._record_request(url, started, error=True)
+            raise
+
+        if self.hooks is not None:
+            self.hooks.on_first_byte(url, payload, time.perf_counter() - started)
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self._record_request(url, started, error=True)
+            response.close()
+            raise
+
+        return response
+
+    def _hedged_get(self, url, payload):
+        """ Sends a GET request, and an identical one if the first doesn't answer within the hedge delay.
+        The first successful response wins. Both requests count against the quota.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the decoded JSON response.
+        :rtype: dict
+        :raises requests.exceptions.RequestException: if every request fails.
+        """
+        executor = self._get_hedge_executor()
+        # Requests run in copies of the caller's context, so they keep the deadline and timeouts of the call.
+        context = contextvars.copy_context()
+        sent = threading.Event()
+
+        def get():
+            sent.set()
+            return context.copy().run(self._get, url, payload)
+
+        futures = [executor.submit(get)]
+        # The hedge delay counts from when the first request is sent, not while it waits for a free thread.
+        if not sent.wait(self._remaining()):
+            futures[0].cancel()
+            raise FixerioTimeout("The hedged request wasn't sent before the deadline.")
+        started = time.monotonic()
+
+        done, _ = wait(futures, timeout=self._hedge_wait(self.hedge.delay()))
+        if not done:
+            # Raises once the deadline has passed, rather than hedge a request which can't be answered in time.
+            self._remaining()
+            if self.hedge.try_hedge():
+                futures.append(executor.submit(lambda: context.copy().run(self._get, url, payload)))
+
+        error = None
+        while futures:
+            done, pending = wait(futures, timeout=self._remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise FixerioTimeout("The hedged request didn't complete before the deadline.")
+            for future in done:
+                if future.exception() is None:
+                    # The slower request can't be cancelled once sent, its response is dropped.
+                    self.hedge.record(time.monotonic() - started)
+                    return future.result()
+                error = future.exception()
+            futures = list(pending)
+
+        raise error
+
+    def _hedge_wait(self, delay):
+        """ Gets the number of seconds to wait before hedging a request, at most until the call's deadline.
+
+        :param delay: the hedge delay.
+        :type delay: float
+        :return: the seconds to wait.
+        :rtype: float
+        :raises FixerioTimeout: if the deadline has passed.
+        """
+        remaining = self._remaining()
+
+        return delay if (remaining is None) else min(delay, remaining)
+
+    def _get_hedge_executor(self):
+        """ Gets the threads which send hedged requests, creating them on first use.
+
+        :return: the client's hedging executor.
+        :rtype: ThreadPoolExecutor
+        """
+        executor = self._hedge_executor
+        if executor is None:
+            with self._session_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(max_workers=self.pool_size)
+                executor = self._hedge_executor
+
+        return executor
+
+    @staticmethod
+    def _transient_error(ex, retry):
+        """ Checks whether a request error is transient, so the request may succeed if sent again.
+
+        :param ex: the error.
+        :type ex: requests.exceptions.RequestException
+        :param retry: the retry policy, which tells the transient HTTP statuses.
+        :type retry: RetryPolicy
+        :return: whether the error is transient, and the response's Retry-After header.
+        :rtype: tuple
+        """
+        if isinstance(ex, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True, None
+
+        response = ex.response if isinstance(ex, requests.exceptions.HTTPError) else None
+        if response is None:
+            return False, None
+
+        return retry.is_transient(response.status_code), response.headers.get('Retry-After')
+
+    def _check_retry_deadline(self, delay, ex):
+        """ Checks that a request can be retried before the call's deadline.
+
+        :param delay: the number of seconds to wait before retrying.
+        :type delay: float
+        :param ex: the error of the last attempt.
+        :type ex: Exception
+        :raises FixerioTimeout: if the retry would start after the deadline.
+        """
+        remaining = self._remaining()
+        if remaining is not None and delay >= remaining:
+            self._record_outcome(True)
+            raise FixerioTimeout(f"The call's deadline passes before the request can be retried: {ex}")
+
+    def _record_outcome(self, failed):
+        """ Tells the circuit breaker whether fixer.io answered a request.
+
+        :param failed: whether the request failed with a transient error.
+        :type failed: bool
+        """
+        if self.circuit_breaker is None:
+            return
+
+        if failed:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _typed(self, result_class, response):
+        """ Converts a response to a typed result if the client returns typed results.
+
+        :param result_class: the type of the result.
+        :type result_class: type
+        :param response: the response.
+        :type response: dict
+        :return: the result, or the response if the client returns dicts.
+        :rtype: dict or LatestRates or HistoricalRates or ConversionResult or FluctuationResult
+        :raises FixerioException: if the response is unsuccessful and the client returns typed results.
+        """
+        if not self.typed_results:
+            return response
+
+        return result_class.from_response(response)
 
     def _create_payload(self, **kwargs):
         """ Creates a payload with no None values.
@@ -28,6 +844,7 @@ class FixerioClient(object):
         :return: a payload.
         :rtype: dict
         """
+        started = time.perf_counter()
         payload = {'access_key': self.access_key}
 
         # Define a mapping for variable name translation as 'from' is a reserved keyword
@@ -49,6 +866,9 @@ class FixerioClient(object):
                 elif isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
                     payload[mapped_key] = ','.join(value)
 
+        if self.hooks is not None:
+            self.hooks.on_payload(payload, time.perf_counter() - started)
+
         return payload
 
     def _symbols(self):
@@ -58,18 +878,11 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        try:
-            payload = self._create_payload()
+        payload = self._create_payload()
 
-            url = f"{self.base_url}/symbols"
+        url = f"{self.base_url}/symbols"
 
-            response = requests.get(url, params=payload)
-
-            response.raise_for_status()
-
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+        return self._request(url, payload)
 
     def _latest(self, symbols=None, base=None):
         """ Gets the exchange rate data for the currencies you have requested.
@@ -82,21 +895,65 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        try:
-            symbols = symbols if (symbols is not None) else self.symbols
-            base = base if (base is not None) else self.base
+        url, payload = self._latest_request(symbols=symbols, base=base)
 
-            payload = self._create_payload(symbols=symbols, base=base)
+        return self._typed(LatestRates, self._request(url, payload, cache=self._rates_cache(self.latest_cache),
+                                                      batch=True, refresh=True))
 
-            url = f"{self.base_url}/latest"
+    def _latest_request(self, symbols=None, base=None):
+        """ Creates a latest rates request.
 
-            response = requests.get(url, params=payload)
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the endpoint URL and the query parameters.
+        :rtype: tuple
+        """
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
 
-            response.raise_for_status()
+        payload = self._create_payload(symbols=symbols, base=base)
 
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+        url = f"{self.base_url}/latest"
+
+        return url, payload
+
+    def _watch_latest(self, symbols=None, base=None):
+        """ Refreshes latest rates in the background from now on, and gets them.
+
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate data for the currencies you have requested.
+        :rtype: dict
+        :raises ValueError: if the client doesn't refresh latest rates.
+        :raises FixerioException: if any error making a request.
+        """
+        if self.refresher is None:
+            raise ValueError("Watching latest rates needs a client created with refresh_latest.")
+
+        url, payload = self._latest_request(symbols=symbols, base=base)
+        cache = self._rates_cache(self.latest_cache)
+        self.refresher.watch(payload_key(url, cache.fetch_payload(url, payload)), url, payload)
+        self._start_refresher()
+
+        return self._typed(LatestRates, self._request(url, payload, cache=cache, batch=True, refresh=True))
+
+    def _unwatch_latest(self, symbols=None, base=None):
+        """ Stops refreshing latest rates in the background. They're kept in the cache until they expire.
+
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        """
+        if self.refresher is None:
+            return
+
+        url, payload = self._latest_request(symbols=symbols, base=base)
+        self.refresher.unwatch(payload_key(url, self._rates_cache(self.latest_cache).fetch_payload(url, payload)))
 
     def _historical_rates(self, date, symbols=None, base=None):
         """ Gets historical rates for any day since `date`.
@@ -112,26 +969,70 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        try:
-            if isinstance(date, datetime.date):
-                # Convert date to ISO 8601 format.
-                date = date.isoformat()
+        if isinstance(date, datetime.date):
+            # Convert date to ISO 8601 format.
+            date = date.isoformat()
 
-            symbols = symbols if (symbols is not None) else self.symbols
-            base = base if (base is not None) else self.base
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
 
-            symbols = symbols or self.symbols
-            payload = self._create_payload(symbols=symbols, base=base)
+        symbols = symbols or self.symbols
+        payload = self._create_payload(symbols=symbols, base=base)
 
-            url = f"{self.base_url}/{date}"
+        url = f"{self.base_url}/{date}"
 
-            response = requests.get(url, params=payload)
+        return self._typed(HistoricalRates, self._request(url, payload,
+                                                          cache=self._rates_cache(self.historical_store), batch=True))
 
-            response.raise_for_status()
+    def _historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates, requesting the dates missing from the cache concurrently on up to
+        `max_workers` threads.
 
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the historical exchange rate data of each date, by date in YYYY-MM-DD format, in the order of the
+            dates.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        dates = self._unique_dates(dates)
+
+        return dict(zip(dates, self._map_concurrently(
+            lambda date: self._historical_rates(date, symbols=symbols, base=base), dates
+        )))
+
+    def _iter_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates, requesting the dates missing from the cache concurrently on up to
+        `max_workers` threads, and yields the rates of each date as soon as they arrive.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the date, in YYYY-MM-DD format, and its historical exchange rate data, in order of completion.
+        :rtype: generator of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._iter_concurrently(lambda date: self._historical_rates(date, symbols=symbols, base=base),
+                                       self._unique_dates(dates))
+
+    def _unique_dates(self, dates):
+        """ Converts dates to ISO 8601 format and drops repeated dates.
+
+        :param dates: the dates.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :return: each date once, in the order of their first occurrence.
+        :rtype: list
+        """
+        return list(dict.fromkeys(self._conversion_dates(list(dates))))
 
     def _convert(self, from_ccy, to_ccy, amount, date=None):
         """ Converts an amount from one currency to another
@@ -148,22 +1049,105 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        try:
-            if isinstance(date, datetime.date):
-                # Convert date to ISO 8601 format.
-                date = date.isoformat()
+        if isinstance(date, datetime.date):
+            # Convert date to ISO 8601 format.
+            date = date.isoformat()
 
-            payload = self._create_payload(from_ccy=from_ccy, to_ccy=to_ccy, amount=amount, date=date)
+        if self.local_conversion:
+            return self._typed(ConversionResult, self._local_convert(from_ccy, to_ccy, amount, date=date))
 
-            url = f"{self.base_url}/convert"
+        payload = self._create_payload(from_ccy=from_ccy, to_ccy=to_ccy, amount=amount, date=date)
 
-            response = requests.get(url, params=payload)
+        url = f"{self.base_url}/convert"
 
-            response.raise_for_status()
+        return self._typed(ConversionResult, self._request(url, payload))
 
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+    def _all_rates(self, date=None):
+        """ Gets the latest or historical rates of all currencies for the default base currency.
+
+        :param date: a date in the past for historical rates, or None for the latest rates.
+        :type date: str (in YYYY-MM-DD format)
+        :return: the exchange rate data for all currencies.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        payload = self._create_payload()
+
+        if date is None:
+            return self._request(f"{self.base_url}/latest", payload, cache=self._rates_cache(self.latest_cache),
+                                 batch=True)
+
+        return self._request(f"{self.base_url}/{date}", payload, cache=self._rates_cache(self.historical_store),
+                             batch=True)
+
+    def _local_convert(self, from_ccy, to_ccy, amount, date=None):
+        """ Converts an amount from one currency to another with the rates of all currencies.
+
+        :param from_ccy: the three-letter currency code of the currency you would like to convert from.
+        :type from_ccy: str
+        :param to_ccy: the three-letter currency code of the currency you would like to convert to.
+        :type to_ccy: str
+        :param amount: the amount to be converted.
+        :type amount: int or float
+        :param date: specify a date to use historical rates for this conversion.
+        :type date: str (in YYYY-MM-DD format)
+        :return: your conversion result.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return convert(self._all_rates(date), from_ccy, to_ccy, amount, date=date)
+
+    def _convert_many(self, from_ccys, to_ccys, amounts, dates=None):
+        """ Converts many amounts locally at once, requesting the rates of all currencies once per date.
+
+        :param from_ccys: the three-letter currency codes of the currencies to convert from.
+        :type from_ccys: list or tuple or numpy.ndarray
+        :param to_ccys: the three-letter currency codes of the currencies to convert to.
+        :type to_ccys: list or tuple or numpy.ndarray
+        :param amounts: the amounts to be converted.
+        :type amounts: list or tuple or numpy.ndarray
+        :param dates: the date of each conversion, None for the latest rates.
+        :type dates: list or tuple or numpy.ndarray
+        :return: the converted amounts, NaN where a currency is unknown.
+        :rtype: numpy.ndarray
+        :raises FixerioException: if any error making a request.
+        """
+        dates = self._conversion_dates(dates)
+
+        responses = {date: self._all_rates(date) for date in (set(dates) if dates is not None else [None])}
+
+        return convert_many(self._check_rates(responses), from_ccys, to_ccys, amounts, dates=dates)
+
+    @staticmethod
+    def _conversion_dates(dates):
+        """ Converts the dates of conversions to ISO 8601 format.
+
+        :param dates: dates or None for the latest rates.
+        :type dates: list or tuple or numpy.ndarray
+        :return: the dates in YYYY-MM-DD format, or None if there aren't any.
+        :rtype: list
+        """
+        if dates is None:
+            return None
+
+        return [date.isoformat() if isinstance(date, datetime.date) else date for date in dates]
+
+    @staticmethod
+    def _check_rates(responses):
+        """ Checks rates responses are successful.
+
+        :param responses: rates responses by date.
+        :type responses: dict
+        :return: the responses.
+        :rtype: dict
+        :raises FixerioException: if any response is unsuccessful.
+        """
+        for response in responses.values():
+            if not isinstance(response, dict) or not response.get('success'):
+                error = response.get('error') if isinstance(response, dict) else response
+                raise FixerioException(f"Rates request failed: {error}")
+
+        return responses
 
     def _time_series(self, start_date, end_date, symbols=None, base=None):
         """ Gets daily historical rates between two dates of your choice, with a maximum time frame of 365 days.
@@ -180,32 +1164,365 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
+        return self._request(*self._time_series_request(start_date, end_date, symbols=symbols, base=base))
+
+    def _time_series_request(self, start_date, end_date, symbols=None, base=None):
+        """ Creates the request for daily historical rates between two dates.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the endpoint URL and the query parameters.
+        :rtype: tuple
+        """
+        if isinstance(start_date, datetime.date):
+            # Convert date to ISO 8601 format.
+            start_date = start_date.isoformat()
+
+        if isinstance(end_date, datetime.date):
+            # Convert date to ISO 8601 format.
+            end_date = end_date.isoformat()
+
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
+
+        payload = self._create_payload(start_date=start_date, end_date=end_date, symbols=symbols, base=base)
+
+        return f"{self.base_url}/timeseries", payload
+
+    def _stream_rows(self, url, payload, parser):
+        """ Sends a GET request for a time series and parses the response body as it arrives.
+        The request is neither cached nor shared with identical requests in flight.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param parser: the parser of the response, which keeps the fields other than the rates.
+        :type parser: TimeSeriesParser
+        :return: the `(date, rates)` rows of the response.
+        :rtype: generator
+        :raises FixerioException: if any error making a request, or if the request is unsuccessful.
+        :raises FixerioTimeout: if the request times out or runs past its deadline.
+        """
+        # The latency of a streamed request lasts until its whole body has been read.
+        started = time.perf_counter()
         try:
-            if isinstance(start_date, datetime.date):
-                # Convert date to ISO 8601 format.
-                start_date = start_date.isoformat()
+            with self._call_deadline():
+                response = self._fetch(url, payload, stream=True)
+        except FixerioException as ex:
+            self._complete_stream(url, payload, started, error=ex)
+            raise
 
-            if isinstance(end_date, datetime.date):
-                # Convert date to ISO 8601 format.
-                end_date = end_date.isoformat()
+        size = 0
+        decode_seconds = 0.0
+        with contextlib.closing(response):
+            try:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    size += len(chunk)
+                    decode_started = time.perf_counter()
+                    rows = parser.feed(chunk)
+                    decode_seconds += time.perf_counter() - decode_started
+                    yield from rows
+                parser.close()
+            except (requests.exceptions.RequestException, FixerioException) as ex:
+                self._record_request(url, started, size=size, decode_seconds=decode_seconds, error=True)
+                if isinstance(ex, requests.exceptions.Timeout):
+                    error = FixerioTimeout(str(ex))
+                elif isinstance(ex, requests.exceptions.RequestException):
+                    error = FixerioException(str(ex))
+                else:
+                    error = ex
+                self._complete_stream(url, payload, started, size=size, decode_seconds=decode_seconds, error=error)
+                raise error
 
-            symbols = symbols if (symbols is not None) else self.symbols
-            base = base if (base is not None) else self.base
+        self._record_request(url, started, size=size, decode_seconds=decode_seconds)
+        self._complete_stream(url, payload, started, size=size, decode_seconds=decode_seconds)
 
-            payload = self._create_payload(start_date=start_date, end_date=end_date, symbols=symbols, base=base)
+    def _complete_stream(self, url, payload, started, size=0, decode_seconds=0.0, error=None):
+        """ Calls the client's decode and completion hooks, if it has any, for a streamed request, whose body
+        is decoded as it arrives.
 
-            url = f"{self.base_url}/timeseries"
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param started: the `time.perf_counter()` when the call started.
+        :type started: float
+        :param size: the number of bytes of the response body read.
+        :type size: int
+        :param decode_seconds: the number of seconds spent parsing the response body.
+        :type decode_seconds: float
+        :param error: the exception the call failed with, None if it succeeded.
+        :type error: FixerioException
+        """
+        if self.hooks is None:
+            return
 
-            response = requests.get(url, params=payload)
+        if size:
+            self.hooks.on_decode(url, payload, size, decode_seconds)
+        self.hooks.on_complete(url, payload, time.perf_counter() - started, error)
 
-            response.raise_for_status()
+    def _iter_time_series(self, start_date, end_date, symbols=None, base=None):
+        """ Streams daily historical rates between two dates of your choice. Time frames longer than 365 days
+        are split into windows, which are requested one after another.
 
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the `(date, rates)` rows of the time series, in date order.
+        :rtype: generator
+        :raises FixerioException: if any error making a request, or if a request is unsuccessful.
+        """
+        for window_start, window_end in split_date_range(start_date, end_date):
+            url, payload = self._time_series_request(window_start, window_end, symbols=symbols, base=base)
+            yield from self._stream_rows(url, payload, TimeSeriesParser())
 
-    def _fluctuation(self, start_date, end_date, symbols=None, base=None):
-        """ Gets the starting and ending rates with absolute and percentage changes over the fluctuation timeframe.
+    def _stream_matrix(self, start_date, end_date, symbols=None, base=None):
+        """ Streams daily historical rates between two dates, at most 365 days apart, into a matrix.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the rates of the time series.
+        :rtype: RateMatrix
+        :raises FixerioException: if any error making a request, or if the request is unsuccessful.
+        """
+        url, payload = self._time_series_request(start_date, end_date, symbols=symbols, base=base)
+        parser = TimeSeriesParser()
+        builder = RateMatrixBuilder()
+        for date, rates in self._stream_rows(url, payload, parser):
+            builder.append(date, rates)
+
+        return builder.build(base=parser.fields.get('base'))
+
+    def _windowed_time_series(self, start_date, end_date, symbols=None, base=None, as_matrix=False, stream=False):
+        """ Gets daily historical rates between two dates of your choice. Time frames longer than 365 days are
+        split into windows, which are requested concurrently by up to `max_workers` threads and merged.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :param as_matrix: return the rates as a :class:`RateMatrix` instead of a response dict.
+        :type as_matrix: bool
+        :param stream: parse each response into the matrix as it arrives, without building nested dicts.
+        :type stream: bool
+        :return: the time series of exchange rates for the currencies you have requested.
+        :rtype: dict or RateMatrix
+        :raises FixerioException: if any error making a request.
+        :raises ValueError: if streaming without `as_matrix`.
+        """
+        windows = split_date_range(start_date, end_date)
+        if stream:
+            if not as_matrix:
+                raise ValueError("Streaming time series requires as_matrix=True, or use iter_time_series.")
+            return RateMatrix.concatenate(self._map_concurrently(
+                lambda window: self._stream_matrix(window[0], window[1], symbols=symbols, base=base), windows
+            ))
+
+        if len(windows) <= 1:
+            response = self._time_series(start_date, end_date, symbols=symbols, base=base)
+        else:
+            response = merge_time_series(self._map_concurrently(
+                lambda window: self._time_series(window[0], window[1], symbols=symbols, base=base), windows
+            ))
+
+        return RateMatrix.from_time_series(response) if as_matrix else response
+
+    def _map_concurrently(self, function, items):
+        """ Calls a function with each item on up to `max_workers` threads.
+
+        :param function: the function to call.
+        :type function: callable
+        :param items: the items to call the function with.
+        :type items: iterable
+        :return: the results, in the order of the items.
+        :rtype: list
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        # Calls run in copies of the caller's context, so they keep the deadline of the call.
+        context = contextvars.copy_context()
+        if getattr(self._workers, 'active', False):
+            # A call made from a worker, e.g. by a hook, would wait for the workers it's holding.
+            return [context.copy().run(function, item) for item in items]
+
+        return list(self._get_executor().map(lambda item: context.copy().run(function, item), items))
+
+    def _iter_concurrently(self, function, items):
+        """ Calls a function with each item on up to `max_workers` threads, and yields the results as they are
+        returned. Calls which haven't started are cancelled if the generator is closed early.
+
+        :param function: the function to call.
+        :type function: callable
+        :param items: the items to call the function with.
+        :type items: iterable
+        :return: each item and its result, in order of completion.
+        :rtype: generator of tuple
+        """
+        items = list(items)
+        if not items:
+            return
+
+        # Calls run in copies of the caller's context, so they keep the deadline of the call.
+        context = contextvars.copy_context()
+        if getattr(self._workers, 'active', False):
+            for item in items:
+                yield item, context.copy().run(function, item)
+            return
+
+        executor = self._get_executor()
+        futures = {executor.submit(lambda item: context.copy().run(function, item), item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_executor(self):
+        """ Gets the `max_workers` threads which make concurrent calls, creating them on first use. The threads
+        are kept until the client is closed, so their connections to the historical rates store are reused.
+
+        :return: the client's executor.
+        :rtype: ThreadPoolExecutor
+        """
+        executor = self._executor
+        if executor is None:
+            with self._session_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, initializer=self._start_worker)
+                executor = self._executor
+
+        return executor
+
+    def _start_worker(self):
+        """ Marks a thread of the client's executor, so calls it makes run on it rather than queue behind it. """
+        self._workers.active = True
+
+    def _backfill_requests(self, start_date, end_date, base=None, time_series=False):
+        """ Finds the dates between two dates missing from the historical rates store, and the requests for them.
+
+        :param start_date: the first date to have rates for.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date to have rates for. Dates from today on are skipped.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param time_series: request missing dates from the time series endpoint, instead of one by one.
+        :type time_series: bool
+        :return: the missing date ranges, and the URL, payload and cache of each request.
+        :rtype: tuple
+        """
+        if self.historical_store is None:
+            raise ValueError("Synchronising historical rates requires a historical_store.")
+
+        # The store only keeps EUR rates in rebase mode.
+        base = None if self.rebase else base
+        yesterday = datetime.datetime.now(datetime.timezone.utc).date() - datetime.timedelta(days=1)
+
+        ranges = missing_ranges(start_date, min(to_date(end_date), yesterday),
+                                self.historical_store.dates(base or DEFAULT_BASE))
+        payload = self._create_payload(base=base)
+
+        if time_series:
+            pending = [
+                (f"{self.base_url}/timeseries",
+                 dict(payload, start_date=window_start.isoformat(), end_date=window_end.isoformat()), None)
+                for range_start, range_end in ranges
+                for window_start, window_end in split_date_range(range_start, range_end)
+            ]
+        else:
+            pending = [
+                (f"{self.base_url}/{(range_start + datetime.timedelta(days=day)).isoformat()}", payload,
+                 self.historical_store)
+                for range_start, range_end in ranges
+                for day in range((range_end - range_start).days + 1)
+            ]
+
+        return ranges, pending
+
+    def _save_backfill(self, responses):
+        """ Stores the rates of time series responses. Historical rates responses are stored when requested.
+
+        :param responses: the responses to the backfill requests.
+        :type responses: list of dict
+        :raises FixerioException: if any response is unsuccessful.
+        """
+        for response in responses:
+            if not isinstance(response, dict) or not response.get('success'):
+                error = response.get('error') if isinstance(response, dict) else response
+                raise FixerioException(f"Historical rates request failed: {error}")
+
+            if response.get('timeseries'):
+                self.historical_store.put_time_series(response)
+
+    def _backfill(self, start_date, end_date, base=None, time_series=False):
+        """ Requests the rates of all currencies for the dates between two dates which are missing from the
+        historical rates store, so synchronising a range only costs requests for the new dates.
+
+        :param start_date: the first date to have rates for.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date to have rates for. Dates from today on are skipped.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param time_series: request missing dates from the time series endpoint, instead of one by one.
+        :type time_series: bool
+        :return: the first and last date of each range which was missing.
+        :rtype: list of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        ranges, pending = self._backfill_requests(start_date, end_date, base=base, time_series=time_series)
+
+        self._save_backfill(self._map_concurrently(lambda request: self._request(*request), pending))
+
+        return ranges
+
+    def _local_fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Computes the starting and ending rates with absolute and percentage changes over the fluctuation
+        timeframe locally.
+
+        :param start_date: the start date of your preferred fluctuation timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred fluctuation timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate and fluctuation data for the currencies you have requested.
+        :rtype: dict or FluctuationResult
+        :raises FixerioException: if any error making a request.
+        """
+        return self._typed(FluctuationResult, self._computed_fluctuation(start_date, end_date, symbols=symbols,
+                                                                         base=base))
+
+    def _computed_fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Computes the starting and ending rates with absolute and percentage changes over the fluctuation
+        timeframe from the rates of all currencies on both dates, read through the latest cache or historical store.
 
         :param start_date: the start date of your preferred fluctuation timeframe.
         :type start_date: date or str (in YYYY-MM-DD format)
@@ -219,26 +1536,41 @@ class FixerioClient(object):
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        try:
-            if isinstance(start_date, datetime.date):
-                # Convert date to ISO 8601 format.
-                start_date = start_date.isoformat()
+        start_date, end_date = self._conversion_dates([start_date, end_date])
 
-            if isinstance(end_date, datetime.date):
-                # Convert date to ISO 8601 format.
-                end_date = end_date.isoformat()
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
 
-            symbols = symbols if (symbols is not None) else self.symbols
-            base = base if (base is not None) else self.base
+        return fluctuation(self._all_rates(start_date), self._all_rates(end_date), symbols=symbols, base=base)
 
-            payload = self._create_payload(start_date=start_date, end_date=end_date, symbols=symbols, base=base)
+    def _fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Gets the starting and ending rates with absolute and percentage changes over the fluctuation timeframe.
 
-            url = f"{self.base_url}/fluctuation"
+        :param start_date: the start date of your preferred fluctuation timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred fluctuation timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate and fluctuation data for the currencies you have requested.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        if isinstance(start_date, datetime.date):
+            # Convert date to ISO 8601 format.
+            start_date = start_date.isoformat()
 
-            response = requests.get(url, params=payload)
+        if isinstance(end_date, datetime.date):
+            # Convert date to ISO 8601 format.
+            end_date = end_date.isoformat()
 
-            response.raise_for_status()
+        symbols = symbols if (symbols is not None) else self.symbols
+        base = base if (base is not None) else self.base
 
-            return response.json()
-        except requests.exceptions.RequestException as ex:
-            raise FixerioException(str(ex))
+        payload = self._create_payload(start_date=start_date, end_date=end_date, symbols=symbols, base=base)
+
+        url = f"{self.base_url}/fluctuation"
+
+        return self._typed(FluctuationResult, self._request(url, payload))
@@ -0,0 +1,119 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .rebase import rebase
+
+
+def fluctuation(start_response, end_response, symbols=None, base=None):
+    """ Computes the fluctuation of rates between two latest or historical rates responses.
+
+    :param start_response: the rates at the start of the timeframe.
+    :type start_response: dict
+    :param end_response: the rates at the end of the timeframe.
+    :type end_response: dict
+    :param symbols: comma-separated currency codes to limit output currencies.
+    :type symbols: str or list or tuple
+    :param base: the three-letter currency code of the base currency, which defaults to the responses' base.
+    :type base: str
+    :return: the fluctuation, in the shape of a fixer.io fluctuation response.
+    :rtype: dict
+    """
+    start_response = rebase(start_response, base=base, symbols=symbols)
+    end_response = rebase(end_response, base=base, symbols=symbols)
+
+    for response in (start_response, end_response):
+        if not isinstance(response, dict) or not response.get('success'):
+            return response
+
+    end_rates = end_response['rates']
+    rates = {}
+    for symbol, start_rate in start_response['rates'].items():
+        end_rate = end_rates.get(symbol)
+        if end_rate is None:
+            continue
+
+        change = end_rate - start_rate
+        rates[symbol] = {
+            "start_rate": start_rate,
+            "end_rate": end_rate,
+            "change": change,
+            "change_pct": change / start_rate * 100 if start_rate else None
+        }
+
+    return {
+        "success": True,
+        "fluctuation": True,
+        "start_date": start_response.get('date'),
+        "end_date": end_response.get('date'),
+        "base": start_response.get('base'),
+        "rates": rates
+    }
+
+
+def fluctuation_arrays(matrix, windows):
+    """ Computes the fluctuation of all currencies over many timeframes in one vectorized pass.
+    A date without rates uses the rates of the closest earlier date.
+
+    :param matrix: the time series rates.
+    :type matrix: RateMatrix
+    :param windows: the start and end date of each timeframe.
+    :type windows: list of tuple
+    :return: the start rates, end rates, changes and percentage changes, each with a row for each timeframe
+        and a column for each of the matrix's currencies.
+    :rtype: tuple of numpy.ndarray
+    :raises KeyError: if a timeframe starts before the first date of the matrix.
+    """
+    if np is None:
+        raise ImportError("Computing fluctuations requires numpy: pip install fixerio-client[numpy]")
+
+    start_dates, end_dates = zip(*windows) if windows else ((), ())
+
+    def rows(dates):
+        indices = np.searchsorted(matrix.dates, np.array(dates, dtype='datetime64[D]'), side='right') - 1
+        if (indices < 0).any():
+            raise KeyError("A timeframe starts before the first date of the rates.")
+        return indices
+
+    start_rates = matrix.values[rows(start_dates)]
+    end_rates = matrix.values[rows(end_dates)]
+    change = end_rates - start_rates
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_pct = change / start_rates * 100
+
+    return start_rates, end_rates, change, change_pct
+
+
+def fluctuation_responses(matrix, windows):
+    """ Computes the fluctuation of all currencies over many timeframes in one vectorized pass.
+
+    :param matrix: the time series rates.
+    :type matrix: RateMatrix
+    :param windows: the start and end date of each timeframe.
+    :type windows: list of tuple
+    :return: the fluctuation over each timeframe, in the shape of fixer.io fluctuation responses.
+    :rtype: list of dict
+    """
+    start_rates, end_rates, change, change_pct = fluctuation_arrays(matrix, windows)
+    symbols = matrix.symbols.tolist()
+
+    responses = []
+    for index, (start_date, end_date) in enumerate(windows):
+        rates = {}
+        for symbol, values in zip(symbols, zip(start_rates[index].tolist(), end_rates[index].tolist(),
+                                               change[index].tolist(), change_pct[index].tolist())):
+            if values[0] == values[0] and values[1] == values[1]:
+                rates[symbol] = dict(zip(("start_rate", "end_rate", "change", "change_pct"), values))
+
+        responses.append({
+            "success": True,
+            "fluctuation": True,
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+            "base": matrix.base,
+            "rates": rates
+        })
+
+    return responses
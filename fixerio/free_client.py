@@ -3,15 +3,22 @@ from .url import BASE_HTTP_URL
 
 class FreeClient(FixerioClient):
     """ A client for the Fixer.io Free Plan. """
+    # The latest rates are updated hourly on the Free Plan.
+    refresh_interval = 3600
+    # The number of requests per month on the Free Plan.
+    monthly_quota = 100
+    # The plan's label in metrics.
+    tier = "free"
 
-    def __init__(self, access_key, symbols=None):
+    def __init__(self, access_key, symbols=None, **kwargs):
         """
         :param access_key: your API Key.
         :type access_key: str or unicode
         :param symbols: currency symbols to request specific exchange rates.
         :type symbols: list or tuple
+        :param kwargs: keyword arguments for the underlying :class:`FixerioClient`, e.g. `pool_size`.
         """
-        super().__init__(access_key)
+        super().__init__(access_key, **kwargs)
         self.base_url = BASE_HTTP_URL
         self.symbols = symbols
 
@@ -24,18 +31,21 @@ class FreeClient(FixerioClient):
         """
         return self._symbols()
 
-    def get_latest(self, symbols=None):
+    def get_latest(self, symbols=None, base=None):
         """ Gets the exchange rate data for the currencies you have requested.
 
         :param symbols: a list of comma-separated currency codes to limit output currencies.
         :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency. Only EUR is available on the
+            Free Plan, unless the client was created with `rebase=True`.
+        :type base: str
         :return: the exchange rate data for the currencies you have requested.
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        return self._latest(symbols=symbols)
+        return self._latest(symbols=symbols, base=base)
 
-    def get_historical_rates(self, date, symbols=None):
+    def get_historical_rates(self, date, symbols=None, base=None):
         """ Gets historical rates for any day since `date`.
         Historical rates are available for most currencies all the way back to the year of 1999.
 
@@ -43,8 +53,81 @@ class FreeClient(FixerioClient):
         :type date: date or str (in YYYY-MM-DD format)
         :param symbols: a list of currency codes to limit output currencies.
         :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency. Only EUR is available on the
+            Free Plan, unless the client was created with `rebase=True`.
+        :type base: str
         :return: the historical exchange rate data for the currencies you have requested.
         :rtype: dict
         :raises FixerioException: if any error making a request.
         """
-        return self._historical_rates(date, symbols=symbols)
+        return self._historical_rates(date, symbols=symbols, base=base)
+
+    def get_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates at once. Dates missing from the cache are requested concurrently,
+        up to `max_workers` at a time, so a history takes about as long as its slowest requests.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency. Only EUR is available on the
+            Free Plan, unless the client was created with `rebase=True`.
+        :type base: str
+        :return: the historical exchange rate data of each date, by date in YYYY-MM-DD format.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return self._historical_rates_many(dates, symbols=symbols, base=base)
+
+    def iter_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates at once, as :meth:`get_historical_rates_many`, but yields the rates
+        of each date as soon as they arrive.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency. Only EUR is available on the
+            Free Plan, unless the client was created with `rebase=True`.
+        :type base: str
+        :return: the date, in YYYY-MM-DD format, and its historical exchange rate data, in order of completion.
+        :rtype: generator of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._iter_historical_rates_many(dates, symbols=symbols, base=base)
+
+    def compute_fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Computes the starting and ending rates with absolute and percentage changes over the fluctuation
+        timeframe locally, from the historical rates of all currencies on both dates. With a `historical_store`,
+        the rates of each date are only requested once.
+
+        :param start_date: the start date of your preferred fluctuation timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred fluctuation timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate and fluctuation data for the currencies you have requested.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return self._local_fluctuation(start_date, end_date, symbols=symbols, base=base)
+
+    def sync_historical_rates(self, start_date, end_date):
+        """ Downloads the rates of all currencies for the dates between two dates which are missing from the
+        client's `historical_store`, so keeping a history up to date only costs requests for the new dates.
+        Missing dates are requested one by one, up to `max_workers` at a time.
+
+        :param start_date: the first date to have rates for.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date to have rates for. Dates from today on are skipped, as their rates can change.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :return: the first and last date of each range which was missing.
+        :rtype: list of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._backfill(start_date, end_date)
@@ -0,0 +1,86 @@
+import threading
+from collections import deque
+
+
+class HedgePolicy(object):
+    """ Decides when to send a second, identical request while the first is slow to answer.
+
+    The hedge delay is a percentile of the latencies of recent requests, so only the slowest requests are
+    hedged. A budget limits hedges to a fraction of requests: each request earns `budget` of a hedge, and each
+    hedge spends one, so hedging can't multiply the requests sent while fixer.io is slow for everyone.
+    """
+
+    def __init__(self, percentile=95, initial_delay=1.0, min_delay=0.05, max_delay=5.0, budget=0.05,
+                 max_burst=10, window=200, min_samples=20):
+        """
+        :param percentile: the percentile of recent latencies to wait for before hedging.
+        :type percentile: float
+        :param initial_delay: the number of seconds to wait before hedging until there are `min_samples`
+            latencies.
+        :type initial_delay: float
+        :param min_delay: the minimum number of seconds to wait before hedging.
+        :type min_delay: float
+        :param max_delay: the maximum number of seconds to wait before hedging.
+        :type max_delay: float
+        :param budget: the fraction of requests which can be hedged.
+        :type budget: float
+        :param max_burst: the maximum number of hedges the budget can save up.
+        :type max_burst: int
+        :param window: the number of recent latencies to keep.
+        :type window: int
+        :param min_samples: the number of latencies needed to derive the delay from them.
+        :type min_samples: int
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_burst = max_burst
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+
+    def delay(self):
+        """ Gets the number of seconds to wait for a response before hedging the request.
+
+        :return: the percentile of recent latencies, within `min_delay` and `max_delay`.
+        :rtype: float
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+
+        return min(self.max_delay, max(self.min_delay, latencies[index]))
+
+    def record(self, latency):
+        """ Records the latency of a request, which earns a share of a hedge.
+
+        :param latency: the number of seconds the request took to answer.
+        :type latency: float
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._tokens = min(float(self.max_burst), self._tokens + self.budget)
+            self.requests += 1
+
+    def try_hedge(self):
+        """ Spends a hedge from the budget.
+
+        :return: whether the budget allows another request.
+        :rtype: bool
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            self.hedges += 1
+            return True
@@ -0,0 +1,134 @@
+class RequestHooks(object):
+    """ Callbacks on the stages of a client's calls, with the time each stage took, for tracing and profiling.
+
+    Subclass it and override the stages you need, every stage does nothing by default. A call builds its payload,
+    looks its response up in the cache if the endpoint has one, and completes. A call which isn't answered from
+    the cache sends one or more requests, each sent, receiving its first byte and being decoded. Requests are
+    retried, hedged, coalesced and batched, so a call may complete on a response it didn't send.
+
+    Hooks run on the thread or event loop of the stage, hedged requests and concurrent calls on worker threads,
+    so they should be quick and thread safe. Exceptions raised by a hook propagate to the caller, or fail a
+    background refresh of latest rates, which is retried.
+    """
+
+    def on_payload(self, payload, seconds):
+        """ Called when the payload of a call has been built.
+
+        :param payload: the query parameters.
+        :type payload: dict
+        :param seconds: the time spent building the payload.
+        :type seconds: float
+        """
+
+    def on_cache_lookup(self, url, payload, hit, seconds):
+        """ Called when a call has looked its response up in the cache.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param hit: whether the response was cached.
+        :type hit: bool
+        :param seconds: the time spent looking the response up.
+        :type seconds: float
+        """
+
+    def on_send(self, url, payload):
+        """ Called just before a request is sent to fixer.io, once the quota allows it.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        """
+
+    def on_first_byte(self, url, payload, seconds):
+        """ Called when the response headers of a request have been received.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :param seconds: the time from sending the request to receiving the response headers, which includes
+            connecting to fixer.io and its processing time.
+        :type seconds: float
+        """
+
+    def on_decode(self, url, payload, size, seconds):
+        """ Called when the response body of a request has been decoded.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :param size: the number of bytes of the response body.
+        :type size: int
+        :param seconds: the time spent decoding the response body.
+        :type seconds: float
+        """
+
+    def on_complete(self, url, payload, seconds, error=None):
+        """ Called when a call has its response, or has failed.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param seconds: the time spent getting the response, from the cache or fixer.io.
+        :type seconds: float
+        :param error: the exception the call failed with, None if it succeeded.
+        :type error: Exception
+        """
+
+
+class HookChain(RequestHooks):
+    """ Calls many hooks in order. """
+
+    def __init__(self, hooks):
+        """
+        :param hooks: the hooks.
+        :type hooks: iterable of RequestHooks
+        """
+        self.hooks = tuple(hooks)
+
+    def on_payload(self, payload, seconds):
+        for hooks in self.hooks:
+            hooks.on_payload(payload, seconds)
+
+    def on_cache_lookup(self, url, payload, hit, seconds):
+        for hooks in self.hooks:
+            hooks.on_cache_lookup(url, payload, hit, seconds)
+
+    def on_send(self, url, payload):
+        for hooks in self.hooks:
+            hooks.on_send(url, payload)
+
+    def on_first_byte(self, url, payload, seconds):
+        for hooks in self.hooks:
+            hooks.on_first_byte(url, payload, seconds)
+
+    def on_decode(self, url, payload, size, seconds):
+        for hooks in self.hooks:
+            hooks.on_decode(url, payload, size, seconds)
+
+    def on_complete(self, url, payload, seconds, error=None):
+        for hooks in self.hooks:
+            hooks.on_complete(url, payload, seconds, error)
+
+
+def chain_hooks(hooks):
+    """ Gets the hooks of a client.
+
+    :param hooks: hooks, or a list of hooks to call in order.
+    :type hooks: RequestHooks or list
+    :return: the hooks, None if there are none.
+    :rtype: RequestHooks
+    """
+    if hooks is None or isinstance(hooks, RequestHooks):
+        return hooks
+
+    hooks = tuple(hooks)
+    if not hooks:
+        return None
+
+    return hooks[0] if len(hooks) == 1 else HookChain(hooks)
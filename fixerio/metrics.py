@@ -0,0 +1,230 @@
+import bisect
+import threading
+
+# Upper bounds of the request latency buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Endpoints named by the last part of their URL; any other URL is a date of historical rates.
+_NAMED_ENDPOINTS = frozenset(("symbols", "latest", "convert", "timeseries", "fluctuation"))
+
+
+def endpoint_name(url):
+    """ Gets the name of the endpoint of a URL.
+
+    :param url: the endpoint URL.
+    :type url: str
+    :return: `symbols`, `latest`, `historical`, `convert`, `timeseries` or `fluctuation`.
+    :rtype: str
+    """
+    name = url.rstrip("/").rsplit("/", 1)[-1]
+
+    return name if name in _NAMED_ENDPOINTS else "historical"
+
+
+class Histogram(object):
+    """ Counts observed values in cumulative buckets, as a Prometheus histogram. """
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: the upper bounds of the buckets, in ascending order.
+        :type buckets: tuple
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """ Adds a value.
+
+        :param value: the value.
+        :type value: float
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """ Gets the number of values up to each bucket's upper bound.
+
+        :return: the upper bound and cumulative count of each bucket, ending with infinity.
+        :rtype: list of tuple
+        """
+        counts = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            counts.append((bound, total))
+        counts.append((float("inf"), self.count))
+
+        return counts
+
+
+class EndpointMetrics(object):
+    """ The metrics of one endpoint of one client tier. """
+    __slots__ = ('requests', 'errors', 'latency', 'response_bytes', 'decode_seconds', 'cache_hits', 'cache_misses')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: the upper bounds of the latency buckets, in seconds.
+        :type buckets: tuple
+        """
+        self.requests = 0
+        self.errors = 0
+        self.latency = Histogram(buckets)
+        self.response_bytes = 0
+        self.decode_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def as_dict(self):
+        """ Gets the metrics as a plain dict.
+
+        :return: the counters, the latency histogram and the cache hit rate, None before any cache lookup.
+        :rtype: dict
+        """
+        lookups = self.cache_hits + self.cache_misses
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency": {"buckets": dict(self.latency.cumulative_counts()), "sum": self.latency.sum,
+                        "count": self.latency.count},
+            "response_bytes": self.response_bytes,
+            "decode_seconds": self.decode_seconds,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / lookups if lookups else None,
+        }
+
+
+class MetricsRegistry(object):
+    """ Records the requests sent to fixer.io and the cache lookups of clients, per client tier and endpoint.
+
+    Every request sent counts against the quota, so the request count of an endpoint is its quota spend,
+    including retries and hedged requests. A registry can be shared by many clients.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: the upper bounds of the latency histogram buckets, in seconds.
+        :type buckets: tuple
+        """
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, tier, endpoint):
+        """ Gets the metrics of an endpoint, creating them on first use. Must be called with the lock held.
+
+        :param tier: the client tier.
+        :type tier: str
+        :param endpoint: the endpoint name.
+        :type endpoint: str
+        :return: the metrics of the endpoint.
+        :rtype: EndpointMetrics
+        """
+        metrics = self._endpoints.get((tier, endpoint))
+        if metrics is None:
+            metrics = self._endpoints[(tier, endpoint)] = EndpointMetrics(self.buckets)
+
+        return metrics
+
+    def record_request(self, tier, endpoint, latency, size=0, decode_seconds=0.0, error=False):
+        """ Records a request sent to fixer.io.
+
+        :param tier: the client tier.
+        :type tier: str
+        :param endpoint: the endpoint name.
+        :type endpoint: str
+        :param latency: the number of seconds until the response was received.
+        :type latency: float
+        :param size: the number of bytes of the response body.
+        :type size: int
+        :param decode_seconds: the number of seconds spent decoding the response body.
+        :type decode_seconds: float
+        :param error: whether the request failed or the response was unsuccessful.
+        :type error: bool
+        """
+        with self._lock:
+            metrics = self._endpoint(tier, endpoint)
+            metrics.requests += 1
+            if error:
+                metrics.errors += 1
+            metrics.latency.observe(latency)
+            metrics.response_bytes += size
+            metrics.decode_seconds += decode_seconds
+
+    def record_cache(self, tier, endpoint, hit):
+        """ Records a cache lookup.
+
+        :param tier: the client tier.
+        :type tier: str
+        :param endpoint: the endpoint name.
+        :type endpoint: str
+        :param hit: whether the response was cached.
+        :type hit: bool
+        """
+        with self._lock:
+            metrics = self._endpoint(tier, endpoint)
+            if hit:
+                metrics.cache_hits += 1
+            else:
+                metrics.cache_misses += 1
+
+    def reset(self):
+        """ Forgets all recorded metrics. """
+        with self._lock:
+            self._endpoints = {}
+
+    def as_dict(self):
+        """ Gets the metrics as plain dicts.
+
+        :return: the metrics of each endpoint, by client tier and endpoint name.
+        :rtype: dict
+        """
+        with self._lock:
+            metrics = {}
+            for (tier, endpoint), endpoint_metrics in sorted(self._endpoints.items()):
+                metrics.setdefault(tier, {})[endpoint] = endpoint_metrics.as_dict()
+
+            return metrics
+
+    def to_prometheus(self):
+        """ Gets the metrics in the Prometheus text exposition format.
+
+        :return: the metrics, one sample per line.
+        :rtype: str
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = []
+            counters = (
+                ("fixerio_requests_total", "Requests sent to fixer.io.", "requests"),
+                ("fixerio_request_errors_total", "Requests which failed or were unsuccessful.", "errors"),
+                ("fixerio_response_bytes_total", "Bytes of response bodies received.", "response_bytes"),
+                ("fixerio_decode_seconds_total", "Seconds spent decoding response bodies.", "decode_seconds"),
+                ("fixerio_cache_hits_total", "Responses read from a cache.", "cache_hits"),
+                ("fixerio_cache_misses_total", "Cache lookups which found no response.", "cache_misses"),
+            )
+            for name, description, attribute in counters:
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} counter")
+                for (tier, endpoint), metrics in endpoints:
+                    lines.append(f'{name}{{tier="{tier}",endpoint="{endpoint}"}} {getattr(metrics, attribute)}')
+
+            name = "fixerio_request_duration_seconds"
+            lines.append(f"# HELP {name} Seconds until fixer.io responded.")
+            lines.append(f"# TYPE {name} histogram")
+            for (tier, endpoint), metrics in endpoints:
+                labels = f'tier="{tier}",endpoint="{endpoint}"'
+                for bound, count in metrics.latency.cumulative_counts():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {metrics.latency.sum}")
+                lines.append(f"{name}_count{{{labels}}} {metrics.latency.count}")
+
+        return "\n".join(lines) + "\n"
@@ -4,8 +4,14 @@ from .url import BASE_HTTPS_URL
 
 class ProfessionalPlusClient(ProfessionalClient):
     """ A client for the Fixer.io Professional Plus Plan. """
+    # The latest rates are updated every 60 seconds on the Professional Plus Plan.
+    refresh_interval = 60
+    # The number of requests per month on the Professional Plus Plan.
+    monthly_quota = 100000
+    # The plan's label in metrics.
+    tier = "professional_plus"
 
-    def __init__(self, access_key, symbols=None, base=None):
+    def __init__(self, access_key, symbols=None, base=None, **kwargs):
         """
         :param access_key: your API Key.
         :type access_key: str or unicode
@@ -13,8 +19,9 @@ class ProfessionalPlusClient(ProfessionalClient):
         :type symbols: list or tuple
         :param base: currency symbol for base currency. The default base currency is EUR.
         :type base: str
+        :param kwargs: keyword arguments for the underlying :class:`FixerioClient`, e.g. `pool_size`.
         """
-        super().__init__(access_key)
+        super().__init__(access_key, **kwargs)
         self.base_url = BASE_HTTPS_URL
         self.symbols = symbols
         self.base = base
@@ -41,6 +48,31 @@ class ProfessionalPlusClient(ProfessionalClient):
         """
         return self._latest(symbols=symbols, base=base)
 
+    def watch_latest(self, symbols=None, base=None):
+        """ Gets the exchange rate data for the currencies you have requested, and refreshes it in the background
+        on the plan's update schedule from now on, so `get_latest` answers it from memory.
+
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate data for the currencies you have requested.
+        :rtype: dict
+        :raises ValueError: if the client wasn't created with `refresh_latest`.
+        :raises FixerioException: if any error making a request.
+        """
+        return self._watch_latest(symbols=symbols, base=base)
+
+    def unwatch_latest(self, symbols=None, base=None):
+        """ Stops refreshing the exchange rate data for the currencies you have requested in the background.
+
+        :param symbols: a list of comma-separated currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        """
+        self._unwatch_latest(symbols=symbols, base=base)
+
     def get_historical_rates(self, date, symbols=None, base=None):
         """ Gets historical rates for any day since `date`.
         Historical rates are available for most currencies all the way back to the year of 1999.
@@ -57,6 +89,40 @@ class ProfessionalPlusClient(ProfessionalClient):
         """
         return self._historical_rates(date, symbols=symbols, base=base)
 
+    def get_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates at once. Dates missing from the cache are requested concurrently,
+        up to `max_workers` at a time, so a history takes about as long as its slowest requests.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the historical exchange rate data of each date, by date in YYYY-MM-DD format.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return self._historical_rates_many(dates, symbols=symbols, base=base)
+
+    def iter_historical_rates_many(self, dates, symbols=None, base=None):
+        """ Gets historical rates for many dates at once, as :meth:`get_historical_rates_many`, but yields the rates
+        of each date as soon as they arrive.
+
+        :param dates: the dates in the past for which historical rates are requested. Repeated dates are requested
+            once.
+        :type dates: iterable of date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the date, in YYYY-MM-DD format, and its historical exchange rate data, in order of completion.
+        :rtype: generator of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._iter_historical_rates_many(dates, symbols=symbols, base=base)
+
     def convert_amount(self, from_ccy, to_ccy, amount, date=None):
         """ Converts an amount from one currency to another
 
@@ -74,8 +140,27 @@ class ProfessionalPlusClient(ProfessionalClient):
         """
         return self._convert(from_ccy, to_ccy, amount, date=date)
 
-    def get_time_series(self, start_date, end_date, symbols=None, base=None):
-        """ Gets daily historical rates between two dates of your choice, with a maximum time frame of 365 days.
+    def convert_amounts(self, from_ccys, to_ccys, amounts, dates=None):
+        """ Converts many amounts locally at once with NumPy, requesting the rates of all currencies once per date.
+        Rates are only requested on a cache miss when the client has a `latest_cache` and `historical_store`.
+
+        :param from_ccys: the three-letter currency codes of the currencies to convert from.
+        :type from_ccys: list or tuple or numpy.ndarray
+        :param to_ccys: the three-letter currency codes of the currencies to convert to.
+        :type to_ccys: list or tuple or numpy.ndarray
+        :param amounts: the amounts to be converted.
+        :type amounts: list or tuple or numpy.ndarray
+        :param dates: the date of each conversion to use historical rates, or None to use the latest rates.
+        :type dates: list or tuple or numpy.ndarray of date or str (in YYYY-MM-DD format)
+        :return: the converted amounts, NaN where a currency is unknown.
+        :rtype: numpy.ndarray
+        :raises FixerioException: if any error making a request.
+        """
+        return self._convert_many(from_ccys, to_ccys, amounts, dates=dates)
+
+    def get_time_series(self, start_date, end_date, symbols=None, base=None, as_matrix=False, stream=False):
+        """ Gets daily historical rates between two dates of your choice.
+        Time frames longer than 365 days are split into windows which are requested concurrently.
 
         :param start_date: the start date of your preferred timeframe.
         :type start_date: date or str (in YYYY-MM-DD format)
@@ -85,11 +170,53 @@ class ProfessionalPlusClient(ProfessionalClient):
         :type symbols: list or tuple
         :param base: the three-letter currency code of your preferred base currency.
         :type base: str
+        :param as_matrix: return the rates as an array-backed :class:`RateMatrix` instead of nested dicts.
+        :type as_matrix: bool
+        :param stream: with `as_matrix`, parse each response into the matrix as it arrives, so the response text
+            and nested dicts are never held in memory.
+        :type stream: bool
         :return: the time series of exchange rates for the currencies you have requested.
-        :rtype: dict
+        :rtype: dict or RateMatrix
         :raises FixerioException: if any error making a request.
         """
-        return self._time_series(start_date, end_date, symbols=symbols, base=base)
+        return self._windowed_time_series(start_date, end_date, symbols=symbols, base=base, as_matrix=as_matrix,
+                                          stream=stream)
+
+    def iter_time_series(self, start_date, end_date, symbols=None, base=None):
+        """ Streams daily historical rates between two dates of your choice. Each response is parsed as it
+        arrives and the rates of each date are yielded as soon as they are read, so memory use doesn't grow
+        with the length of the timeframe. Time frames longer than 365 days are requested one window at a time.
+
+        :param start_date: the start date of your preferred timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the date, in YYYY-MM-DD format, and the rates of the currencies on it, in date order.
+        :rtype: generator of tuple
+        :raises FixerioException: if any error making a request, or if a request is unsuccessful.
+        """
+        return self._iter_time_series(start_date, end_date, symbols=symbols, base=base)
+
+    def sync_historical_rates(self, start_date, end_date, base=None):
+        """ Downloads the rates of all currencies for the dates between two dates which are missing from the
+        client's `historical_store`, so keeping a history up to date only costs requests for the new dates.
+        Missing ranges are requested from the time series endpoint, up to `max_workers` windows at a time.
+
+        :param start_date: the first date to have rates for.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date to have rates for. Dates from today on are skipped, as their rates can change.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :return: the first and last date of each range which was missing.
+        :rtype: list of tuple
+        :raises FixerioException: if any error making a request.
+        """
+        return self._backfill(start_date, end_date, base=base, time_series=True)
 
     def get_fluctuation(self, start_date, end_date, symbols=None, base=None):
         """ Gets the starting and ending rates with absolute and percentage changes over the fluctuation timeframe.
@@ -107,3 +234,22 @@ class ProfessionalPlusClient(ProfessionalClient):
         :raises FixerioException: if any error making a request.
         """
         return self._fluctuation(start_date, end_date, symbols=symbols, base=base)
+
+    def compute_fluctuation(self, start_date, end_date, symbols=None, base=None):
+        """ Computes the starting and ending rates with absolute and percentage changes over the fluctuation
+        timeframe locally, from the historical rates of all currencies on both dates. With a `historical_store`,
+        the rates of each date are only requested once.
+
+        :param start_date: the start date of your preferred fluctuation timeframe.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the end date of your preferred fluctuation timeframe.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :param symbols: a list of currency codes to limit output currencies.
+        :type symbols: list or tuple
+        :param base: the three-letter currency code of your preferred base currency.
+        :type base: str
+        :return: the exchange rate and fluctuation data for the currencies you have requested.
+        :rtype: dict
+        :raises FixerioException: if any error making a request.
+        """
+        return self._local_fluctuation(start_date, end_date, symbols=symbols, base=base)
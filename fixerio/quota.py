@@ -0,0 +1,243 @@
+import datetime
+import json
+import os
+import threading
+import time
+
+from .exceptions import FixerioTimeout, QuotaExceeded
+
+
+def _month(timestamp):
+    """ Gets the calendar month of a timestamp, in UTC.
+
+    :param timestamp: seconds since the epoch.
+    :type timestamp: float
+    :return: the month in YYYY-MM format.
+    :rtype: str
+    """
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime('%Y-%m')
+
+
+def _month_bounds(month):
+    """ Gets the start and end of a calendar month, in UTC.
+
+    :param month: the month in YYYY-MM format.
+    :type month: str
+    :return: the first instant of the month and of the next month.
+    :rtype: tuple of datetime
+    """
+    start = datetime.datetime.strptime(month, '%Y-%m').replace(tzinfo=datetime.timezone.utc)
+    end = (start + datetime.timedelta(days=32)).replace(day=1)
+
+    return start, end
+
+
+class QuotaScheduler(object):
+    """ Counts the requests sent to fixer.io against a plan's monthly quota, and limits their rate with a token
+    bucket.
+
+    A request beyond the monthly quota is rejected with :class:`~fixerio.exceptions.QuotaExceeded` before it's
+    sent. A request beyond the token bucket's rate waits for a token, or is rejected if `block` is False or the
+    wait is longer than `timeout`. The count of the month is kept in a JSON file, if given a path, so it
+    survives restarts. The file is written at most every `save_interval` seconds and when the client is closed,
+    not on every request. It belongs to one process: processes sharing it overwrite each other's counts.
+    Months are calendar months in UTC.
+    """
+
+    def __init__(self, monthly_quota, rate=None, burst=None, path=None, block=True, timeout=None, clock=time.time,
+                 save_interval=1.0):
+        """
+        :param monthly_quota: the number of requests allowed in a month.
+        :type monthly_quota: int
+        :param rate: the number of requests allowed per second on average, or None for no limit.
+        :type rate: float
+        :param burst: the number of requests which can be sent at once, by default one second's worth of `rate`.
+        :type burst: int
+        :param path: the path of a JSON file to keep the count of the month in.
+        :type path: str
+        :param block: wait for the token bucket instead of rejecting a request.
+        :type block: bool
+        :param timeout: the maximum number of seconds to wait for the token bucket, or None to wait as long as
+            needed.
+        :type timeout: float
+        :param clock: a function returning the current time in seconds since the epoch.
+        :type clock: callable
+        :param save_interval: the minimum number of seconds between writes of the JSON file.
+        :type save_interval: float
+        """
+        self.monthly_quota = monthly_quota
+        self.rate = rate
+        self.burst = burst if (burst is not None) else max(1, int(rate or 1))
+        self.path = path
+        self.block = block
+        self.timeout = timeout
+        self.clock = clock
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._unsaved = False
+        self._saved_at = None
+
+        self._month = _month(clock())
+        self._used = 0
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                state = json.load(file)
+            if state.get('month') == self._month:
+                self._used = state.get('used', 0)
+
+    @property
+    def used(self):
+        """ The number of requests sent this month. """
+        with self._lock:
+            self._roll_month(self.clock())
+            return self._used
+
+    @property
+    def remaining(self):
+        """ The number of requests left in this month's quota. """
+        return max(0, self.monthly_quota - self.used)
+
+    def _roll_month(self, now):
+        """ Resets the count when a new month starts. Called with the lock held.
+
+        :param now: the current time.
+        :type now: float
+        """
+        month = _month(now)
+        if month != self._month:
+            self._month = month
+            self._used = 0
+
+    def flush_due(self):
+        """ Checks whether the count of the month is due to be written to the JSON file, and if so, claims the
+        write for the caller, who must then call :meth:`flush`.
+
+        :return: whether the count has changed and wasn't written for `save_interval` seconds.
+        :rtype: bool
+        """
+        if self.path is None:
+            return False
+
+        with self._lock:
+            now = self.clock()
+            if not self._unsaved or (self._saved_at is not None and now - self._saved_at < self.save_interval):
+                return False
+            self._saved_at = now
+
+            return True
+
+    def flush(self):
+        """ Writes the count of the month to the JSON file atomically, if it changed since the last write. """
+        if self.path is None:
+            return
+
+        # Writes are in order, and each writes the latest count.
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return
+                state = {'month': self._month, 'used': self._used}
+                self._unsaved = False
+
+            temporary_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w') as file:
+                json.dump(state, file)
+            os.replace(temporary_path, self.path)
+
+    def reserve(self, max_wait=None):
+        """ Counts a request about to be sent and takes a token for it. The count isn't written to the JSON file,
+        see :meth:`flush_due`.
+
+        :param max_wait: the number of seconds the caller can wait for a token before its deadline.
+        :type max_wait: float
+        :return: the number of seconds to wait before sending the request.
+        :rtype: float
+        :raises QuotaExceeded: if the monthly quota is used up, or the request can't wait for a token.
+        :raises FixerioTimeout: if the caller's deadline passes before there is a token.
+        """
+        with self._lock:
+            now = self.clock()
+            self._roll_month(now)
+
+            if self._used >= self.monthly_quota:
+                raise QuotaExceeded(f"The monthly quota of {self.monthly_quota} requests is used up until "
+                                    f"{_month_bounds(self._month)[1].date().isoformat()}.")
+
+            wait = 0.0
+            if self.rate is not None:
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate
+                    if not self.block or (self.timeout is not None and wait > self.timeout):
+                        raise QuotaExceeded(f"The rate limit of {self.rate} requests per second is reached.")
+                    if max_wait is not None and wait > max_wait:
+                        raise FixerioTimeout("The call's deadline passes before the rate limit allows the request.")
+
+                # Tokens go negative while requests wait for them, so each waiting request gets its own turn.
+                self._tokens -= 1
+
+            self._used += 1
+            self._unsaved = True
+
+            return wait
+
+    def acquire(self, max_wait=None):
+        """ Counts a request about to be sent, and waits for the token bucket.
+
+        :param max_wait: the number of seconds the caller can wait for a token before its deadline.
+        :type max_wait: float
+        :raises QuotaExceeded: if the monthly quota is used up, or the request can't wait for a token.
+        :raises FixerioTimeout: if the caller's deadline passes before there is a token.
+        """
+        wait = self.reserve(max_wait=max_wait)
+        if self.flush_due():
+            self.flush()
+        if wait > 0:
+            time.sleep(wait)
+
+    def projected_exhaustion(self):
+        """ Projects when the monthly quota will be used up if requests continue at this month's average rate.
+
+        :return: when the quota will be used up, or None if it will last until the end of the month.
+        :rtype: datetime
+        """
+        with self._lock:
+            now = self.clock()
+            self._roll_month(now)
+            used = self._used
+            start, end = _month_bounds(self._month)
+
+        if used >= self.monthly_quota:
+            return datetime.datetime.fromtimestamp(now, datetime.timezone.utc)
+
+        elapsed = now - start.timestamp()
+        if used == 0 or elapsed <= 0:
+            return None
+
+        exhaustion = now + (self.monthly_quota - used) * elapsed / used
+        if exhaustion >= end.timestamp():
+            return None
+
+        return datetime.datetime.fromtimestamp(exhaustion, datetime.timezone.utc)
+
+    def report(self):
+        """ Reports the usage of the monthly quota.
+
+        :return: the month, the quota, the requests used and remaining, and the projected exhaustion.
+        :rtype: dict
+        """
+        used = self.used
+
+        return {
+            "month": self._month,
+            "monthly_quota": self.monthly_quota,
+            "used": used,
+            "remaining": max(0, self.monthly_quota - used),
+            "projected_exhaustion": self.projected_exhaustion()
+        }
@@ -0,0 +1,259 @@
+import datetime
+import itertools
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .exceptions import FixerioException
+
+
+class RateMatrix(object):
+    """ Rates of currencies over dates, stored in one contiguous (dates x currencies) float64 array.
+
+    Rows and columns are looked up in O(1) and returned as NumPy views of the array without copying. Rates
+    missing from the source data are NaN. The nested `{date: {currency: rate}}` mapping is only built by
+    :meth:`to_dict`.
+    """
+    __slots__ = ('values', 'dates', 'symbols', 'base', '_date_index', '_symbol_index')
+
+    def __init__(self, values, dates, symbols, base=None):
+        """
+        :param values: the rates, with a row for each date and a column for each currency.
+        :type values: numpy.ndarray
+        :param dates: the date of each row, in ascending order.
+        :type dates: numpy.ndarray of datetime64[D]
+        :param symbols: the three-letter currency code of each column.
+        :type symbols: numpy.ndarray of str
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        """
+        self.values = values
+        self.dates = dates
+        self.symbols = symbols
+        self.base = base
+        self._date_index = {date: index for index, date in enumerate(dates.astype(str).tolist())}
+        self._symbol_index = {symbol: index for index, symbol in enumerate(symbols.tolist())}
+
+    @classmethod
+    def from_time_series(cls, response):
+        """ Creates a matrix from a time series response.
+
+        :param response: a time series response.
+        :type response: dict
+        :return: the rates of the time series.
+        :rtype: RateMatrix
+        :raises FixerioException: if the response is unsuccessful.
+        """
+        if np is None:
+            raise ImportError("RateMatrix requires numpy: pip install fixerio-client[numpy]")
+
+        if not isinstance(response, dict) or not response.get('success'):
+            error = response.get('error') if isinstance(response, dict) else response
+            raise FixerioException(f"Time series request failed: {error}")
+
+        rates = response.get('rates') or {}
+        dates = sorted(rates)
+        rows = [rates[date] for date in dates]
+
+        symbols = list(rows[0]) if rows else []
+        if all(list(row) == symbols for row in rows):
+            # Every date has the same currencies in the same order, as fixer.io sends them.
+            values = np.fromiter(itertools.chain.from_iterable(row.values() for row in rows), dtype=np.float64,
+                                 count=len(rows) * len(symbols)).reshape(len(rows), len(symbols))
+        else:
+            symbols = sorted(set(itertools.chain.from_iterable(rows)))
+            symbol_index = {symbol: index for index, symbol in enumerate(symbols)}
+            values = np.full((len(rows), len(symbols)), np.nan)
+            for row_index, row in enumerate(rows):
+                for symbol, rate in row.items():
+                    values[row_index, symbol_index[symbol]] = rate
+
+        return cls(values, np.array(dates, dtype='datetime64[D]'), np.array(symbols, dtype=str),
+                   base=response.get('base'))
+
+    @classmethod
+    def concatenate(cls, matrices):
+        """ Joins the matrices of consecutive timeframes into one matrix.
+
+        :param matrices: the matrices, in date order.
+        :type matrices: list of RateMatrix
+        :return: the rates of all the matrices.
+        :rtype: RateMatrix
+        """
+        if len(matrices) == 1:
+            return matrices[0]
+
+        symbols = matrices[0].symbols
+        if all(np.array_equal(matrix.symbols, symbols) for matrix in matrices):
+            values = np.concatenate([matrix.values for matrix in matrices])
+        else:
+            symbols = np.array(sorted(set(itertools.chain.from_iterable(m.symbols.tolist() for m in matrices))),
+                               dtype=str)
+            values = np.full((sum(len(matrix) for matrix in matrices), len(symbols)), np.nan)
+            start = 0
+            for matrix in matrices:
+                columns = np.searchsorted(symbols, matrix.symbols)
+                values[start:start + len(matrix), columns] = matrix.values
+                start += len(matrix)
+
+        return cls(values, np.concatenate([matrix.dates for matrix in matrices]), symbols, base=matrices[0].base)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __repr__(self):
+        return f"RateMatrix(base={self.base!r}, dates={len(self.dates)}, symbols={len(self.symbols)})"
+
+    @property
+    def shape(self):
+        """ The number of dates and currencies. """
+        return self.values.shape
+
+    @staticmethod
+    def _date_key(date):
+        """ Converts a date to the format of the row keys.
+
+        :param date: a date.
+        :type date: date or numpy.datetime64 or str (in YYYY-MM-DD format)
+        :return: the date in YYYY-MM-DD format.
+        :rtype: str
+        """
+        if isinstance(date, (datetime.date, np.datetime64)):
+            return str(np.datetime64(date, 'D'))
+
+        return date
+
+    def row(self, date):
+        """ Gets the rates of all currencies on a date.
+
+        :param date: the date.
+        :type date: date or str (in YYYY-MM-DD format)
+        :return: a view of the rates, in the order of `symbols`.
+        :rtype: numpy.ndarray
+        :raises KeyError: if there are no rates for the date.
+        """
+        return self.values[self._date_index[self._date_key(date)]]
+
+    def column(self, symbol):
+        """ Gets the rates of a currency on all dates.
+
+        :param symbol: the three-letter currency code.
+        :type symbol: str
+        :return: a view of the rates, in the order of `dates`.
+        :rtype: numpy.ndarray
+        :raises KeyError: if there are no rates for the currency.
+        """
+        return self.values[:, self._symbol_index[symbol.upper()]]
+
+    def rate(self, date, symbol):
+        """ Gets the rate of a currency on a date.
+
+        :param date: the date.
+        :type date: date or str (in YYYY-MM-DD format)
+        :param symbol: the three-letter currency code.
+        :type symbol: str
+        :return: the rate, NaN if it's missing.
+        :rtype: float
+        :raises KeyError: if there are no rates for the date or currency.
+        """
+        return float(self.values[self._date_index[self._date_key(date)], self._symbol_index[symbol.upper()]])
+
+    def between(self, start_date, end_date):
+        """ Gets the rates between two dates, inclusive, as a matrix sharing this matrix's array.
+
+        :param start_date: the first date.
+        :type start_date: date or str (in YYYY-MM-DD format)
+        :param end_date: the last date.
+        :type end_date: date or str (in YYYY-MM-DD format)
+        :return: the rates between the dates.
+        :rtype: RateMatrix
+        """
+        start = np.searchsorted(self.dates, np.datetime64(start_date, 'D'), side='left')
+        end = np.searchsorted(self.dates, np.datetime64(end_date, 'D'), side='right')
+
+        return RateMatrix(self.values[start:end], self.dates[start:end], self.symbols, base=self.base)
+
+    def fluctuations(self, windows):
+        """ Computes the fluctuation of all currencies over many timeframes in one vectorized pass.
+        A date without rates uses the rates of the closest earlier date.
+
+        :param windows: the start and end date of each timeframe.
+        :type windows: list of tuple
+        :return: the fluctuation over each timeframe, in the shape of fixer.io fluctuation responses.
+        :rtype: list of dict
+        """
+        from .fluctuation import fluctuation_responses
+
+        return fluctuation_responses(self, windows)
+
+    def to_dict(self):
+        """ Builds the rates as nested dicts, as in a time series response.
+
+        :return: the rates of each currency by date, without missing rates.
+        :rtype: dict
+        """
+        symbols = self.symbols.tolist()
+
+        return {
+            date: {symbol: rate for symbol, rate in zip(symbols, row) if rate == rate}
+            for date, row in zip(self.dates.astype(str).tolist(), self.values.tolist())
+        }
+
+
+class RateMatrixBuilder(object):
+    """ Builds a :class:`RateMatrix` one `(date, rates)` row at a time, keeping only the rates as floats, so
+    a streamed time series never needs its nested dicts at once.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("RateMatrix requires numpy: pip install fixerio-client[numpy]")
+
+        self._dates = []
+        self._rows = []
+        self._symbols = []
+        self._symbol_index = {}
+
+    def append(self, date, rates):
+        """ Adds the rates of a date.
+
+        :param date: the date, in YYYY-MM-DD format.
+        :type date: str
+        :param rates: the rate of each currency on the date.
+        :type rates: dict
+        """
+        if list(rates) == self._symbols:
+            # The same currencies in the same order as the other dates, as fixer.io sends them.
+            row = np.fromiter(rates.values(), dtype=np.float64, count=len(rates))
+        else:
+            for symbol in rates:
+                if symbol not in self._symbol_index:
+                    self._symbol_index[symbol] = len(self._symbols)
+                    self._symbols.append(symbol)
+            row = np.full(len(self._symbols), np.nan)
+            for symbol, rate in rates.items():
+                row[self._symbol_index[symbol]] = rate
+
+        self._dates.append(date)
+        self._rows.append(row)
+
+    def build(self, base=None):
+        """ Creates the matrix of the rates added.
+
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :return: the rates, in date order.
+        :rtype: RateMatrix
+        """
+        values = np.full((len(self._rows), len(self._symbols)), np.nan)
+        for index, row in enumerate(self._rows):
+            values[index, :len(row)] = row
+
+        dates = np.array(self._dates, dtype='datetime64[D]')
+        if np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            dates, values = dates[order], values[order]
+
+        return RateMatrix(values, dates, np.array(self._symbols, dtype=str), base=base)
@@ -0,0 +1,132 @@
+from .cache import split_symbols
+from .store import DEFAULT_BASE
+
+
+def rebase(response, base=None, symbols=None):
+    """ Converts a response of rates for all currencies to another base currency and limits its currencies.
+    Each rate is cross-divided by the rate of the new base currency, e.g. USD/GBP = EUR/GBP / EUR/USD.
+
+    :param response: a latest or historical rates response.
+    :type response: dict
+    :param base: the three-letter currency code of the new base currency.
+    :type base: str
+    :param symbols: comma-separated currency codes to limit output currencies.
+    :type symbols: str or list or tuple
+    :return: a response in the same shape, for the new base currency.
+    :rtype: dict
+    """
+    if not isinstance(response, dict) or not response.get('success') or not isinstance(response.get('rates'), dict):
+        return response
+
+    rates = response['rates']
+    from_base = (response.get('base') or DEFAULT_BASE).upper()
+    base = (base or from_base).upper()
+
+    if base == from_base:
+        base_rate = 1.0
+    elif base in rates:
+        base_rate = rates[base]
+    else:
+        return {
+            "success": False,
+            "error": {"code": 201, "type": "invalid_base_currency"}
+        }
+
+    symbols = split_symbols(symbols)
+    if symbols is None:
+        symbols = rates.keys()
+
+    rebased = {}
+    for symbol in symbols:
+        if symbol == base:
+            rebased[symbol] = 1.0
+        elif symbol == from_base:
+            rebased[symbol] = 1.0 / base_rate
+        elif symbol in rates:
+            rebased[symbol] = rates[symbol] / base_rate
+
+    return dict(response, base=base, rates=rebased)
+
+
+class RebasingCache(object):
+    """ Answers requests for any base currency and currencies from rates of all currencies for one base.
+
+    Requests are sent without `base` and `symbols`, so one response of EUR rates serves every base currency.
+    Wraps a cache or store, which then only keeps the responses for the EUR base.
+    """
+
+    def __init__(self, cache=None):
+        """
+        :param cache: a cache or store of responses, or None to only rebase each response.
+        :type cache: TTLCache or HistoricalRatesStore
+        """
+        self.cache = cache
+
+    def lookup(self, url, payload):
+        """ Looks a request up in the wrapped cache and rebases the cached response.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the rebased response or None if there isn't one.
+        :rtype: dict
+        """
+        if self.cache is None:
+            return None
+
+        response = self.cache.lookup(url, self.fetch_payload(url, payload))
+        if response is None:
+            return None
+
+        return rebase(response, base=payload.get('base'), symbols=payload.get('symbols'))
+
+    def lookup_stale(self, url, payload, max_stale=None):
+        """ Looks a request up in the wrapped cache, including expired responses, and rebases the response.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param max_stale: the number of seconds an expired response can be served.
+        :type max_stale: int or float
+        :return: the rebased response or None if there isn't one.
+        :rtype: dict
+        """
+        if self.cache is None:
+            return None
+
+        response = self.cache.lookup_stale(url, self.fetch_payload(url, payload), max_stale=max_stale)
+        if response is None:
+            return None
+
+        return rebase(response, base=payload.get('base'), symbols=payload.get('symbols'))
+
+    def fetch_payload(self, url, payload):
+        """ Gets the query parameters to send, which request all currencies for the default base.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :return: the query parameters to send.
+        :rtype: dict
+        """
+        return {key: value for key, value in payload.items() if key not in ('base', 'symbols')}
+
+    def save(self, url, payload, response):
+        """ Caches the response for all currencies and rebases it.
+
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :param response: the response for all currencies.
+        :type response: dict
+        :return: the rebased response for the request.
+        :rtype: dict
+        """
+        if self.cache is not None:
+            response = self.cache.save(url, self.fetch_payload(url, payload), response)
+
+        return rebase(response, base=payload.get('base'), symbols=payload.get('symbols'))
@@ -0,0 +1,232 @@
+import asyncio
+import threading
+import time
+
+from .exceptions import FixerioException
+
+
+class LatestRatesRefresher(object):
+    """ Re-polls the latest rates of watched requests in the background, so they're always answered from memory.
+
+    Each watched request is sent again when fixer.io's next update is due, from the `timestamp` of its last
+    response, and saved in the client's latest cache. A watched request whose cached response has just expired
+    is answered with it, stale by up to `max_stale` seconds, while a refresh is started at once. Every refresh
+    counts against the plan's quota, one request per watched request and update. A refresh which fails, for
+    any error, is retried after `retry_interval` and reported to the client's hooks as a completed call.
+    """
+
+    def __init__(self, interval=None, max_stale=None, retry_interval=None):
+        """
+        :param interval: the number of seconds between refreshes. Defaults to the plan's update interval.
+        :type interval: int or float
+        :param max_stale: the number of seconds an expired response of a watched request can still be served
+            while it's being refreshed. Defaults to `interval`, so a refresh can fail once.
+        :type max_stale: int or float
+        :param retry_interval: the number of seconds to wait before retrying a failed refresh, or refreshing
+            rates which fixer.io hasn't updated on time. Defaults to a tenth of `interval`.
+        :type retry_interval: int or float
+        """
+        self.interval = interval
+        self.max_stale = max_stale
+        self.retry_interval = retry_interval
+        self._requests = {}
+        self._lock = threading.Lock()
+        self._wake = None
+        self._worker = None
+        self._stopping = False
+
+    def watch(self, key, url, payload):
+        """ Adds a request to refresh.
+
+        :param key: the key of the request to send, see :func:`fixerio.cache.payload_key`.
+        :type key: tuple
+        :param url: the endpoint URL.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        """
+        with self._lock:
+            self._requests.setdefault(key, (url, payload))
+
+    def unwatch(self, key):
+        """ Stops refreshing a request.
+
+        :param key: the key of the request to send.
+        :type key: tuple
+        """
+        with self._lock:
+            self._requests.pop(key, None)
+
+    def watches(self, key):
+        """ Checks whether a request is refreshed.
+
+        :param key: the key of the request to send.
+        :type key: tuple
+        :return: whether the request is watched.
+        :rtype: bool
+        """
+        with self._lock:
+            return key in self._requests
+
+    def requests(self):
+        """ Gets the watched requests.
+
+        :return: the URL and query parameters of each watched request.
+        :rtype: list of tuple
+        """
+        with self._lock:
+            return list(self._requests.values())
+
+    def wake(self):
+        """ Refreshes the watched requests now, rather than when their next update is due. """
+        if self._wake is not None:
+            self._wake.set()
+
+    def _configure(self, interval):
+        """ Fills in the defaults which depend on the plan.
+
+        :param interval: the plan's update interval, in seconds.
+        :type interval: int or float
+        """
+        if self.interval is None:
+            self.interval = interval
+        if self.max_stale is None:
+            self.max_stale = self.interval
+        if self.retry_interval is None:
+            self.retry_interval = self.interval / 10
+
+    def _next_wait(self, responses, failed):
+        """ Gets the number of seconds until the next refresh.
+
+        :param responses: the responses of the last refresh.
+        :type responses: list of dict
+        :param failed: whether a refresh failed.
+        :type failed: bool
+        :return: the seconds until fixer.io's next update is due, at least `retry_interval`.
+        :rtype: float
+        """
+        if failed:
+            return self.retry_interval
+
+        due = self.interval
+        now = time.time()
+        for response in responses:
+            timestamp = response.get('timestamp') if isinstance(response, dict) else None
+            if isinstance(timestamp, (int, float)):
+                due = min(due, timestamp + self.interval - now)
+
+        return max(self.retry_interval, due)
+
+    def running(self):
+        """ Checks whether the refresher is running.
+
+        :return: whether refreshes are scheduled.
+        :rtype: bool
+        """
+        worker = self._worker
+        if worker is None:
+            return False
+
+        return not worker.done() if isinstance(worker, asyncio.Future) else worker.is_alive()
+
+    def start(self, refresh, interval):
+        """ Starts refreshing the watched requests on a daemon thread, unless the refresher is running.
+
+        :param refresh: sends a request and caches its response, given its URL and query parameters.
+        :type refresh: callable
+        :param interval: the plan's update interval, in seconds.
+        :type interval: int or float
+        """
+        with self._lock:
+            if self.running():
+                return
+            self._configure(interval)
+            self._stopping = False
+            self._wake = threading.Event()
+            self._worker = threading.Thread(target=self._run, args=(refresh, self._wake), daemon=True,
+                                            name="fixerio-latest-refresher")
+            self._worker.start()
+
+    def _run(self, refresh, wake):
+        """ Refreshes the watched requests whenever they're due, until stopped. """
+        wait = self.interval
+        while True:
+            wake.wait(wait)
+            if self._stopping:
+                return
+
+            responses = []
+            failed = False
+            for url, payload in self.requests():
+                try:
+                    responses.append(refresh(url, payload))
+                except (FixerioException, Exception):
+                    # Any error, a hook's included, mustn't stop the refreshes the cache relies on.
+                    failed = True
+            # Calls which found expired rates while they were being refreshed are answered by this refresh,
+            # but a wake to stop mustn't be missed.
+            with self._lock:
+                if not self._stopping:
+                    wake.clear()
+            wait = self._next_wait(responses, failed)
+
+    def stop(self):
+        """ Stops refreshing, and waits for a refresh in progress to finish. The watched requests are kept. """
+        with self._lock:
+            worker, self._worker = self._worker, None
+            self._stopping = True
+        self.wake()
+
+        if isinstance(worker, threading.Thread) and worker is not threading.current_thread():
+            worker.join()
+
+    def start_async(self, refresh, interval):
+        """ Starts refreshing the watched requests in a task of the running event loop, unless the refresher is
+        running.
+
+        :param refresh: a coroutine function which sends a request and caches its response, given its URL and
+            query parameters.
+        :type refresh: callable
+        :param interval: the plan's update interval, in seconds.
+        :type interval: int or float
+        :raises RuntimeError: if there's no running event loop.
+        """
+        with self._lock:
+            if self.running():
+                return
+            self._configure(interval)
+            self._stopping = False
+            self._wake = asyncio.Event()
+            self._worker = asyncio.ensure_future(self._run_async(refresh, self._wake))
+
+    async def _run_async(self, refresh, wake):
+        """ Refreshes the watched requests whenever they're due, until stopped. """
+        wait = self.interval
+        while True:
+            try:
+                await asyncio.wait_for(wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                return
+
+            responses = []
+            failed = False
+            for url, payload in self.requests():
+                try:
+                    responses.append(await refresh(url, payload))
+                except (FixerioException, Exception):
+                    failed = True
+            # Calls which found expired rates while they were being refreshed are answered by this refresh.
+            wake.clear()
+            wait = self._next_wait(responses, failed)
+
+    async def stop_async(self):
+        """ Stops refreshing, cancelling a refresh in progress. The watched requests are kept. """
+        with self._lock:
+            worker, self._worker = self._worker, None
+            self._stopping = True
+
+        if isinstance(worker, asyncio.Future):
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
@@ -0,0 +1,330 @@
+import math
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+from .exceptions import FixerioException
+
+# The currency codes of the most recently used sets of currencies, with the index of each code, shared by all
+# results. Results keep their own reference to the codes and index of an evicted set.
+_SYMBOL_INDEXES = OrderedDict()
+_SYMBOL_INDEXES_MAXSIZE = 256
+_symbol_indexes_lock = threading.Lock()
+
+
+def _intern_symbols(symbols):
+    """ Gets the shared tuple of currency codes equal to some codes, and the index of each code in it.
+    Results with the same currencies share one tuple and one index while it's among the `_SYMBOL_INDEXES_MAXSIZE`
+    most recently used, and every code is interned.
+
+    :param symbols: the three-letter currency codes, in order.
+    :type symbols: iterable
+    :return: the shared codes and their index.
+    :rtype: tuple
+    """
+    symbols = tuple(symbols)
+    with _symbol_indexes_lock:
+        interned = _SYMBOL_INDEXES.get(symbols)
+        if interned is not None:
+            _SYMBOL_INDEXES.move_to_end(symbols)
+            return interned
+
+        symbols = tuple(sys.intern(symbol) for symbol in symbols)
+        interned = _SYMBOL_INDEXES[symbols] = (symbols, {symbol: i for i, symbol in enumerate(symbols)})
+        while len(_SYMBOL_INDEXES) > _SYMBOL_INDEXES_MAXSIZE:
+            _SYMBOL_INDEXES.popitem(last=False)
+
+    return interned
+
+
+def _check_response(response, name):
+    """ Checks a response is successful before converting it to a result.
+
+    :param response: the response.
+    :type response: dict
+    :param name: the name of the request, for the error message.
+    :type name: str
+    :raises FixerioException: if the response is unsuccessful.
+    """
+    if not isinstance(response, dict) or not response.get('success'):
+        error = response.get('error') if isinstance(response, dict) else response
+        raise FixerioException(f"{name} request failed: {error}")
+
+
+def _intern(value):
+    """ Interns a currency code, which may be None. """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _floats(values):
+    """ Stores numbers as an array of floats, with NaN for missing numbers. """
+    return array('d', (value if value is not None else math.nan for value in values))
+
+
+def _number(value):
+    """ Reads a number stored by :func:`_floats`, with None for missing numbers. """
+    return value if value == value else None
+
+
+class Rates(object):
+    """ The rates of currencies against a base currency, stored as one array of floats.
+
+    Currency codes are interned and results with the same currencies share one tuple of codes, so each result
+    costs little more than 8 bytes per rate. Rates are looked up by currency code like a dict.
+    """
+    __slots__ = ('base', 'date', 'timestamp', 'symbols', 'values', '_index')
+    request_name = "Rates"
+
+    def __init__(self, base, date, rates, timestamp=None):
+        """
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param date: the date of the rates.
+        :type date: str (in YYYY-MM-DD format)
+        :param rates: the rate of each currency.
+        :type rates: dict
+        :param timestamp: the UNIX time the rates were collected at.
+        :type timestamp: int
+        """
+        self.base = _intern(base)
+        self.date = date
+        self.timestamp = timestamp
+        self.symbols, self._index = _intern_symbols(rates)
+        self.values = array('d', rates.values())
+
+    @classmethod
+    def from_response(cls, response):
+        """ Creates a result from a rates response.
+
+        :param response: a latest or historical rates response.
+        :type response: dict
+        :return: the rates of the response.
+        :rtype: Rates
+        :raises FixerioException: if the response is unsuccessful.
+        """
+        _check_response(response, cls.request_name)
+
+        return cls(response.get('base'), response.get('date'), response.get('rates') or {},
+                   timestamp=response.get('timestamp'))
+
+    def __getitem__(self, symbol):
+        return self.values[self._index[symbol.upper()]]
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self._index
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(base={self.base!r}, date={self.date!r}, rates={len(self.symbols)})"
+
+    def get(self, symbol, default=None):
+        """ Gets the rate of a currency.
+
+        :param symbol: the three-letter currency code.
+        :type symbol: str
+        :param default: the value if there is no rate for the currency.
+        :type default: float
+        :return: the rate, or `default`.
+        :rtype: float
+        """
+        index = self._index.get(symbol.upper())
+
+        return self.values[index] if index is not None else default
+
+    def items(self):
+        """ Gets the currencies and their rates.
+
+        :return: the currency code and rate of each currency.
+        :rtype: iterator of tuple
+        """
+        return zip(self.symbols, self.values)
+
+    @property
+    def rates(self):
+        """ The rate of each currency, as a new dict. """
+        return dict(self.items())
+
+    def to_dict(self):
+        """ Converts the result to the response it was created from.
+
+        :return: the result, in the shape of a fixer.io response.
+        :rtype: dict
+        """
+        response = {"success": True, "timestamp": self.timestamp, "base": self.base, "date": self.date,
+                    "rates": self.rates}
+
+        return {key: value for key, value in response.items() if value is not None}
+
+
+class LatestRates(Rates):
+    """ The latest rates of currencies against a base currency. """
+    __slots__ = ()
+    request_name = "Latest rates"
+
+
+class HistoricalRates(Rates):
+    """ The rates of currencies against a base currency on a past date. """
+    __slots__ = ()
+    request_name = "Historical rates"
+
+    def to_dict(self):
+        """ Converts the result to the response it was created from.
+
+        :return: the result, in the shape of a fixer.io response.
+        :rtype: dict
+        """
+        return dict(super().to_dict(), historical=True)
+
+
+class ConversionResult(object):
+    """ An amount converted from one currency to another. """
+    __slots__ = ('from_ccy', 'to_ccy', 'amount', 'rate', 'result', 'date', 'timestamp', 'historical')
+
+    def __init__(self, from_ccy, to_ccy, amount, rate, result, date=None, timestamp=None, historical=False):
+        """
+        :param from_ccy: the three-letter currency code of the currency converted from.
+        :type from_ccy: str
+        :param to_ccy: the three-letter currency code of the currency converted to.
+        :type to_ccy: str
+        :param amount: the amount converted.
+        :type amount: int or float
+        :param rate: the rate of the conversion.
+        :type rate: float
+        :param result: the converted amount.
+        :type result: float
+        :param date: the date of the rate.
+        :type date: str (in YYYY-MM-DD format)
+        :param timestamp: the UNIX time the rate was collected at.
+        :type timestamp: int
+        :param historical: whether the conversion used historical rates.
+        :type historical: bool
+        """
+        self.from_ccy = _intern(from_ccy)
+        self.to_ccy = _intern(to_ccy)
+        self.amount = amount
+        self.rate = rate
+        self.result = result
+        self.date = date
+        self.timestamp = timestamp
+        self.historical = historical
+
+    @classmethod
+    def from_response(cls, response):
+        """ Creates a result from a convert response.
+
+        :param response: a convert response.
+        :type response: dict
+        :return: the conversion of the response.
+        :rtype: ConversionResult
+        :raises FixerioException: if the response is unsuccessful.
+        """
+        _check_response(response, "Convert")
+
+        query = response.get('query') or {}
+        info = response.get('info') or {}
+
+        return cls(query.get('from'), query.get('to'), query.get('amount'), info.get('rate'), response.get('result'),
+                   date=response.get('date'), timestamp=info.get('timestamp'),
+                   historical=bool(response.get('historical')))
+
+    def __repr__(self):
+        return (f"ConversionResult(from_ccy={self.from_ccy!r}, to_ccy={self.to_ccy!r}, amount={self.amount!r}, "
+                f"result={self.result!r})")
+
+    def to_dict(self):
+        """ Converts the result to the response it was created from.
+
+        :return: the result, in the shape of a fixer.io response.
+        :rtype: dict
+        """
+        response = {
+            "success": True,
+            "query": {"from": self.from_ccy, "to": self.to_ccy, "amount": self.amount},
+            "info": {"timestamp": self.timestamp, "rate": self.rate},
+        }
+        if self.historical:
+            response["historical"] = True
+        response["date"] = self.date
+        response["result"] = self.result
+
+        return response
+
+
+class FluctuationResult(object):
+    """ The change of the rates of currencies against a base currency between two dates, stored as arrays of
+    floats, with NaN for missing numbers, and a shared tuple of interned currency codes.
+    """
+    __slots__ = ('base', 'start_date', 'end_date', 'symbols', 'start_rates', 'end_rates', 'changes', 'change_pcts',
+                 '_index')
+
+    def __init__(self, base, start_date, end_date, rates):
+        """
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param start_date: the start date of the timeframe.
+        :type start_date: str (in YYYY-MM-DD format)
+        :param end_date: the end date of the timeframe.
+        :type end_date: str (in YYYY-MM-DD format)
+        :param rates: the start rate, end rate, change and percentage change of each currency.
+        :type rates: dict
+        """
+        self.base = _intern(base)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.symbols, self._index = _intern_symbols(rates)
+        fluctuations = rates.values()
+        self.start_rates = _floats(fluctuation.get('start_rate') for fluctuation in fluctuations)
+        self.end_rates = _floats(fluctuation.get('end_rate') for fluctuation in fluctuations)
+        self.changes = _floats(fluctuation.get('change') for fluctuation in fluctuations)
+        self.change_pcts = _floats(fluctuation.get('change_pct') for fluctuation in fluctuations)
+
+    @classmethod
+    def from_response(cls, response):
+        """ Creates a result from a fluctuation response.
+
+        :param response: a fluctuation response.
+        :type response: dict
+        :return: the fluctuation of the response.
+        :rtype: FluctuationResult
+        :raises FixerioException: if the response is unsuccessful.
+        """
+        _check_response(response, "Fluctuation")
+
+        return cls(response.get('base'), response.get('start_date'), response.get('end_date'),
+                   response.get('rates') or {})
+
+    def __getitem__(self, symbol):
+        index = self._index[symbol.upper()]
+
+        return {"start_rate": _number(self.start_rates[index]), "end_rate": _number(self.end_rates[index]),
+                "change": _number(self.changes[index]), "change_pct": _number(self.change_pcts[index])}
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self._index
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return (f"FluctuationResult(base={self.base!r}, start_date={self.start_date!r}, end_date={self.end_date!r}, "
+                f"rates={len(self.symbols)})")
+
+    def to_dict(self):
+        """ Converts the result to the response it was created from.
+
+        :return: the result, in the shape of a fixer.io response.
+        :rtype: dict
+        """
+        response = {"success": True, "fluctuation": True, "start_date": self.start_date, "end_date": self.end_date,
+                    "base": self.base, "rates": {symbol: self[symbol] for symbol in self.symbols}}
+
+        return {key: value for key, value in response.items() if value is not None}
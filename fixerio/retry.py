@@ -0,0 +1,175 @@
+import datetime
+import email.utils
+import random
+import threading
+import time
+
+from .exceptions import CircuitOpen
+
+
+def parse_retry_after(value, now=None):
+    """ Parses the value of a Retry-After header.
+
+    :param value: a number of seconds or an HTTP date.
+    :type value: str
+    :param now: the current time in seconds since the epoch, for an HTTP date.
+    :type now: float
+    :return: the number of seconds to wait, or None if the value isn't valid.
+    :rtype: float
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+
+    return max(0.0, date.timestamp() - (now if (now is not None) else time.time()))
+
+
+class RetryPolicy(object):
+    """ Decides whether and when to retry a request which failed with a transient error.
+
+    Connection errors, timeouts and the HTTP statuses in `retry_statuses` are transient. Every fixer.io request
+    is a GET, so it's safe to send again. The delay before each retry grows exponentially from `backoff` up to
+    `max_backoff`, with full jitter, unless the response's Retry-After header gives it.
+    """
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30.0, jitter=True,
+                 retry_statuses=(429, 500, 502, 503, 504)):
+        """
+        :param max_attempts: the maximum number of times a request is sent.
+        :type max_attempts: int
+        :param backoff: the delay before the first retry, in seconds, doubled for each further retry.
+        :type backoff: float
+        :param max_backoff: the maximum delay before a retry, in seconds. A request isn't retried if its
+            Retry-After header asks to wait longer.
+        :type max_backoff: float
+        :param jitter: randomize each delay between 0 and the exponential delay, so clients retrying at the
+            same time spread out.
+        :type jitter: bool
+        :param retry_statuses: the HTTP statuses to retry.
+        :type retry_statuses: tuple of int
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_transient(self, status):
+        """ Checks whether a request which got an HTTP error status may succeed if sent again.
+
+        :param status: the HTTP status of the response.
+        :type status: int
+        :return: whether the error is transient.
+        :rtype: bool
+        """
+        return status in self.retry_statuses
+
+    def delay(self, attempt, retry_after=None):
+        """ Gets the delay before retrying a request which failed with a transient error.
+
+        :param attempt: the number of times the request was sent.
+        :type attempt: int
+        :param retry_after: the value of the response's Retry-After header.
+        :type retry_after: str
+        :return: the number of seconds to wait before retrying, or None if the request shouldn't be retried.
+        :rtype: float
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+
+# Sends each request once, but still tells transient errors apart for a circuit breaker.
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class CircuitBreaker(object):
+    """ Fails requests fast while fixer.io is down, instead of letting every caller wait on it.
+
+    The circuit opens after `failure_threshold` consecutive requests fail with transient errors. While it's
+    open, requests are rejected with :class:`~fixerio.exceptions.CircuitOpen` without being sent, or answered
+    with expired cached responses if `serve_stale` is set. After `reset_timeout` seconds one request is let
+    through: the circuit closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, serve_stale=True, clock=time.monotonic):
+        """
+        :param failure_threshold: the number of consecutive failed requests which open the circuit.
+        :type failure_threshold: int
+        :param reset_timeout: the number of seconds the circuit stays open before a request is let through.
+        :type reset_timeout: float
+        :param serve_stale: answer requests with expired cached responses while the circuit is open.
+        :type serve_stale: bool
+        :param clock: a function returning the current time in seconds.
+        :type clock: callable
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.serve_stale = serve_stale
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_at = None
+
+    @property
+    def state(self):
+        """ The state of the circuit: 'closed', 'open' or 'half-open'. """
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._trial_at is not None or self.clock() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_request(self):
+        """ Checks that a request may be sent.
+
+        :raises CircuitOpen: if the circuit is open, or half-open with a trial request already in flight.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            now = self.clock()
+            # A trial request which never reported back is given up on after another `reset_timeout`.
+            last_attempt = self._trial_at if (self._trial_at is not None) else self._opened_at
+            if now - last_attempt >= self.reset_timeout:
+                self._trial_at = now
+                return
+
+        raise CircuitOpen("fixer.io is unavailable, the circuit breaker is open.")
+
+    def record_success(self):
+        """ Records a request which got a response, and closes the circuit. """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_at = None
+
+    def record_failure(self):
+        """ Records a request which failed with a transient error, and opens the circuit after too many. """
+        with self._lock:
+            self._failures += 1
+            if self._trial_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+                self._trial_at = None
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+
+from .cache import copy_response
+from .exceptions import FixerioTimeout
+
+
+def _share(response):
+    """ Copies a shared response for a caller which waited on another caller's request.
+
+    :param response: the decoded JSON response.
+    :return: a copy of the response, so callers can't modify each other's responses.
+    """
+    if isinstance(response, dict):
+        return copy_response(response)
+
+    return response
+
+
+class _Call(object):
+    """ A request in flight, which other callers wait on. """
+    __slots__ = ('done', 'response', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """ Coalesces concurrent identical requests of many threads into one request.
+
+    The first caller for a key sends the request, callers arriving while it is in flight wait for it and share
+    its response or exception. Once it completes, the next caller sends a new request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def do(self, key, function, timeout=None):
+        """ Calls a function unless a call for the same key is in flight, else waits for that call's result.
+
+        :param key: a key identifying the request.
+        :type key: tuple
+        :param function: sends the request.
+        :type function: callable
+        :param timeout: the maximum number of seconds to wait for a call in flight, or None to wait until it
+            completes.
+        :type timeout: float
+        :return: the response.
+        :rtype: dict
+        :raises FixerioTimeout: if the call in flight doesn't complete within the timeout.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise FixerioTimeout("The identical request in flight didn't complete before the deadline.")
+            if call.error is not None:
+                raise call.error
+
+            return _share(call.response)
+
+        try:
+            call.response = function()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.response
+
+
+class _AsyncCall(object):
+    """ A request in flight in a task of its own, which callers await. """
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight(object):
+    """ Coalesces concurrent identical requests of many tasks into one request.
+
+    The first caller for a key starts the request in a task of its own, callers arriving while it is in flight
+    await it too and share its response or exception. Cancelling a caller, the first one included, doesn't
+    cancel the shared request unless no other caller awaits it.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key, function, timeout=None):
+        """ Awaits a coroutine function unless a call for the same key is in flight, else awaits that call.
+
+        :param key: a key identifying the request.
+        :type key: tuple
+        :param function: a coroutine function which sends the request.
+        :type function: callable
+        :param timeout: the maximum number of seconds to wait for a call in flight, or None to wait until it
+            completes.
+        :type timeout: float
+        :return: the response.
+        :rtype: dict
+        :raises FixerioTimeout: if the call in flight doesn't complete within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        call = self._calls.get((loop, key))
+        leader = call is None
+        if leader:
+            call = self._calls[(loop, key)] = _AsyncCall(loop.create_task(function()))
+            call.task.add_done_callback(lambda task: self._finish((loop, key), call))
+
+        call.waiters += 1
+        try:
+            if leader:
+                return await asyncio.shield(call.task)
+            return _share(await asyncio.wait_for(asyncio.shield(call.task), timeout))
+        except asyncio.TimeoutError:
+            if leader:
+                raise
+            raise FixerioTimeout("The identical request in flight didn't complete before the deadline.")
+        except asyncio.CancelledError:
+            if call.waiters == 1:
+                # Callers arriving from now on send a new request rather than await the cancelled one.
+                self._finish((loop, key), call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _finish(self, key, call):
+        """ Forgets a call once its task is done or cancelled, so the next caller sends a new request.
+
+        :param key: the key of the call.
+        :type key: tuple
+        :param call: the call.
+        :type call: _AsyncCall
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Waiters may all be gone by the time the call fails, don't log the exception as never retrieved.
+        if call.task.done() and not call.task.cancelled():
+            call.task.exception()
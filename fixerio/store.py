@@ -0,0 +1,274 @@
+import datetime
+import sqlite3
+import threading
+from .cache import split_symbols
+
+DEFAULT_BASE = 'EUR'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS historical_rates (
+    date TEXT NOT NULL,
+    base TEXT NOT NULL,
+    timestamp INTEGER,
+    PRIMARY KEY (date, base)
+);
+CREATE TABLE IF NOT EXISTS historical_rate_values (
+    date TEXT NOT NULL,
+    base TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    rate REAL NOT NULL,
+    PRIMARY KEY (date, base, symbol)
+) WITHOUT ROWID;
+"""
+
+
+class HistoricalRatesStore(object):
+    """ A SQLite store of historical rates.
+
+    Rates for a past date never change, so each (date, base) row of all currencies is downloaded once and any
+    subset of its currencies is read from disk afterwards. The database is opened in WAL mode, so many
+    threads and processes can read it while one of them writes.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        """
+        :param path: the path of the SQLite database file.
+        :type path: str
+        :param timeout: the number of seconds to wait for another process's write lock.
+        :type timeout: int or float
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self):
+        """ Gets this thread's connection to the database, creating it and the schema on first use.
+
+        :return: a connection.
+        :rtype: sqlite3.Connection
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def close(self):
+        """ Closes the connections of all threads. """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
+
+    def has(self, date, base=None):
+        """ Checks if the rates of a date are stored.
+
+        :param date: the date of the rates.
+        :type date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :return: True if the rates are stored.
+        :rtype: bool
+        """
+        if isinstance(date, datetime.date):
+            date = date.isoformat()
+
+        row = self._connection().execute(
+            "SELECT 1 FROM historical_rates WHERE date = ? AND base = ?", (date, (base or DEFAULT_BASE).upper())
+        ).fetchone()
+
+        return row is not None
+
+    def dates(self, base=None):
+        """ Gets the dates with stored rates.
+
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :return: the stored dates in YYYY-MM-DD format.
+        :rtype: set
+        """
+        rows = self._connection().execute(
+            "SELECT date FROM historical_rates WHERE base = ?", ((base or DEFAULT_BASE).upper(),)
+        )
+
+        return {date for date, in rows}
+
+    def get(self, date, base=None, symbols=None):
+        """ Gets stored rates in the shape of a fixer.io historical rates response.
+
+        :param date: the date of the rates.
+        :type date: date or str (in YYYY-MM-DD format)
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param symbols: comma-separated currency codes to limit output currencies.
+        :type symbols: str or list or tuple
+        :return: the historical rates or None if they aren't stored.
+        :rtype: dict
+        """
+        if isinstance(date, datetime.date):
+            date = date.isoformat()
+
+        base = (base or DEFAULT_BASE).upper()
+        connection = self._connection()
+
+        row = connection.execute(
+            "SELECT timestamp FROM historical_rates WHERE date = ? AND base = ?", (date, base)
+        ).fetchone()
+        if row is None:
+            return None
+
+        query = "SELECT symbol, rate FROM historical_rate_values WHERE date = ? AND base = ?"
+        parameters = [date, base]
+
+        symbols = split_symbols(symbols)
+        if symbols is not None:
+            query += f" AND symbol IN ({','.join('?' * len(symbols))})"
+            parameters.extend(symbols)
+
+        return {
+            "success": True,
+            "historical": True,
+            "date": date,
+            "timestamp": row[0],
+            "base": base,
+            "rates": dict(connection.execute(query, parameters))
+        }
+
+    def put(self, response, date=None):
+        """ Stores the rates of a successful historical rates response for all currencies.
+        Responses for today or later are ignored, as they can still change.
+
+        :param response: a historical rates response without limited output currencies.
+        :type response: dict
+        :param date: the requested date, which defaults to the response's `date`.
+        :type date: date or str (in YYYY-MM-DD format)
+        :return: True if the rates are stored.
+        :rtype: bool
+        """
+        if not isinstance(response, dict) or not response.get('success') or not response.get('rates'):
+            return False
+
+        date = date or response.get('date')
+        if isinstance(date, datetime.date):
+            date = date.isoformat()
+
+        if date is None or date >= datetime.datetime.now(datetime.timezone.utc).date().isoformat():
+            return False
+
+        base = (response.get('base') or DEFAULT_BASE).upper()
+        self._insert(base, [(date, response.get('timestamp'), response['rates'])])
+
+        return True
+
+    def put_time_series(self, response):
+        """ Stores the rates of each past date of a successful time series response for all currencies.
+
+        :param response: a time series response without limited output currencies.
+        :type response: dict
+        :return: the number of dates stored.
+        :rtype: int
+        """
+        if not isinstance(response, dict) or not response.get('success') or not response.get('rates'):
+            return 0
+
+        today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        rows = [(date, None, rates) for date, rates in response['rates'].items() if date < today and rates]
+
+        self._insert((response.get('base') or DEFAULT_BASE).upper(), rows)
+
+        return len(rows)
+
+    def _insert(self, base, rows):
+        """ Inserts the rates of dates in a single transaction, keeping any rates already stored.
+
+        :param base: the three-letter currency code of the base currency.
+        :type base: str
+        :param rows: the date, timestamp and rates of each date.
+        :type rows: list of tuple
+        """
+        if not rows:
+            return
+
+        connection = self._connection()
+
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT OR IGNORE INTO historical_rates (date, base, timestamp) VALUES (?, ?, ?)",
+                ((date, base, timestamp) for date, timestamp, _ in rows)
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO historical_rate_values (date, base, symbol, rate) VALUES (?, ?, ?, ?)",
+                ((date, base, symbol, rate) for date, _, rates in rows for symbol, rate in rates.items())
+            )
+
+    def lookup(self, url, payload):
+        """ Looks a historical rates request up in the store.
+
+        :param url: the historical rates endpoint URL, which ends in the date.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :return: the stored rates or None if they aren't stored.
+        :rtype: dict
+        """
+        return self.get(url.rsplit('/', 1)[-1], base=payload.get('base'), symbols=payload.get('symbols'))
+
+    def lookup_stale(self, url, payload, max_stale=None):
+        """ Looks a historical rates request up in the store. Stored rates never expire, so this is `lookup`.
+
+        :param url: the historical rates endpoint URL, which ends in the date.
+        :type url: str
+        :param payload: the query parameters.
+        :type payload: dict
+        :param max_stale: unused, stored rates are never stale.
+        :type max_stale: int or float
+        :return: the stored rates or None if they aren't stored.
+        :rtype: dict
+        """
+        return self.lookup(url, payload)
+
+    def fetch_payload(self, url, payload):
+        """ Gets the query parameters to send when a date isn't stored, which request all currencies.
+
+        :param url: the historical rates endpoint URL.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :return: the query parameters to send.
+        :rtype: dict
+        """
+        return {key: value for key, value in payload.items() if key != 'symbols'}
+
+    def save(self, url, payload, response):
+        """ Stores the rates of all currencies and returns the requested ones.
+
+        :param url: the historical rates endpoint URL, which ends in the date.
+        :type url: str
+        :param payload: the query parameters of the request.
+        :type payload: dict
+        :param response: the response for all currencies.
+        :type response: dict
+        :return: the response for the request.
+        :rtype: dict
+        """
+        self.put(response, date=url.rsplit('/', 1)[-1])
+
+        symbols = split_symbols(payload.get('symbols'))
+        if symbols is not None and isinstance(response, dict) and isinstance(response.get('rates'), dict):
+            rates = response['rates']
+            response = dict(response, rates={symbol: rates[symbol] for symbol in symbols if symbol in rates})
+
+        return response
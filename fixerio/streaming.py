@@ -0,0 +1,140 @@
+import codecs
+import json
+import re
+
+from .exceptions import FixerioException
+
+# Number of bytes read from a streamed response at a time.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# The characters which can follow the digits decoded so far within one number, up to the end of the buffer.
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')
+
+# Parser states, by the next token expected.
+_START, _KEY, _COLON, _VALUE, _RATES_KEY, _RATES_COLON, _RATES_VALUE, _END = range(8)
+
+
+class TimeSeriesParser(object):
+    """ Parses a time series response incrementally, as its body arrives.
+
+    Each `{date: {currency: rate}}` entry of the rates is returned as a `(date, rates)` row as soon as it has
+    been read, and only the text of the row being read is buffered, so the memory needed doesn't grow with the
+    length of the response. The other fields of the response are kept in `fields`.
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._state = _START
+        self._key = None
+
+    def feed(self, data):
+        """ Parses the next part of the response body.
+
+        :param data: the next part of the body.
+        :type data: bytes or str
+        :return: the `(date, rates)` rows completed by the data, in the order of the response.
+        :rtype: list of tuple
+        :raises FixerioException: if the body isn't a time series response.
+        """
+        if isinstance(data, bytes):
+            data = self._text.decode(data)
+
+        buffer = self._buffer + data
+        rows = []
+        position = 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+
+            char = buffer[position]
+            state = self._state
+            if state == _START:
+                self._expect(char, '{')
+                self._state, position = _KEY, position + 1
+            elif state in (_KEY, _RATES_KEY) and char in ',}':
+                if char == '}':
+                    self._state = _KEY if state == _RATES_KEY else _END
+                position += 1
+            elif state in (_COLON, _RATES_COLON):
+                self._expect(char, ':')
+                self._state, position = _VALUE if state == _COLON else _RATES_VALUE, position + 1
+            elif state == _VALUE and self._key == 'rates' and char == '{':
+                self._state, position = _RATES_KEY, position + 1
+            elif state == _END:
+                raise FixerioException("Invalid time series response: unexpected data after the response.")
+            else:
+                decoded = self._decode(buffer, position)
+                if decoded is None:
+                    break
+                value, position = decoded
+
+                if state == _KEY:
+                    self._key, self._state = value, _COLON
+                elif state == _RATES_KEY:
+                    self._key, self._state = value, _RATES_COLON
+                elif state == _VALUE:
+                    self.fields[self._key] = value
+                    self._state = _KEY
+                else:
+                    rows.append((self._key, value))
+                    self._state = _RATES_KEY
+
+        self._buffer = buffer[position:]
+
+        return rows
+
+    def close(self):
+        """ Checks the whole response has been parsed and was successful.
+
+        :return: the fields of the response other than the rates.
+        :rtype: dict
+        :raises FixerioException: if the body ended early or the request was unsuccessful.
+        """
+        if self._state != _END or self._buffer.strip() or self._text.decode(b'', final=True).strip():
+            raise FixerioException("Invalid time series response: the response ended early.")
+
+        if not self.fields.get('success'):
+            raise FixerioException(f"Time series request failed: {self.fields.get('error')}")
+
+        return self.fields
+
+    def _decode(self, buffer, position):
+        """ Decodes the JSON value starting at a position of the buffer.
+
+        :param buffer: the unparsed text.
+        :type buffer: str
+        :param position: the start of the value.
+        :type position: int
+        :return: the value and the position after it, or None if the buffer ends before the value does.
+        :rtype: tuple
+        """
+        try:
+            value, end = self._decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            return None
+
+        # A number at the end of the buffer may continue in the next part of the body, even after a decimal point
+        # or exponent which the decoder stopped before.
+        if end == len(buffer) or (isinstance(value, (int, float)) and _NUMBER_TAIL.match(buffer, end)):
+            return None
+
+        return value, end
+
+    @staticmethod
+    def _expect(char, expected):
+        """ Checks the next character of the body.
+
+        :param char: the next character.
+        :type char: str
+        :param expected: the character the response should have.
+        :type expected: str
+        :raises FixerioException: if the characters differ.
+        """
+        if char != expected:
+            raise FixerioException(f"Invalid time series response: expected {expected!r} but got {char!r}.")
+
@@ -0,0 +1,84 @@
+import contextlib
+import contextvars
+import time
+
+from .exceptions import FixerioTimeout
+
+# Seconds to wait for a connection to fixer.io, and between bytes of its response.
+DEFAULT_TIMEOUT = (5, 30)
+
+_current = contextvars.ContextVar('fixerio_timeouts', default=None)
+
+
+class CallTimeouts(object):
+    """ The timeouts and deadline of the calls made in a :func:`timeouts` block. """
+    __slots__ = ('connect', 'read', 'expires_at')
+
+    def __init__(self, connect=None, read=None, expires_at=None):
+        """
+        :param connect: the number of seconds to wait for a connection, or None for the client's.
+        :type connect: float
+        :param read: the number of seconds to wait between bytes of a response, or None for the client's.
+        :type read: float
+        :param expires_at: the `time.monotonic` time by which calls must complete, or None for no deadline.
+        :type expires_at: float
+        """
+        self.connect = connect
+        self.read = read
+        self.expires_at = expires_at
+
+    def remaining(self):
+        """ Gets the time left until the deadline.
+
+        :return: the number of seconds left, or None if there is no deadline.
+        :rtype: float
+        :raises FixerioTimeout: if the deadline has passed.
+        """
+        if self.expires_at is None:
+            return None
+
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise FixerioTimeout("The call's deadline has passed.")
+
+        return remaining
+
+
+def current_timeouts():
+    """ Gets the timeouts of the innermost :func:`timeouts` block.
+
+    :return: the timeouts, or None outside of a block.
+    :rtype: CallTimeouts
+    """
+    return _current.get()
+
+
+@contextlib.contextmanager
+def timeouts(connect=None, read=None, deadline=None):
+    """ Sets the timeouts of every fixer.io call made in the block, in this thread or task.
+
+    A deadline bounds the whole call, including retries, waits for the quota and waits on identical or batched
+    requests of other callers; a call past it raises :class:`~fixerio.exceptions.FixerioTimeout`. In a nested
+    block, the earlier of the deadlines applies.
+
+    :param connect: the number of seconds to wait for a connection, or None for the client's.
+    :type connect: float
+    :param read: the number of seconds to wait between bytes of a response, or None for the client's.
+    :type read: float
+    :param deadline: the number of seconds, from now, by which calls must complete.
+    :type deadline: float
+    """
+    outer = _current.get()
+    expires_at = time.monotonic() + deadline if (deadline is not None) else None
+
+    if outer is not None:
+        connect = connect if (connect is not None) else outer.connect
+        read = read if (read is not None) else outer.read
+        if outer.expires_at is not None:
+            expires_at = outer.expires_at if (expires_at is None) else min(expires_at, outer.expires_at)
+
+    token = _current.set(CallTimeouts(connect, read, expires_at))
+    try:
+        yield
+    finally:
+        _current.reset(token)
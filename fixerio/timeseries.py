@@ -0,0 +1,99 @@
+import datetime
+
+# The longest time frame of a single time series request, in days.
+MAX_TIME_SERIES_DAYS = 365
+
+
+def to_date(value):
+    """ Converts a date string to a date.
+
+    :param value: a date.
+    :type value: date or str (in YYYY-MM-DD format)
+    :return: the date.
+    :rtype: date
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+
+    if isinstance(value, datetime.date):
+        return value
+
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def split_date_range(start_date, end_date, max_days=MAX_TIME_SERIES_DAYS):
+    """ Splits a date range into consecutive windows which span at most `max_days` days each.
+
+    :param start_date: the first date of the range.
+    :type start_date: date or str (in YYYY-MM-DD format)
+    :param end_date: the last date of the range.
+    :type end_date: date or str (in YYYY-MM-DD format)
+    :param max_days: the maximum number of days in a window.
+    :type max_days: int
+    :return: the first and last date of each window.
+    :rtype: list of tuple
+    """
+    start_date = to_date(start_date)
+    end_date = to_date(end_date)
+
+    windows = []
+    while start_date <= end_date:
+        window_end = min(start_date + datetime.timedelta(days=max_days - 1), end_date)
+        windows.append((start_date, window_end))
+        start_date = window_end + datetime.timedelta(days=1)
+
+    return windows
+
+
+def missing_ranges(start_date, end_date, dates):
+    """ Finds the consecutive date ranges between two dates which have no rates yet.
+
+    :param start_date: the first date of the range.
+    :type start_date: date or str (in YYYY-MM-DD format)
+    :param end_date: the last date of the range.
+    :type end_date: date or str (in YYYY-MM-DD format)
+    :param dates: the dates which have rates, in YYYY-MM-DD format.
+    :type dates: set
+    :return: the first and last date of each missing range.
+    :rtype: list of tuple
+    """
+    start_date = to_date(start_date)
+    end_date = to_date(end_date)
+
+    ranges = []
+    missing_start = None
+    day = start_date
+    while day <= end_date:
+        if day.isoformat() in dates:
+            if missing_start is not None:
+                ranges.append((missing_start, day - datetime.timedelta(days=1)))
+                missing_start = None
+        elif missing_start is None:
+            missing_start = day
+
+        day += datetime.timedelta(days=1)
+
+    if missing_start is not None:
+        ranges.append((missing_start, end_date))
+
+    return ranges
+
+
+def merge_time_series(responses):
+    """ Merges the time series responses of consecutive windows into one response.
+
+    :param responses: the responses of each window, in date order.
+    :type responses: list of dict
+    :return: a time series response for the whole range, or the first unsuccessful response.
+    :rtype: dict
+    """
+    for response in responses:
+        if not isinstance(response, dict) or not response.get('success'):
+            return response
+
+    rates = {}
+    for response in responses:
+        rates.update(response.get('rates', {}))
+
+    return dict(responses[0], start_date=responses[0].get('start_date'), end_date=responses[-1].get('end_date'),
+                rates=rates)
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+from fixerio.async_client import (aiohttp, AsyncFixerioClient, AsyncFreeClient, AsyncBasicClient,
+                                  AsyncProfessionalClient, AsyncProfessionalPlusClient)
+from fixerio.exceptions import FixerioException
+
+TIMEOUT = aiohttp.ClientTimeout(connect=5, sock_read=30) if aiohttp else None
+
+
+def mock_session(json_response=None):
+    session = MagicMock()
+    response = session.get.return_value.__aenter__.return_value
+    response.raise_for_status = MagicMock()
+    response.json = AsyncMock(return_value=json_response)
+    return session
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.access_key = 'your-access-key'
+
+    async def test_latest_url_and_payload(self):
+        session = mock_session({"success": True})
+        client = AsyncBasicClient(self.access_key, session=session)
+
+        result = await client.get_latest(symbols=["USD", "GBP"], base="CHF")
+
+        session.get.assert_called_with("https://data.fixer.io/api/latest",
+                                       params={"access_key": self.access_key, "symbols": "USD,GBP", "base": "CHF"},
+                                       timeout=TIMEOUT)
+        self.assertEqual(result, {"success": True})
+
+    async def test_free_client_uses_http(self):
+        session = mock_session()
+        client = AsyncFreeClient(self.access_key, session=session)
+
+        await client.get_symbols()
+
+        session.get.assert_called_with("http://data.fixer.io/api/symbols", params={"access_key": self.access_key},
+                                       timeout=TIMEOUT)
+
+    async def test_convert_payload(self):
+        session = mock_session()
+        client = AsyncProfessionalClient(self.access_key, session=session)
+
+        await client.convert_amount("USD", "GBP", 10, date="2020-01-01")
+
+        session.get.assert_called_with("https://data.fixer.io/api/convert",
+                                       params={"access_key": self.access_key, "from": "USD", "to": "GBP",
+                                               "amount": 10, "date": "2020-01-01"}, timeout=TIMEOUT)
+
+    async def test_fluctuation_payload(self):
+        session = mock_session()
+        client = AsyncProfessionalPlusClient(self.access_key, session=session)
+
+        await client.get_fluctuation("2020-01-01", "2020-02-01")
+
+        session.get.assert_called_with("https://data.fixer.io/api/fluctuation",
+                                       params={"access_key": self.access_key, "start_date": "2020-01-01",
+                                               "end_date": "2020-02-01"}, timeout=TIMEOUT)
+
+    async def test_requests_run_concurrently(self):
+        in_flight = []
+        max_in_flight = []
+
+        async def json_response(content_type=None):
+            in_flight.append(1)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return {}
+
+        session = mock_session()
+        session.get.return_value.__aenter__.return_value.json = json_response
+        client = AsyncBasicClient(self.access_key, session=session, coalesce=False)
+
+        await asyncio.gather(*(client.get_latest(base="USD") for _ in range(50)))
+
+        self.assertEqual(max(max_in_flight), 50)
+
+    async def test_client_error_raises_fixer_exception(self):
+        session = MagicMock()
+        session.get.side_effect = aiohttp.ClientError("Request failed")
+        client = AsyncFixerioClient(self.access_key, session=session)
+
+        with self.assertRaises(FixerioException):
+            await client._latest()
+
+    async def test_async_context_manager_closes_session(self):
+        async with AsyncFreeClient(self.access_key) as client:
+            session = client._get_session()
+
+        self.assertIsNone(client._session)
+        self.assertTrue(session.closed)
+
+    async def test_close_does_not_close_passed_session(self):
+        session = mock_session()
+        session.close = AsyncMock()
+        client = AsyncFreeClient(self.access_key, session=session)
+
+        await client.close()
+
+        session.close.assert_not_awaited()
+
+    def test_sync_context_manager_raises(self):
+        with self.assertRaises(TypeError):
+            with AsyncFreeClient(self.access_key):
+                pass
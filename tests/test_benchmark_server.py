@@ -0,0 +1,57 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import payloads
+from benchmarks.server import StandInServer
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.professional_plus_client import ProfessionalPlusClient
+
+
+class StandInServerTestCase(unittest.TestCase):
+
+    def test_answers_each_endpoint(self):
+        with StandInServer() as server, ProfessionalPlusClient("your-access-key") as client:
+            client.base_url = server.base_url
+
+            self.assertEqual(len(client.get_symbols()["symbols"]), payloads.CURRENCY_COUNT)
+            self.assertEqual(client.get_latest(symbols=["USD", "GBP"])["rates"].keys(), {"USD", "GBP"})
+            self.assertEqual(client.get_historical_rates("2023-09-26")["date"], "2023-09-26")
+            self.assertEqual(client.convert_amount("GBP", "USD", 25)["query"]["to"], "USD")
+            self.assertEqual(len(client.get_time_series("2023-09-01", "2023-09-30")["rates"]), 30)
+            self.assertIn("USD", client.get_fluctuation("2023-01-01", "2023-06-01")["rates"])
+
+            self.assertEqual(server.total_requests(), 6)
+            self.assertEqual(server.requests["historical"], 1)
+
+    def test_injects_errors(self):
+        with StandInServer(error_rate=1.0) as server, BasicClient("your-access-key") as client:
+            client.base_url = server.base_url
+
+            with self.assertRaises(FixerioException):
+                client.get_latest()
+
+    def test_unsuccessful_errors(self):
+        with StandInServer(error_rate=1.0, error_status=200) as server, BasicClient("your-access-key") as client:
+            client.base_url = server.base_url
+
+            self.assertFalse(client.get_latest()["success"])
+
+    def test_concurrent_connections_are_not_dropped(self):
+        def timed_call(client):
+            started = time.perf_counter()
+            client.get_latest()
+            return time.perf_counter() - started
+
+        with StandInServer(latency=0.05) as server:
+            # A client per thread, so each call opens its own connection.
+            clients = [BasicClient("your-access-key") for _ in range(64)]
+            for client in clients:
+                client.base_url = server.base_url
+            with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                latencies = list(executor.map(timed_call, clients))
+            for client in clients:
+                client.close()
+
+        self.assertLess(max(latencies), 1)
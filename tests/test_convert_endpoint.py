@@ -14,7 +14,7 @@ class FixerioConvertTestCase(unittest.TestCase):
         self.client = FixerioClient(self.access_key)
         self.expected_url = "http://data.fixer.io/api/convert"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_url(self, mock_requests_get):
         from_ccy = "USD"
         to_ccy = "EUR"
@@ -29,9 +29,9 @@ class FixerioConvertTestCase(unittest.TestCase):
 
         self.client._convert(from_ccy, to_ccy, amount)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_error_raises_fixer_exception(self, mock_requests_get):
         from_ccy = "USD"
         to_ccy = "EUR"
@@ -42,7 +42,7 @@ class FixerioConvertTestCase(unittest.TestCase):
         with self.assertRaises(FixerioException):
             self.client._convert(from_ccy, to_ccy, amount)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_date_in_payload(self, mock_requests_get):
         from_ccy = "USD"
         to_ccy = "EUR"
@@ -58,9 +58,9 @@ class FixerioConvertTestCase(unittest.TestCase):
 
         self.client._convert(from_ccy, to_ccy, amount, date=self.date_as_date)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_date_string_in_payload(self, mock_requests_get):
         from_ccy = "USD"
         to_ccy = "EUR"
@@ -76,4 +76,4 @@ class FixerioConvertTestCase(unittest.TestCase):
 
         self.client._convert(from_ccy, to_ccy, amount, date=self.date_as_str)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioTimeout
+from fixerio.hedging import HedgePolicy
+from fixerio.timeouts import current_timeouts, timeouts
+
+
+def funded_policy(initial_delay=0.05, **kwargs):
+    policy = HedgePolicy(initial_delay=initial_delay, budget=1, **kwargs)
+    policy.record(0.01)
+    return policy
+
+
+class FixerioHedgePolicyTestCase(unittest.TestCase):
+
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgePolicy(initial_delay=0.7, min_samples=3)
+        policy.record(0.1)
+        policy.record(0.2)
+
+        self.assertEqual(policy.delay(), 0.7)
+
+    def test_delay_is_percentile_of_latencies(self):
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0, max_delay=100)
+        for latency in range(1, 101):
+            policy.record(latency / 100)
+
+        self.assertEqual(policy.delay(), 0.91)
+
+    def test_delay_is_clamped(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0.2, max_delay=1)
+        policy.record(0.01)
+        self.assertEqual(policy.delay(), 0.2)
+
+        policy = HedgePolicy(min_samples=1, min_delay=0.2, max_delay=1)
+        policy.record(10)
+        self.assertEqual(policy.delay(), 1)
+
+    def test_budget_limits_hedges(self):
+        policy = HedgePolicy(budget=0.1, max_burst=2)
+        self.assertFalse(policy.try_hedge())
+
+        for _ in range(100):
+            policy.record(0.1)
+
+        self.assertTrue(policy.try_hedge())
+        self.assertTrue(policy.try_hedge())
+        self.assertFalse(policy.try_hedge())
+        self.assertEqual(policy.hedges, 2)
+
+
+class FixerioClientHedgingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = itertools.count()
+
+    def tearDown(self):
+        self.release.set()
+
+    def slow_first_get(self, url, params=None, timeout=None):
+        call = next(self.calls)
+        if call == 0:
+            self.release.wait(5)
+        response = MagicMock()
+        response.json.return_value = {"success": True, "call": call}
+        return response
+
+    @patch('requests.Session.get')
+    def test_second_request_wins_when_first_is_slow(self, mock_requests_get):
+        mock_requests_get.side_effect = self.slow_first_get
+        client = BasicClient("your-access-key", hedge=funded_policy(), quota=True)
+
+        started = time.monotonic()
+        response = client.get_latest()
+
+        self.assertEqual(response["call"], 1)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(client.quota.used, 2)
+        self.assertEqual(client.hedge.hedges, 1)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_fast_request_is_not_hedged(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True}
+        client = BasicClient("your-access-key", hedge=funded_policy())
+
+        client.get_latest()
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(client.hedge.hedges, 0)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_no_hedge_without_budget(self, mock_requests_get):
+        mock_requests_get.side_effect = self.slow_first_get
+        client = BasicClient("your-access-key", hedge=HedgePolicy(initial_delay=0.05))
+
+        threading.Timer(0.2, self.release.set).start()
+        response = client.get_latest()
+
+        self.assertEqual(response["call"], 0)
+        mock_requests_get.assert_called_once()
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_hedged_requests_keep_call_deadline(self, mock_requests_get):
+        seen = []
+
+        def blocking_get(url, params=None, timeout=None):
+            seen.append((current_timeouts(), timeout))
+            self.release.wait(5)
+            return MagicMock()
+
+        mock_requests_get.side_effect = blocking_get
+        client = BasicClient("your-access-key", hedge=funded_policy())
+
+        started = time.monotonic()
+        with self.assertRaises(FixerioTimeout):
+            with timeouts(read=0.5, deadline=0.3):
+                client.get_latest()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(seen), 2)
+        for call, (connect, read) in seen:
+            self.assertIsNotNone(call)
+            self.assertLessEqual(connect, 0.3)
+            self.assertLessEqual(read, 0.3)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_queued_request_is_not_hedged(self, mock_requests_get):
+        def get(url, params=None, timeout=None):
+            time.sleep(0.1)
+            response = MagicMock()
+            response.json.return_value = {"success": True}
+            return response
+
+        mock_requests_get.side_effect = get
+        client = BasicClient("your-access-key", hedge=funded_policy(initial_delay=0.15), pool_size=1)
+        # The only thread is busy for longer than the hedge delay before the request is sent.
+        client._get_hedge_executor().submit(time.sleep, 0.3)
+
+        client.get_latest()
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(client.hedge.hedges, 0)
+        client.close()
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientHedgingTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_second_request_wins_and_first_is_cancelled(self):
+        calls = itertools.count()
+        cancelled = []
+
+        async def json_response(content_type=None):
+            call = next(calls)
+            if call == 0:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(call)
+                    raise
+            return {"success": True, "call": call}
+
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.json = json_response
+        client = AsyncBasicClient("your-access-key", session=session, hedge=funded_policy())
+
+        result = await client.get_latest()
+
+        self.assertEqual(result["call"], 1)
+        self.assertEqual(cancelled, [0])
@@ -14,7 +14,7 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
         self.client = FixerioClient(self.access_key)
         self.expected_url = f"http://data.fixer.io/api/{self.date_as_str}"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_historical_rates_url_with_date(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key
@@ -22,9 +22,9 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
 
         self.client._historical_rates(self.date_as_date)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_historical_rates_url_with_date_string(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key
@@ -32,16 +32,16 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
 
         self.client._historical_rates(self.date_as_str)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_error_raises_fixer_exception(self, mock_requests_get):
         mock_requests_get.side_effect = requests.exceptions.RequestException("Request failed")
 
         with self.assertRaises(FixerioException):
             self.client._historical_rates(self.date_as_date)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbol_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
 
@@ -52,9 +52,9 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
 
         self.client._historical_rates(self.date_as_date, symbols=symbols)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_base_in_payload(self, mock_requests_get):
         base = "GBP"
 
@@ -65,9 +65,9 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
 
         self.client._historical_rates(self.date_as_date, base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbols_and_base_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
         base = "GBP"
@@ -80,4 +80,4 @@ class FixerioHistoricalRatesTestCase(unittest.TestCase):
 
         self.client._historical_rates(self.date_as_str, symbols=symbols, base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
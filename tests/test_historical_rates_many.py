@@ -0,0 +1,148 @@
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncFreeClient
+from fixerio.basic_client import BasicClient
+from fixerio.free_client import FreeClient
+
+
+def historical_response(date):
+    return {
+        "success": True,
+        "historical": True,
+        "date": date,
+        "timestamp": 1577923199,
+        "base": "EUR",
+        "rates": {"USD": 1.1, "GBP": 0.85}
+    }
+
+
+def mock_historical_response(url, params=None, timeout=None):
+    response = MagicMock()
+    response.json.return_value = historical_response(url.rsplit("/", 1)[1])
+    return response
+
+
+class FixerioHistoricalRatesManyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch('requests.Session.get')
+    def test_requests_each_date_once(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_historical_response
+        client = FreeClient("your-access-key")
+
+        responses = client.get_historical_rates_many(["2020-01-03", datetime.date(2020, 1, 1), "2020-01-03",
+                                                      "2020-01-01"])
+
+        self.assertEqual(list(responses), ["2020-01-03", "2020-01-01"])
+        self.assertEqual(responses["2020-01-01"]["date"], "2020-01-01")
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_cached_dates_are_not_requested(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_historical_response
+        client = BasicClient("your-access-key", historical_store=os.path.join(self.directory, "rates.sqlite"))
+        client.get_historical_rates("2020-01-01")
+
+        responses = client.get_historical_rates_many(["2020-01-01", "2020-01-02"], symbols=["USD"])
+        client.close()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        mock_requests_get.assert_called_with("https://data.fixer.io/api/2020-01-02",
+                                             params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(responses["2020-01-01"]["rates"], {"USD": 1.1})
+
+    @patch('requests.Session.get')
+    def test_requests_are_concurrent_up_to_max_workers(self, mock_requests_get):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def slow_response(url, params=None, timeout=None):
+            with lock:
+                running.append(url)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(url)
+            return mock_historical_response(url)
+
+        mock_requests_get.side_effect = slow_response
+        client = FreeClient("your-access-key", max_workers=3)
+
+        client.get_historical_rates_many(f"2020-01-{day:02}" for day in range(1, 10))
+
+        self.assertEqual(max(peak), 3)
+
+    @patch('requests.Session.get')
+    def test_repeated_calls_reuse_store_connections(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_historical_response
+        client = BasicClient("your-access-key", max_workers=3,
+                             historical_store=os.path.join(self.directory, "rates.sqlite"))
+
+        for month in range(1, 13):
+            client.get_historical_rates_many(f"2020-{month:02}-{day:02}" for day in range(1, 6))
+            client.sync_historical_rates(f"2021-{month:02}-01", f"2021-{month:02}-05")
+
+        # The calling thread's connection, and one for each of the client's threads.
+        self.assertLessEqual(len(client.historical_store._connections), 4)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_iter_yields_dates_as_they_arrive(self, mock_requests_get):
+        release = threading.Event()
+
+        def slow_first_date(url, params=None, timeout=None):
+            if url.endswith("2020-01-01"):
+                release.wait(5)
+            return mock_historical_response(url)
+
+        mock_requests_get.side_effect = slow_first_date
+        client = FreeClient("your-access-key")
+        rates = client.iter_historical_rates_many(["2020-01-01", "2020-01-02"])
+
+        first_date, _ = next(rates)
+        release.set()
+        second_date, response = next(rates)
+
+        self.assertEqual((first_date, second_date), ("2020-01-02", "2020-01-01"))
+        self.assertEqual(response["date"], "2020-01-01")
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncHistoricalRatesManyTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = MagicMock()
+        response = self.session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return historical_response(self.session.get.call_args.args[0].rsplit("/", 1)[1])
+
+        response.json = json_response
+
+    async def test_get_many(self):
+        client = AsyncFreeClient("your-access-key", session=self.session)
+
+        responses = await client.get_historical_rates_many(["2020-01-02", "2020-01-02"])
+
+        self.assertEqual(list(responses), ["2020-01-02"])
+        self.assertEqual(self.session.get.call_count, 1)
+
+    async def test_iter_many(self):
+        client = AsyncFreeClient("your-access-key", session=self.session, max_workers=1)
+
+        dates = [date async for date, _ in client.iter_historical_rates_many(["2020-01-02", "2020-01-03"])]
+
+        self.assertEqual(sorted(dates), ["2020-01-02", "2020-01-03"])
@@ -0,0 +1,172 @@
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from multiprocessing import Pool
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.store import HistoricalRatesStore
+
+
+def full_response(date="2020-01-02", base="EUR"):
+    return {
+        "success": True,
+        "historical": True,
+        "date": date,
+        "timestamp": 1577923199,
+        "base": base,
+        "rates": {"USD": 1.1, "GBP": 0.85, "JPY": 121.5, "CHF": 1.08}
+    }
+
+
+def read_rates(path):
+    return HistoricalRatesStore(path).get("2020-01-02", symbols="USD")["rates"]
+
+
+class FixerioHistoricalRatesStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "rates.sqlite")
+        self.store = HistoricalRatesStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_missing_date_returns_none(self):
+        self.assertIsNone(self.store.get("2020-01-02"))
+
+    def test_stores_full_row_and_reads_subset(self):
+        self.store.put(full_response())
+
+        response = self.store.get("2020-01-02", symbols=["usd", "GBP"])
+
+        self.assertEqual(response["rates"], {"USD": 1.1, "GBP": 0.85})
+        self.assertEqual(response["base"], "EUR")
+        self.assertEqual(response["date"], "2020-01-02")
+        self.assertTrue(response["historical"])
+
+    def test_reads_all_rates_without_symbols(self):
+        self.store.put(full_response())
+
+        self.assertEqual(self.store.get(datetime.date(2020, 1, 2))["rates"], full_response()["rates"])
+
+    def test_rows_are_keyed_on_base(self):
+        self.store.put(full_response(base="USD"))
+
+        self.assertIsNone(self.store.get("2020-01-02"))
+        self.assertTrue(self.store.has("2020-01-02", base="usd"))
+        self.assertEqual(self.store.dates(base="USD"), {"2020-01-02"})
+
+    def test_does_not_store_today(self):
+        today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+        self.assertFalse(self.store.put(full_response(date=today)))
+        self.assertIsNone(self.store.get(today))
+
+    def test_does_not_store_unsuccessful_responses(self):
+        self.assertFalse(self.store.put({"success": False, "error": {"code": 106}}))
+
+    def test_is_durable_across_instances(self):
+        self.store.put(full_response())
+
+        other_store = HistoricalRatesStore(self.path)
+
+        self.assertEqual(other_store.get("2020-01-02", symbols="JPY")["rates"], {"JPY": 121.5})
+        other_store.close()
+
+    def test_concurrent_readers(self):
+        self.store.put(full_response())
+        results = []
+
+        def read():
+            results.append(self.store.get("2020-01-02", symbols="USD")["rates"])
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with Pool(2) as pool:
+            results.extend(pool.map(read_rates, [self.path] * 4))
+
+        self.assertEqual(results, [{"USD": 1.1}] * 12)
+
+
+class FixerioHistoricalRatesStoreClientTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "rates.sqlite")
+        self.client = BasicClient("your-access-key", historical_store=self.path)
+
+    def tearDown(self):
+        self.client.close()
+        shutil.rmtree(self.directory)
+
+    @patch('requests.Session.get')
+    def test_fetches_all_currencies_once_and_answers_subsets(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = full_response()
+
+        first = self.client.get_historical_rates("2020-01-02", symbols=["USD"])
+        second = self.client.get_historical_rates("2020-01-02", symbols=["GBP", "JPY"])
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/2020-01-02",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(first["rates"], {"USD": 1.1})
+        self.assertEqual(second["rates"], {"GBP": 0.85, "JPY": 121.5})
+
+    @patch('requests.Session.get')
+    def test_other_base_is_fetched_separately(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = full_response()
+        self.client.get_historical_rates("2020-01-02")
+
+        mock_requests_get.return_value.json.return_value = full_response(base="USD")
+        self.client.get_historical_rates("2020-01-02", base="USD")
+        self.client.get_historical_rates("2020-01-02", base="USD", symbols=["GBP"])
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        mock_requests_get.assert_called_with("https://data.fixer.io/api/2020-01-02",
+                                             params={"access_key": "your-access-key", "base": "USD"}, timeout=(5, 30))
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientHistoricalStoreTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.session = MagicMock()
+        response = self.session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return full_response()
+
+        response.json = json_response
+        self.client = AsyncBasicClient("your-access-key", session=self.session,
+                                       historical_store=os.path.join(self.directory, "rates.sqlite"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    async def test_store_is_used_off_the_event_loop(self):
+        first = await self.client.get_historical_rates("2020-01-02", symbols=["USD"])
+        second = await self.client.get_historical_rates("2020-01-02", symbols=["GBP"])
+        store = self.client.historical_store
+
+        self.session.get.assert_called_once()
+        self.assertEqual((first["rates"], second["rates"]), ({"USD": 1.1}, {"GBP": 0.85}))
+        self.assertIsNone(getattr(store._local, 'connection', None))
+        self.assertGreaterEqual(len(store._connections), 1)
+        await self.client.close()
+
+    async def test_sync_historical_rates_off_the_event_loop(self):
+        await self.client.sync_historical_rates("2020-01-02", "2020-01-03")
+
+        self.assertIsNone(getattr(self.client.historical_store._local, 'connection', None))
+        await self.client.close()
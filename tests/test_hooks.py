@@ -0,0 +1,145 @@
+import datetime
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import requests
+
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.free_client import FreeClient
+from fixerio.hooks import HookChain, RequestHooks, chain_hooks
+from fixerio.professional_client import ProfessionalClient
+
+LATEST = {"success": True, "base": "EUR", "date": "2023-09-27", "rates": {"USD": 1.05, "GBP": 0.87}}
+LATEST_BODY = json.dumps(LATEST).encode('utf-8')
+
+
+class RecordingHooks(RequestHooks):
+
+    def __init__(self):
+        self.stages = []
+        self.calls = []
+
+    def on_payload(self, payload, seconds):
+        self.stages.append("payload")
+
+    def on_cache_lookup(self, url, payload, hit, seconds):
+        self.stages.append("cache_hit" if hit else "cache_miss")
+
+    def on_send(self, url, payload):
+        self.stages.append("send")
+
+    def on_first_byte(self, url, payload, seconds):
+        self.stages.append("first_byte")
+        self.calls.append(("first_byte", seconds))
+
+    def on_decode(self, url, payload, size, seconds):
+        self.stages.append("decode")
+        self.calls.append(("decode", size))
+
+    def on_complete(self, url, payload, seconds, error=None):
+        self.stages.append("complete")
+        self.calls.append(("complete", error))
+
+
+def mock_latest_response(url, params=None, timeout=None):
+    response = MagicMock()
+    response.json.return_value = LATEST
+    response.content = LATEST_BODY
+    response.elapsed = datetime.timedelta(milliseconds=25)
+    return response
+
+
+class FixerioHooksTestCase(unittest.TestCase):
+
+    def test_chain_hooks(self):
+        first, second = RecordingHooks(), RecordingHooks()
+
+        self.assertIsNone(chain_hooks(None))
+        self.assertIsNone(chain_hooks([]))
+        self.assertIs(chain_hooks(first), first)
+        self.assertIs(chain_hooks([first]), first)
+        self.assertIsInstance(chain_hooks([first, second]), HookChain)
+
+    def test_chain_calls_hooks_in_order(self):
+        order = []
+        first, second = MagicMock(), MagicMock()
+        first.on_send.side_effect = lambda url, payload: order.append("first")
+        second.on_send.side_effect = lambda url, payload: order.append("second")
+
+        HookChain([first, second]).on_send("http://data.fixer.io/api/latest", {})
+
+        self.assertEqual(order, ["first", "second"])
+
+
+class FixerioClientHooksTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_stages_of_a_request(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_latest_response
+        hooks = RecordingHooks()
+        client = BasicClient("your-access-key", hooks=hooks)
+
+        client.get_latest()
+
+        self.assertEqual(hooks.stages, ["payload", "send", "first_byte", "decode", "complete"])
+        self.assertEqual(hooks.calls, [("first_byte", 0.025), ("decode", len(LATEST_BODY)), ("complete", None)])
+
+    @patch('requests.Session.get')
+    def test_cache_lookups(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_latest_response
+        hooks = RecordingHooks()
+        client = BasicClient("your-access-key", latest_cache=True, hooks=hooks)
+
+        client.get_latest()
+        hooks.stages.clear()
+        client.get_latest()
+
+        self.assertEqual(hooks.stages, ["payload", "cache_hit", "complete"])
+
+    @patch('requests.Session.get')
+    def test_failed_call_completes_with_error(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        hooks = RecordingHooks()
+        client = FreeClient("your-access-key", hooks=hooks)
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+
+        self.assertEqual(hooks.stages, ["payload", "send", "complete"])
+        self.assertIsInstance(hooks.calls[-1][1], FixerioException)
+
+    @patch('requests.Session.get')
+    def test_streamed_time_series(self, mock_requests_get):
+        body = json.dumps({"success": True, "timeseries": True, "start_date": "2020-01-01",
+                           "end_date": "2020-01-02", "base": "EUR",
+                           "rates": {"2020-01-01": {"USD": 1.1}, "2020-01-02": {"USD": 1.2}}}).encode('utf-8')
+        mock_requests_get.return_value.iter_content.return_value = [body[:20], body[20:]]
+        hooks = RecordingHooks()
+        client = ProfessionalClient("your-access-key", hooks=hooks)
+
+        rows = list(client.iter_time_series("2020-01-01", "2020-01-02"))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(hooks.stages, ["payload", "send", "first_byte", "decode", "complete"])
+        self.assertEqual(hooks.calls[-2:], [("decode", len(body)), ("complete", None)])
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientHooksTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_stages_of_a_request(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.read = AsyncMock(return_value=LATEST_BODY)
+        response.json = AsyncMock(return_value=LATEST)
+        hooks = RecordingHooks()
+        client = AsyncBasicClient("your-access-key", session=session, hooks=[hooks])
+
+        self.assertEqual(await client.get_latest(), LATEST)
+
+        self.assertEqual(hooks.stages, ["payload", "send", "first_byte", "decode", "complete"])
+        self.assertEqual(hooks.calls[1:], [("decode", len(LATEST_BODY)), ("complete", None)])
@@ -0,0 +1,93 @@
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.decoding import fastest_loads, orjson, stdlib_loads
+from fixerio.exceptions import FixerioException
+
+LATEST = {"success": True, "base": "EUR", "rates": {"USD": 1.1, "GBP": 0.85}}
+
+
+class FixerioDecodingTestCase(unittest.TestCase):
+
+    def test_stdlib_loads_bytes(self):
+        self.assertEqual(stdlib_loads(json.dumps(LATEST).encode('utf-8')), LATEST)
+
+    def test_fastest_loads(self):
+        self.assertIs(fastest_loads(), orjson.loads if orjson is not None else stdlib_loads)
+
+
+class FixerioClientJsonDecoderTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_decodes_body_bytes(self, mock_requests_get):
+        mock_requests_get.return_value.content = json.dumps(LATEST).encode('utf-8')
+        decoder = MagicMock(side_effect=json.loads)
+        client = BasicClient("your-access-key", json_decoder=decoder)
+
+        response = client.get_latest()
+
+        self.assertEqual(response, LATEST)
+        decoder.assert_called_once_with(json.dumps(LATEST).encode('utf-8'))
+        mock_requests_get.return_value.json.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_fastest_decoder(self, mock_requests_get):
+        mock_requests_get.return_value.content = json.dumps(LATEST).encode('utf-8')
+        client = BasicClient("your-access-key", json_decoder=True)
+
+        self.assertIs(client.json_decoder, fastest_loads())
+        self.assertEqual(client.get_latest(), LATEST)
+
+    @patch('requests.Session.get')
+    def test_decoded_by_requests_by_default(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = LATEST
+
+        self.assertEqual(BasicClient("your-access-key").get_latest(), LATEST)
+
+    @patch('requests.Session.get')
+    def test_invalid_json_raises_fixer_exception(self, mock_requests_get):
+        mock_requests_get.return_value.content = b'<html>Bad Gateway</html>'
+        client = BasicClient("your-access-key", json_decoder=True)
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientJsonDecoderTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_decodes_body_bytes(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.read = AsyncMock(return_value=json.dumps(LATEST).encode('utf-8'))
+        client = AsyncBasicClient("your-access-key", session=session, json_decoder=True)
+
+        self.assertEqual(await client.get_latest(), LATEST)
+        response.json.assert_not_called()
+
+    async def test_invalid_json_raises_fixer_exception(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.read = AsyncMock(return_value=b'<html>Bad Gateway</html>')
+        response.json = AsyncMock(side_effect=json.JSONDecodeError("Expecting value", "<html>", 0))
+
+        for decoder in (None, True):
+            client = AsyncBasicClient("your-access-key", session=session, json_decoder=decoder)
+            with self.assertRaises(FixerioException):
+                await client.get_latest()
+
+    async def test_invalid_json_is_recorded_as_error(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.read = AsyncMock(return_value=b'<html>Bad Gateway</html>')
+        client = AsyncBasicClient("your-access-key", session=session, json_decoder=True, metrics=True)
+
+        with self.assertRaises(FixerioException):
+            await client.get_latest()
+
+        self.assertEqual(client.metrics.as_dict()["basic"]["latest"]["errors"], 1)
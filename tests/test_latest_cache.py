@@ -0,0 +1,136 @@
+import time
+import unittest
+from unittest.mock import patch
+from fixerio.cache import TTLCache, payload_key
+from fixerio.free_client import FreeClient
+from fixerio.basic_client import BasicClient
+from fixerio.professional_client import ProfessionalClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+
+
+class FixerioPayloadKeyTestCase(unittest.TestCase):
+
+    def test_symbols_order_and_case_do_not_change_key(self):
+        url = "http://data.fixer.io/api/latest"
+
+        key = payload_key(url, {"access_key": "a", "symbols": "USD,GBP", "base": "eur"})
+        other_key = payload_key(url, {"access_key": "b", "base": "EUR", "symbols": "gbp,USD"})
+
+        self.assertEqual(key, other_key)
+
+    def test_different_symbols_change_key(self):
+        url = "http://data.fixer.io/api/latest"
+
+        self.assertNotEqual(payload_key(url, {"symbols": "USD"}), payload_key(url, {"symbols": "USD,GBP"}))
+
+    def test_different_urls_change_key(self):
+        self.assertNotEqual(payload_key("http://data.fixer.io/api/latest", {}),
+                            payload_key("http://data.fixer.io/api/symbols", {}))
+
+
+class FixerioTTLCacheTestCase(unittest.TestCase):
+
+    def test_returns_cached_response(self):
+        cache = TTLCache(60)
+        response = {"success": True, "timestamp": time.time(), "rates": {"USD": 1.1}}
+
+        cache.set("key", response)
+
+        self.assertEqual(cache.get("key"), response)
+
+    def test_returns_copy_of_cached_response(self):
+        cache = TTLCache(60)
+        cache.set("key", {"success": True, "rates": {"USD": 1.1}})
+
+        cache.get("key")["rates"]["USD"] = 2.0
+
+        self.assertEqual(cache.get("key")["rates"]["USD"], 1.1)
+
+    def test_response_expires_at_next_update_after_timestamp(self):
+        cache = TTLCache(60)
+
+        with patch('time.time', return_value=1010):
+            cache.set("key", {"success": True, "timestamp": 1000, "rates": {}})
+
+        with patch('time.time', return_value=1059):
+            self.assertIsNotNone(cache.get("key"))
+
+        with patch('time.time', return_value=1060):
+            self.assertIsNone(cache.get("key"))
+
+    def test_late_update_is_kept_for_min_ttl(self):
+        cache = TTLCache(60, min_ttl=5)
+
+        with patch('time.time', return_value=2000):
+            cache.set("key", {"success": True, "timestamp": 1000, "rates": {}})
+
+        with patch('time.time', return_value=2004):
+            self.assertIsNotNone(cache.get("key"))
+
+        with patch('time.time', return_value=2005):
+            self.assertIsNone(cache.get("key"))
+
+    def test_does_not_cache_unsuccessful_responses(self):
+        cache = TTLCache(60)
+
+        cache.set("key", {"success": False, "error": {"code": 104}})
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(60, maxsize=2)
+        cache.set("a", {"success": True})
+        cache.set("b", {"success": True})
+
+        cache.get("a")
+        cache.set("c", {"success": True})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(len(cache), 2)
+
+
+class FixerioLatestCacheTestCase(unittest.TestCase):
+
+    def test_cache_ttl_defaults_to_plan_refresh_interval(self):
+        self.assertEqual(FreeClient("key", latest_cache=True).latest_cache.ttl, 3600)
+        self.assertEqual(BasicClient("key", latest_cache=True).latest_cache.ttl, 3600)
+        self.assertEqual(ProfessionalClient("key", latest_cache=True).latest_cache.ttl, 600)
+        self.assertEqual(ProfessionalPlusClient("key", latest_cache=True).latest_cache.ttl, 60)
+
+    def test_cache_is_disabled_by_default(self):
+        self.assertIsNone(BasicClient("key").latest_cache)
+
+    @patch('requests.Session.get')
+    def test_get_latest_is_served_from_cache(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {
+            "success": True, "timestamp": time.time(), "base": "EUR", "rates": {"USD": 1.1, "GBP": 0.9}
+        }
+        client = BasicClient("key", latest_cache=True)
+
+        first = client.get_latest(symbols=["USD", "GBP"])
+        second = client.get_latest(symbols=["gbp", "usd"])
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(first, second)
+
+    @patch('requests.Session.get')
+    def test_different_base_is_not_served_from_cache(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "timestamp": time.time(), "rates": {}}
+        client = BasicClient("key", latest_cache=True)
+
+        client.get_latest(base="USD")
+        client.get_latest(base="GBP")
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_other_endpoints_are_not_cached(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "timestamp": time.time(), "rates": {}}
+        client = BasicClient("key", latest_cache=True)
+
+        client.get_historical_rates("2020-01-01")
+        client.get_historical_rates("2020-01-01")
+
+        self.assertEqual(mock_requests_get.call_count, 2)
@@ -11,7 +11,7 @@ class FixerioLatestTestCase(unittest.TestCase):
         self.client = FixerioClient(self.access_key)
         self.expected_url = "http://data.fixer.io/api/latest"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_url(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key
@@ -19,16 +19,16 @@ class FixerioLatestTestCase(unittest.TestCase):
 
         self.client._latest()
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_error_raises_fixer_exception(self, mock_requests_get):
         mock_requests_get.side_effect = requests.exceptions.RequestException("Request failed")
 
         with self.assertRaises(FixerioException):
             self.client._latest()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbol_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
 
@@ -39,9 +39,9 @@ class FixerioLatestTestCase(unittest.TestCase):
 
         self.client._latest(symbols=symbols)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_base_in_payload(self, mock_requests_get):
         base = "GBP"
 
@@ -52,9 +52,9 @@ class FixerioLatestTestCase(unittest.TestCase):
 
         self.client._latest(base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbols_and_base_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
         base = "GBP"
@@ -67,4 +67,4 @@ class FixerioLatestTestCase(unittest.TestCase):
 
         self.client._latest(symbols=symbols, base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
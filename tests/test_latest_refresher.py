@@ -0,0 +1,211 @@
+import asyncio
+import itertools
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.cache import TTLCache
+from fixerio.hooks import RequestHooks
+from fixerio.professional_plus_client import ProfessionalPlusClient
+from fixerio.refresher import LatestRatesRefresher
+
+
+def latest_response(usd=1.1):
+    return {"success": True, "timestamp": time.time(), "base": "EUR", "date": "2023-09-27",
+            "rates": {"USD": usd, "GBP": 0.85}}
+
+
+def expire(cache, seconds_ago):
+    """ Makes every cached response expire `seconds_ago` seconds ago. """
+    for key, (_, response) in list(cache._entries.items()):
+        cache._entries[key] = (time.time() - seconds_ago, response)
+
+
+class ErrorHooks(RequestHooks):
+
+    def __init__(self):
+        self.errors = []
+
+    def on_complete(self, url, payload, seconds, error=None):
+        if error is not None:
+            self.errors.append(error)
+
+
+def failing_twice(response):
+    """ Answers the first call, fails the next two with an error the client doesn't wrap, then answers. """
+    calls = itertools.count()
+
+    def json_response(*args, **kwargs):
+        if next(calls) in (1, 2):
+            raise RuntimeError("Unexpected error")
+        return response()
+
+    return json_response
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class LatestRatesRefresherTestCase(unittest.TestCase):
+
+    def test_next_refresh_follows_rate_updates(self):
+        refresher = LatestRatesRefresher(interval=600)
+        refresher._configure(3600)
+
+        self.assertAlmostEqual(refresher._next_wait([{"timestamp": time.time() - 400}], False), 200, delta=1)
+        self.assertEqual(refresher._next_wait([{"timestamp": time.time() - 900}], False), 60)
+        self.assertEqual(refresher._next_wait([], True), 60)
+        self.assertEqual(refresher.max_stale, 600)
+
+    def test_stale_lookup_within_max_stale(self):
+        cache = TTLCache(60)
+        cache.set("key", latest_response())
+        expire(cache, 30)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNotNone(cache.get("key", stale=True, max_stale=60))
+        self.assertIsNone(cache.get("key", stale=True, max_stale=10))
+
+
+class FixerioClientLatestRefresherTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_watched_rates_are_refreshed_in_background(self, mock_requests_get):
+        mock_requests_get.return_value.json.side_effect = lambda: latest_response()
+        client = ProfessionalPlusClient("your-access-key", refresh_latest=LatestRatesRefresher(interval=0.02))
+
+        client.watch_latest(symbols=["USD"])
+
+        self.assertTrue(wait_for(lambda: mock_requests_get.call_count >= 3))
+        client.close()
+        calls = mock_requests_get.call_count
+        time.sleep(0.05)
+        self.assertEqual(mock_requests_get.call_count, calls)
+
+    @patch('requests.Session.get')
+    def test_expired_rates_are_served_while_refreshing(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.1)
+        client = BasicClient("your-access-key", refresh_latest=True)
+        client.watch_latest()
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.2)
+        expire(client.latest_cache, 10)
+
+        response = client.get_latest()
+
+        self.assertEqual(response["rates"]["USD"], 1.1)
+        self.assertTrue(wait_for(lambda: client.get_latest()["rates"]["USD"] == 1.2))
+        self.assertEqual(mock_requests_get.call_count, 2)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_too_stale_rates_are_requested(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.1)
+        client = BasicClient("your-access-key", refresh_latest=LatestRatesRefresher(max_stale=60))
+        client.watch_latest()
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.2)
+        expire(client.latest_cache, 120)
+
+        self.assertEqual(client.get_latest()["rates"]["USD"], 1.2)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_unwatched_rates_are_not_served_stale(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.1)
+        client = BasicClient("your-access-key", refresh_latest=True)
+        client.get_latest()
+        mock_requests_get.return_value.json.return_value = latest_response(usd=1.2)
+        expire(client.latest_cache, 10)
+
+        self.assertEqual(client.get_latest()["rates"]["USD"], 1.2)
+        self.assertFalse(client.refresher.running())
+
+    @patch('requests.Session.get')
+    def test_unwatch(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response()
+        client = BasicClient("your-access-key", refresh_latest=True)
+        client.watch_latest(symbols=["USD"])
+
+        client.unwatch_latest(symbols=["USD"])
+
+        self.assertEqual(client.refresher.requests(), [])
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_rebased_watches_share_one_request(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response()
+        client = BasicClient("your-access-key", refresh_latest=True, rebase=True)
+
+        client.watch_latest(base="USD")
+        client.watch_latest(base="GBP", symbols=["USD"])
+
+        self.assertEqual(len(client.refresher.requests()), 1)
+        self.assertEqual(mock_requests_get.call_count, 1)
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_refreshes_continue_after_unexpected_errors(self, mock_requests_get):
+        mock_requests_get.return_value.json.side_effect = failing_twice(latest_response)
+        hooks = ErrorHooks()
+        client = BasicClient("your-access-key", hooks=hooks,
+                             refresh_latest=LatestRatesRefresher(interval=0.02, retry_interval=0.01))
+
+        client.watch_latest()
+
+        self.assertTrue(wait_for(lambda: mock_requests_get.call_count >= 5))
+        self.assertTrue(client.refresher.running())
+        self.assertEqual([str(error) for error in hooks.errors], ["Unexpected error"] * 2)
+        client.close()
+
+    def test_watch_needs_refresher(self):
+        with self.assertRaises(ValueError):
+            BasicClient("your-access-key").watch_latest()
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientLatestRefresherTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_watched_rates_are_refreshed_in_background(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return latest_response()
+
+        response.json = json_response
+        client = AsyncBasicClient("your-access-key", session=session,
+                                  refresh_latest=LatestRatesRefresher(interval=0.02))
+
+        await client.watch_latest()
+        await asyncio.sleep(0.1)
+        await client.close()
+
+        self.assertGreaterEqual(session.get.call_count, 3)
+        self.assertFalse(client.refresher.running())
+
+    async def test_refreshes_continue_after_unexpected_errors(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        failing = failing_twice(latest_response)
+
+        async def json_response(content_type=None):
+            return failing()
+
+        response.json = json_response
+        hooks = ErrorHooks()
+        client = AsyncBasicClient("your-access-key", session=session, hooks=hooks,
+                                  refresh_latest=LatestRatesRefresher(interval=0.02, retry_interval=0.01))
+
+        await client.watch_latest()
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(client.refresher.running())
+        self.assertGreaterEqual(session.get.call_count, 5)
+        self.assertEqual(len(hooks.errors), 2)
+        await client.close()
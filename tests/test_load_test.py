@@ -0,0 +1,39 @@
+import contextlib
+import io
+import unittest
+
+from benchmarks.load_test import SYMBOLS, main, parse_mix, plan_calls
+
+
+class LoadTestTestCase(unittest.TestCase):
+
+    def test_parse_mix(self):
+        self.assertEqual(parse_mix("latest=3,historical"), {"latest": 3.0, "historical": 1.0})
+        with self.assertRaises(ValueError):
+            parse_mix("symbols=1")
+
+    def test_plans_are_reproducible(self):
+        weights = parse_mix("latest=1,convert=1,historical=1")
+
+        self.assertEqual(plan_calls(weights, 20, 5, seed=1), plan_calls(weights, 20, 5, seed=1))
+        self.assertEqual({kind for kind, _, _, _ in plan_calls(weights, 50, 5, seed=1)},
+                         {"latest", "convert", "historical"})
+
+    def test_reports_amplification(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main(["--workers", "4", "--calls", "5", "--latency", "0", "--jitter", "0", "--latest-cache",
+                  "--mix", "latest=1"])
+
+        # With the latest cache, each of the currency lists is requested at most once for the 20 calls.
+        amplification = float(output.getvalue().split("amplification: ")[1].split()[0])
+        self.assertLessEqual(amplification, len(SYMBOLS) / 20)
+
+    def test_no_outliers_at_high_concurrency(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main(["--workers", "64", "--calls", "5", "--no-coalesce", "--seed", "2"])
+
+        # Connects the server dropped would be retried after a second or more, and show up as outliers.
+        all_calls = next(line for line in output.getvalue().splitlines() if line.startswith("all "))
+        self.assertLess(float(all_calls.split()[-1]), 1000)
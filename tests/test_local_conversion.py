@@ -0,0 +1,136 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from fixerio.basic_client import BasicClient
+from fixerio.convert import convert, convert_many, np
+from fixerio.exceptions import FixerioException
+from fixerio.professional_client import ProfessionalClient
+
+
+def eur_response(date="2023-09-27"):
+    return {
+        "success": True,
+        "timestamp": time.time(),
+        "base": "EUR",
+        "date": date,
+        "rates": {"USD": 1.25, "GBP": 0.8, "JPY": 150.0}
+    }
+
+
+class FixerioConvertTestCase(unittest.TestCase):
+
+    def test_converts_with_cross_rate(self):
+        result = convert(eur_response(), "GBP", "USD", 8)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["query"], {"from": "GBP", "to": "USD", "amount": 8})
+        self.assertEqual(result["info"]["rate"], 1.5625)
+        self.assertEqual(result["result"], 12.5)
+        self.assertEqual(result["date"], "2023-09-27")
+        self.assertNotIn("historical", result)
+
+    def test_converts_from_base_currency(self):
+        self.assertEqual(convert(eur_response(), "EUR", "JPY", 2)["result"], 300.0)
+
+    def test_historical_conversion(self):
+        self.assertTrue(convert(eur_response(), "USD", "GBP", 1, date="2023-09-27")["historical"])
+
+    def test_unknown_currencies_return_errors(self):
+        self.assertEqual(convert(eur_response(), "XXX", "USD", 1)["error"]["code"], 401)
+        self.assertEqual(convert(eur_response(), "USD", "XXX", 1)["error"]["code"], 402)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class FixerioConvertManyTestCase(unittest.TestCase):
+
+    def test_converts_many_amounts(self):
+        results = convert_many({None: eur_response()}, ["GBP", "EUR", "usd"], ["USD", "JPY", "EUR"], [8, 2, 5])
+
+        np.testing.assert_allclose(results, [12.5, 300.0, 4.0])
+
+    def test_unknown_currencies_are_nan(self):
+        results = convert_many({None: eur_response()}, ["XXX", "USD"], ["USD", "YYY"], [1, 1])
+
+        self.assertTrue(np.isnan(results).all())
+
+    def test_converts_with_rates_of_each_date(self):
+        responses = {
+            "2020-01-01": eur_response("2020-01-01"),
+            "2020-01-02": dict(eur_response("2020-01-02"), rates={"USD": 2.5})
+        }
+
+        results = convert_many(responses, ["EUR", "EUR", "EUR"], ["USD", "USD", "USD"], [1, 1, 2],
+                               dates=["2020-01-01", "2020-01-02", "2020-01-01"])
+
+        np.testing.assert_allclose(results, [1.25, 2.5, 2.5])
+
+
+class FixerioLocalConversionClientTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch('requests.Session.get')
+    def test_convert_amount_uses_cached_latest_rates(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = eur_response()
+        client = BasicClient("your-access-key", latest_cache=True, local_conversion=True)
+
+        first = client.convert_amount("GBP", "USD", 8)
+        second = client.convert_amount("USD", "JPY", 1)
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(first["result"], 12.5)
+        self.assertEqual(second["result"], 120.0)
+
+    @patch('requests.Session.get')
+    def test_convert_amount_uses_historical_rates(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = dict(eur_response("2020-01-02"), historical=True)
+        client = ProfessionalClient("your-access-key", local_conversion=True,
+                                    historical_store=os.path.join(self.directory, "rates.sqlite"))
+
+        client.convert_amount("GBP", "USD", 8, date="2020-01-02")
+        result = client.convert_amount("GBP", "JPY", 8, date="2020-01-02")
+        client.close()
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/2020-01-02",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(result["result"], 1500.0)
+        self.assertTrue(result["historical"])
+
+    @patch('requests.Session.get')
+    def test_convert_amount_requests_conversion_by_default(self, mock_requests_get):
+        client = BasicClient("your-access-key")
+
+        client.convert_amount("GBP", "USD", 8)
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/convert",
+                                                  params={"access_key": "your-access-key", "from": "GBP",
+                                                          "to": "USD", "amount": 8}, timeout=(5, 30))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    @patch('requests.Session.get')
+    def test_convert_amounts_requests_rates_once_per_date(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = eur_response()
+        client = ProfessionalClient("your-access-key")
+
+        results = client.convert_amounts(["GBP"] * 1000, ["USD"] * 1000, np.arange(1000),
+                                         dates=["2020-01-01", "2020-01-02"] * 500)
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        np.testing.assert_allclose(results, np.arange(1000) * 1.5625)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    @patch('requests.Session.get')
+    def test_convert_amounts_raises_on_unsuccessful_rates(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": False, "error": {"code": 104}}
+        client = ProfessionalClient("your-access-key")
+
+        with self.assertRaises(FixerioException):
+            client.convert_amounts(["GBP"], ["USD"], [1])
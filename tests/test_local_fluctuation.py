@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.fluctuation import fluctuation, np
+from fixerio.free_client import FreeClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+from fixerio.rate_matrix import RateMatrix
+
+
+def historical_response(date, usd, gbp):
+    return {
+        "success": True,
+        "historical": True,
+        "date": date,
+        "timestamp": 1577923199,
+        "base": "EUR",
+        "rates": {"USD": usd, "GBP": gbp}
+    }
+
+
+def mock_historical_response(url, params=None, timeout=None):
+    response = MagicMock()
+    if url.endswith("2020-01-01"):
+        response.json.return_value = historical_response("2020-01-01", 1.0, 0.5)
+    else:
+        response.json.return_value = historical_response("2020-01-31", 1.5, 0.4)
+    return response
+
+
+class FixerioFluctuationTestCase(unittest.TestCase):
+
+    def test_fluctuation_response_shape(self):
+        response = fluctuation(historical_response("2020-01-01", 1.0, 0.5), historical_response("2020-01-31", 1.5, 0.4))
+
+        self.assertEqual(response["start_date"], "2020-01-01")
+        self.assertEqual(response["end_date"], "2020-01-31")
+        self.assertEqual(response["base"], "EUR")
+        self.assertTrue(response["fluctuation"])
+        self.assertEqual(response["rates"]["USD"], {"start_rate": 1.0, "end_rate": 1.5, "change": 0.5,
+                                                    "change_pct": 50.0})
+
+    def test_fluctuation_for_other_base(self):
+        response = fluctuation(historical_response("2020-01-01", 1.0, 0.5), historical_response("2020-01-31", 1.5, 0.4),
+                               symbols=["GBP"], base="USD")
+
+        self.assertEqual(response["base"], "USD")
+        self.assertEqual(list(response["rates"]), ["GBP"])
+        self.assertAlmostEqual(response["rates"]["GBP"]["end_rate"], 0.4 / 1.5)
+
+    def test_unsuccessful_response_is_returned(self):
+        error = {"success": False, "error": {"code": 104}}
+
+        self.assertIs(fluctuation(error, historical_response("2020-01-31", 1.5, 0.4)), error)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class FixerioRateMatrixFluctuationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = RateMatrix.from_time_series({
+            "success": True,
+            "base": "EUR",
+            "rates": {
+                "2020-01-01": {"USD": 1.0, "GBP": 0.5},
+                "2020-01-02": {"USD": 2.0, "GBP": 0.4},
+                "2020-01-03": {"USD": 4.0, "GBP": 0.25}
+            }
+        })
+
+    def test_many_windows_in_one_pass(self):
+        responses = self.matrix.fluctuations([("2020-01-01", "2020-01-02"), ("2020-01-01", "2020-01-03"),
+                                              ("2020-01-02", "2020-01-03")])
+
+        self.assertEqual([response["rates"]["USD"]["change_pct"] for response in responses], [100.0, 300.0, 100.0])
+        self.assertEqual(responses[1]["rates"]["GBP"], {"start_rate": 0.5, "end_rate": 0.25, "change": -0.25,
+                                                        "change_pct": -50.0})
+        self.assertEqual(responses[2]["start_date"], "2020-01-02")
+
+    def test_date_without_rates_uses_earlier_date(self):
+        response = self.matrix.fluctuations([("2020-01-01", "2020-01-10")])[0]
+
+        self.assertEqual(response["rates"]["USD"]["end_rate"], 4.0)
+
+    def test_window_before_rates_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.matrix.fluctuations([("2019-12-31", "2020-01-02")])
+
+
+class FixerioComputeFluctuationClientTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch('requests.Session.get')
+    def test_free_client_computes_fluctuation_from_historical_rates(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_historical_response
+        client = FreeClient("your-access-key", historical_store=os.path.join(self.directory, "rates.sqlite"))
+
+        response = client.compute_fluctuation("2020-01-01", "2020-01-31", symbols=["GBP"], base="USD")
+        client.compute_fluctuation("2020-01-01", "2020-01-31")
+        client.close()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        mock_requests_get.assert_any_call("http://data.fixer.io/api/2020-01-01",
+                                          params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(response["base"], "USD")
+        self.assertAlmostEqual(response["rates"]["GBP"]["change"], 0.4 / 1.5 - 0.5)
+
+    @patch('requests.Session.get')
+    def test_does_not_call_fluctuation_endpoint(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_historical_response
+        client = ProfessionalPlusClient("your-access-key")
+
+        client.compute_fluctuation("2020-01-01", "2020-01-31")
+
+        for call in mock_requests_get.call_args_list:
+            self.assertNotIn("fluctuation", call.args[0])
@@ -0,0 +1,150 @@
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import requests
+
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.free_client import FreeClient
+from fixerio.metrics import Histogram, MetricsRegistry, endpoint_name
+
+LATEST = {"success": True, "base": "EUR", "date": "2023-09-27", "rates": {"USD": 1.05, "GBP": 0.87}}
+LATEST_BODY = json.dumps(LATEST).encode('utf-8')
+
+
+def mock_latest_response(url, params=None, timeout=None):
+    response = MagicMock()
+    response.json.return_value = LATEST
+    response.content = LATEST_BODY
+    return response
+
+
+class FixerioMetricsRegistryTestCase(unittest.TestCase):
+
+    def test_endpoint_name(self):
+        self.assertEqual(endpoint_name("http://data.fixer.io/api/latest"), "latest")
+        self.assertEqual(endpoint_name("https://data.fixer.io/api/timeseries"), "timeseries")
+        self.assertEqual(endpoint_name("http://data.fixer.io/api/2020-01-01"), "historical")
+
+    def test_histogram_buckets(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative_counts(), [(0.1, 2), (1.0, 3), (float("inf"), 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 3.65)
+
+    def test_as_dict(self):
+        registry = MetricsRegistry(buckets=(1.0,))
+        registry.record_request("free", "latest", 0.5, size=100, decode_seconds=0.01)
+        registry.record_request("free", "latest", 2.0, error=True)
+        registry.record_cache("free", "latest", True)
+        registry.record_cache("free", "latest", False)
+
+        metrics = registry.as_dict()["free"]["latest"]
+
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["errors"], 1)
+        self.assertEqual(metrics["response_bytes"], 100)
+        self.assertEqual(metrics["latency"]["buckets"], {1.0: 1, float("inf"): 2})
+        self.assertEqual(metrics["cache_hit_rate"], 0.5)
+
+    def test_to_prometheus(self):
+        registry = MetricsRegistry(buckets=(1.0,))
+        registry.record_request("basic", "convert", 0.5, size=42)
+
+        text = registry.to_prometheus()
+
+        self.assertIn("# TYPE fixerio_requests_total counter", text)
+        self.assertIn('fixerio_requests_total{tier="basic",endpoint="convert"} 1', text)
+        self.assertIn('fixerio_response_bytes_total{tier="basic",endpoint="convert"} 42', text)
+        self.assertIn('fixerio_request_duration_seconds_bucket{tier="basic",endpoint="convert",le="1.0"} 1', text)
+        self.assertIn('fixerio_request_duration_seconds_bucket{tier="basic",endpoint="convert",le="+Inf"} 1', text)
+        self.assertIn('fixerio_request_duration_seconds_count{tier="basic",endpoint="convert"} 1', text)
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.record_request("free", "latest", 0.5)
+
+        registry.reset()
+
+        self.assertEqual(registry.as_dict(), {})
+
+
+class FixerioClientMetricsTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_records_requests_and_cache_lookups(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_latest_response
+        client = BasicClient("your-access-key", latest_cache=True, metrics=True)
+
+        client.get_latest()
+        client.get_latest()
+
+        metrics = client.metrics.as_dict()["basic"]["latest"]
+        self.assertEqual(metrics["requests"], 1)
+        self.assertEqual(metrics["errors"], 0)
+        self.assertEqual(metrics["response_bytes"], len(LATEST_BODY))
+        self.assertEqual(metrics["latency"]["count"], 1)
+        self.assertEqual((metrics["cache_hits"], metrics["cache_misses"]), (1, 1))
+
+    @patch('requests.Session.get')
+    def test_records_errors(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        client = FreeClient("your-access-key", metrics=True)
+
+        with self.assertRaises(FixerioException):
+            client.get_historical_rates("2020-01-01")
+
+        metrics = client.metrics.as_dict()["free"]["historical"]
+        self.assertEqual((metrics["requests"], metrics["errors"]), (1, 1))
+
+    @patch('requests.Session.get')
+    def test_unsuccessful_responses_are_errors(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": False, "error": {"code": 104}}
+        mock_requests_get.return_value.content = b'{}'
+        client = FreeClient("your-access-key", metrics=True)
+
+        client.get_latest()
+
+        self.assertEqual(client.metrics.as_dict()["free"]["latest"]["errors"], 1)
+
+    @patch('requests.Session.get')
+    def test_shared_registry(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_latest_response
+        registry = MetricsRegistry()
+
+        FreeClient("your-access-key", metrics=registry).get_latest()
+        BasicClient("your-access-key", metrics=registry).get_latest()
+
+        self.assertEqual(set(registry.as_dict()), {"free", "basic"})
+
+    @patch('requests.Session.get')
+    def test_disabled_by_default(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_latest_response
+        client = FreeClient("your-access-key")
+
+        client.get_latest()
+
+        self.assertIsNone(client.metrics)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientMetricsTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_records_requests(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.read = AsyncMock(return_value=LATEST_BODY)
+        response.json = AsyncMock(return_value=LATEST)
+        client = AsyncBasicClient("your-access-key", session=session, metrics=True)
+
+        self.assertEqual(await client.get_latest(), LATEST)
+
+        metrics = client.metrics.as_dict()["basic"]["latest"]
+        self.assertEqual(metrics["requests"], 1)
+        self.assertEqual(metrics["response_bytes"], len(LATEST_BODY))
@@ -0,0 +1,205 @@
+import datetime
+import os
+import threading
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException, QuotaExceeded
+from fixerio.free_client import FreeClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+from fixerio.quota import QuotaScheduler
+
+
+def timestamp(*args):
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class Clock(object):
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FixerioQuotaSchedulerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "quota.json")
+        self.clock = Clock(timestamp(2020, 1, 11))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_rejects_requests_beyond_monthly_quota(self):
+        quota = QuotaScheduler(3, clock=self.clock)
+
+        for _ in range(3):
+            quota.acquire()
+
+        self.assertEqual(quota.remaining, 0)
+        with self.assertRaises(QuotaExceeded):
+            quota.acquire()
+        self.assertEqual(quota.used, 3)
+
+    def test_quota_exceeded_is_fixer_exception(self):
+        self.assertTrue(issubclass(QuotaExceeded, FixerioException))
+
+    def test_count_resets_every_month(self):
+        quota = QuotaScheduler(1, clock=self.clock)
+        quota.acquire()
+
+        self.clock.now = timestamp(2020, 2, 1)
+
+        self.assertEqual(quota.remaining, 1)
+        quota.acquire()
+
+    def test_count_persists_across_restarts(self):
+        QuotaScheduler(10, path=self.path, clock=self.clock).acquire()
+        QuotaScheduler(10, path=self.path, clock=self.clock).acquire()
+
+        self.assertEqual(QuotaScheduler(10, path=self.path, clock=self.clock).used, 2)
+
+        self.clock.now = timestamp(2020, 2, 1)
+        self.assertEqual(QuotaScheduler(10, path=self.path, clock=self.clock).used, 0)
+
+    def test_count_is_written_at_most_every_save_interval(self):
+        quota = QuotaScheduler(10, path=self.path, clock=self.clock, save_interval=1)
+        for _ in range(3):
+            quota.acquire()
+
+        self.assertEqual(QuotaScheduler(10, path=self.path, clock=self.clock).used, 1)
+
+        self.clock.now += 1
+        quota.acquire()
+        self.assertEqual(QuotaScheduler(10, path=self.path, clock=self.clock).used, 4)
+
+        quota.reserve()
+        quota.flush()
+        self.assertEqual(QuotaScheduler(10, path=self.path, clock=self.clock).used, 5)
+
+    def test_token_bucket_queues_requests(self):
+        quota = QuotaScheduler(100, rate=2, burst=2, clock=self.clock)
+
+        self.assertEqual([quota.reserve() for _ in range(4)], [0.0, 0.0, 0.5, 1.0])
+
+        self.clock.now += 2
+        self.assertEqual(quota.reserve(), 0.0)
+
+    def test_token_bucket_rejects_when_not_blocking(self):
+        quota = QuotaScheduler(100, rate=1, block=False, clock=self.clock)
+        quota.reserve()
+
+        with self.assertRaises(QuotaExceeded):
+            quota.reserve()
+        self.assertEqual(quota.used, 1)
+
+    def test_token_bucket_rejects_after_timeout(self):
+        quota = QuotaScheduler(100, rate=1, timeout=1.5, clock=self.clock)
+
+        self.assertEqual([quota.reserve() for _ in range(2)], [0.0, 1.0])
+        with self.assertRaises(QuotaExceeded):
+            quota.reserve()
+
+    def test_projected_exhaustion(self):
+        quota = QuotaScheduler(100, clock=self.clock)
+        self.assertIsNone(quota.projected_exhaustion())
+
+        for _ in range(50):
+            quota.reserve()
+
+        # 50 requests in the first 10 days use up 100 requests on day 21.
+        self.assertEqual(quota.projected_exhaustion(), datetime.datetime(2020, 1, 21, tzinfo=datetime.timezone.utc))
+
+        report = quota.report()
+        self.assertEqual(report["month"], "2020-01")
+        self.assertEqual(report["remaining"], 50)
+
+    def test_no_exhaustion_within_month(self):
+        quota = QuotaScheduler(100, clock=self.clock)
+
+        for _ in range(10):
+            quota.reserve()
+
+        self.assertIsNone(quota.projected_exhaustion())
+
+
+class FixerioClientQuotaTestCase(unittest.TestCase):
+
+    def test_tiers_know_their_quota(self):
+        self.assertEqual(FreeClient("your-access-key", quota=True).quota.monthly_quota, 100)
+        self.assertEqual(BasicClient("your-access-key", quota=True).quota.monthly_quota, 1000)
+        self.assertEqual(ProfessionalPlusClient("your-access-key", quota=True).quota.monthly_quota, 100000)
+        self.assertEqual(FreeClient("your-access-key", quota=500).quota.monthly_quota, 500)
+        self.assertIsNone(FreeClient("your-access-key").quota)
+
+    @patch('requests.Session.get')
+    def test_rejects_request_before_sending(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "rates": {}}
+        client = FreeClient("your-access-key", quota=2)
+
+        client.get_latest()
+        client.get_latest()
+        with self.assertRaises(QuotaExceeded):
+            client.get_latest()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_cached_responses_are_not_counted(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "timestamp": 0, "rates": {}}
+        client = FreeClient("your-access-key", quota=True, latest_cache=True)
+
+        client.get_latest()
+        client.get_latest()
+
+        self.assertEqual(client.quota.used, 1)
+
+    @patch('requests.Session.get')
+    def test_close_writes_count(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "rates": {}}
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "quota.json")
+        client = FreeClient("your-access-key", quota=QuotaScheduler(100, path=path, save_interval=60))
+
+        for _ in range(3):
+            client.get_latest(symbols=["USD"])
+        client.close()
+
+        self.assertEqual(QuotaScheduler(100, path=path).used, 3)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientQuotaTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_count_is_written_off_the_event_loop(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return {"success": True, "rates": {}}
+
+        response.json = json_response
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "quota.json")
+        quota = QuotaScheduler(100, path=path, save_interval=60)
+        threads = []
+        flush = quota.flush
+        quota.flush = lambda: threads.append(threading.current_thread()) or flush()
+        client = AsyncBasicClient("your-access-key", session=session, quota=quota)
+
+        await client.get_latest()
+        await client.get_latest(symbols=["USD"])
+        await client.close()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(QuotaScheduler(100, path=path).used, 2)
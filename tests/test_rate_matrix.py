@@ -0,0 +1,91 @@
+import datetime
+import unittest
+from unittest.mock import patch
+from fixerio.exceptions import FixerioException
+from fixerio.professional_client import ProfessionalClient
+from fixerio.rate_matrix import RateMatrix, np
+
+
+def time_series_response():
+    return {
+        "success": True,
+        "timeseries": True,
+        "start_date": "2020-01-01",
+        "end_date": "2020-01-03",
+        "base": "EUR",
+        "rates": {
+            "2020-01-01": {"USD": 1.1, "GBP": 0.85},
+            "2020-01-02": {"USD": 1.2, "GBP": 0.86},
+            "2020-01-03": {"USD": 1.3, "GBP": 0.87}
+        }
+    }
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class FixerioRateMatrixTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = RateMatrix.from_time_series(time_series_response())
+
+    def test_values_are_one_contiguous_float64_array(self):
+        self.assertEqual(self.matrix.shape, (3, 2))
+        self.assertEqual(self.matrix.values.dtype, np.float64)
+        self.assertTrue(self.matrix.values.flags['C_CONTIGUOUS'])
+        self.assertEqual(self.matrix.symbols.tolist(), ["USD", "GBP"])
+        self.assertEqual(self.matrix.dates.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(self.matrix.base, "EUR")
+
+    def test_row_is_view(self):
+        row = self.matrix.row("2020-01-02")
+
+        np.testing.assert_array_equal(row, [1.2, 0.86])
+        self.assertTrue(np.shares_memory(row, self.matrix.values))
+
+    def test_row_accepts_dates(self):
+        np.testing.assert_array_equal(self.matrix.row(datetime.date(2020, 1, 3)), [1.3, 0.87])
+
+    def test_column_is_view(self):
+        column = self.matrix.column("usd")
+
+        np.testing.assert_array_equal(column, [1.1, 1.2, 1.3])
+        self.assertTrue(np.shares_memory(column, self.matrix.values))
+
+    def test_rate(self):
+        self.assertEqual(self.matrix.rate("2020-01-01", "GBP"), 0.85)
+
+    def test_unknown_date_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.matrix.row("2021-01-01")
+
+    def test_between_shares_array(self):
+        matrix = self.matrix.between("2020-01-02", datetime.date(2020, 1, 5))
+
+        self.assertEqual(len(matrix), 2)
+        self.assertTrue(np.shares_memory(matrix.values, self.matrix.values))
+        self.assertEqual(matrix.rate("2020-01-03", "USD"), 1.3)
+
+    def test_to_dict_round_trips(self):
+        self.assertEqual(self.matrix.to_dict(), time_series_response()["rates"])
+
+    def test_missing_rates_are_nan(self):
+        response = time_series_response()
+        del response["rates"]["2020-01-02"]["GBP"]
+
+        matrix = RateMatrix.from_time_series(response)
+
+        self.assertTrue(np.isnan(matrix.rate("2020-01-02", "GBP")))
+        self.assertEqual(matrix.to_dict()["2020-01-02"], {"USD": 1.2})
+
+    def test_unsuccessful_response_raises_fixer_exception(self):
+        with self.assertRaises(FixerioException):
+            RateMatrix.from_time_series({"success": False, "error": {"code": 104}})
+
+    @patch('fixerio.professional_client.ProfessionalClient._time_series')
+    def test_get_time_series_as_matrix(self, mock_time_series):
+        mock_time_series.return_value = time_series_response()
+        client = ProfessionalClient("your-access-key")
+
+        matrix = client.get_time_series("2020-01-01", "2020-01-03", as_matrix=True)
+
+        self.assertIsInstance(matrix, RateMatrix)
+        self.assertEqual(matrix.rate("2020-01-03", "GBP"), 0.87)
@@ -0,0 +1,92 @@
+import time
+import unittest
+from unittest.mock import patch
+from fixerio.free_client import FreeClient
+from fixerio.professional_client import ProfessionalClient
+from fixerio.rebase import rebase
+
+
+def eur_response():
+    return {
+        "success": True,
+        "timestamp": time.time(),
+        "base": "EUR",
+        "date": "2023-09-27",
+        "rates": {"EUR": 1.0, "USD": 1.25, "GBP": 0.8, "JPY": 150.0}
+    }
+
+
+class FixerioRebaseTestCase(unittest.TestCase):
+
+    def test_rebases_by_cross_division(self):
+        response = rebase(eur_response(), base="USD")
+
+        self.assertEqual(response["base"], "USD")
+        self.assertEqual(response["rates"], {"EUR": 0.8, "USD": 1.0, "GBP": 0.64, "JPY": 120.0})
+
+    def test_keeps_response_shape(self):
+        response = rebase(eur_response(), base="GBP", symbols=["USD"])
+
+        self.assertEqual(set(response), set(eur_response()))
+        self.assertEqual(response["date"], "2023-09-27")
+
+    def test_limits_symbols(self):
+        response = rebase(eur_response(), base="gbp", symbols="USD,eur")
+
+        self.assertEqual(response["rates"], {"USD": 1.5625, "EUR": 1.25})
+
+    def test_keeps_base_without_base(self):
+        response = rebase(eur_response(), symbols=["JPY"])
+
+        self.assertEqual(response["base"], "EUR")
+        self.assertEqual(response["rates"], {"JPY": 150.0})
+
+    def test_unknown_base_returns_invalid_base_currency_error(self):
+        response = rebase(eur_response(), base="XXX")
+
+        self.assertFalse(response["success"])
+        self.assertEqual(response["error"]["code"], 201)
+
+    def test_unsuccessful_response_is_returned_unchanged(self):
+        error = {"success": False, "error": {"code": 104}}
+
+        self.assertIs(rebase(error, base="USD"), error)
+
+
+class FixerioRebaseClientTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_requests_all_eur_rates(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = eur_response()
+        client = ProfessionalClient("your-access-key", rebase=True)
+
+        response = client.get_latest(symbols=["GBP"], base="USD")
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(response["rates"], {"GBP": 0.64})
+
+    @patch('requests.Session.get')
+    def test_one_request_serves_every_base_with_cache(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = eur_response()
+        client = ProfessionalClient("your-access-key", rebase=True, latest_cache=True)
+
+        responses = [client.get_latest(base=base) for base in ("USD", "GBP", "JPY", "EUR")]
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual([response["base"] for response in responses], ["USD", "GBP", "JPY", "EUR"])
+        self.assertEqual(responses[2]["rates"]["USD"], 1.25 / 150.0)
+
+    @patch('requests.Session.get')
+    def test_free_client_gets_other_base_rates(self, mock_requests_get):
+        response = dict(eur_response(), historical=True)
+        mock_requests_get.return_value.json.return_value = response
+        client = FreeClient("your-access-key", rebase=True)
+
+        result = client.get_historical_rates("2023-09-27", symbols=["EUR"], base="USD")
+
+        mock_requests_get.assert_called_once_with("http://data.fixer.io/api/2023-09-27",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(result["base"], "USD")
+        self.assertEqual(result["rates"], {"EUR": 0.8})
+        self.assertTrue(result["historical"])
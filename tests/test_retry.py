@@ -0,0 +1,218 @@
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.cache import TTLCache
+from fixerio.exceptions import CircuitOpen, FixerioException
+from fixerio.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+def http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.exceptions.HTTPError(f"{status} Error", response=response)
+
+
+def mock_response(data=None, error=None):
+    response = MagicMock()
+    if error is not None:
+        response.raise_for_status.side_effect = error
+    response.json.return_value = data
+    return response
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FixerioRetryPolicyTestCase(unittest.TestCase):
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(max_attempts=4, backoff=1, max_backoff=3, jitter=False)
+
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 5)], [1, 2, 3, None])
+
+    def test_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(max_attempts=10, backoff=1)
+
+        for attempt in range(1, 10):
+            self.assertTrue(0 <= policy.delay(attempt) <= min(30, 2 ** (attempt - 1)))
+
+    def test_honors_retry_after(self):
+        policy = RetryPolicy(max_backoff=10)
+
+        self.assertEqual(policy.delay(1, retry_after="7"), 7)
+        self.assertIsNone(policy.delay(1, retry_after="60"))
+
+    def test_parses_retry_after_date(self):
+        self.assertEqual(parse_retry_after("Wed, 01 Jan 2020 00:00:30 GMT", now=1577836800), 30)
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_transient_statuses(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_transient(503))
+        self.assertTrue(policy.is_transient(429))
+        self.assertFalse(policy.is_transient(404))
+
+
+class FixerioCircuitBreakerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, 'closed')
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, 'open')
+        with self.assertRaises(CircuitOpen):
+            self.breaker.before_request()
+
+    def test_lets_one_trial_request_through_after_reset_timeout(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+
+        self.breaker.before_request()
+        with self.assertRaises(CircuitOpen):
+            self.breaker.before_request()
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_failed_trial_opens_circuit_again(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.before_request()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, 'open')
+        self.clock.now = 15
+        with self.assertRaises(CircuitOpen):
+            self.breaker.before_request()
+
+
+class FixerioClientRetryTestCase(unittest.TestCase):
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_retries_transient_errors(self, mock_requests_get, mock_sleep):
+        mock_requests_get.side_effect = [requests.exceptions.ConnectionError("Connection refused"),
+                                         mock_response(error=http_error(503, retry_after="2")),
+                                         mock_response({"success": True})]
+        client = BasicClient("your-access-key", retry=RetryPolicy(max_attempts=3))
+
+        self.assertEqual(client.get_latest(), {"success": True})
+        self.assertEqual(mock_requests_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[-1].args, (2.0,))
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_does_not_retry_client_errors(self, mock_requests_get, mock_sleep):
+        mock_requests_get.return_value = mock_response(error=http_error(404))
+        client = BasicClient("your-access-key", retry=True)
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+        mock_requests_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_gives_up_after_max_attempts(self, mock_requests_get, mock_sleep):
+        mock_requests_get.side_effect = requests.exceptions.Timeout("Read timed out")
+        client = BasicClient("your-access-key", retry=RetryPolicy(max_attempts=2))
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_no_retry_by_default(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        client = BasicClient("your-access-key")
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+        mock_requests_get.assert_called_once()
+
+
+class FixerioClientCircuitBreakerTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_fails_fast_while_open(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        client = BasicClient("your-access-key", circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+        for _ in range(2):
+            with self.assertRaises(FixerioException):
+                client.get_latest()
+        with self.assertRaises(CircuitOpen):
+            client.get_latest()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_client_errors_do_not_open_circuit(self, mock_requests_get):
+        mock_requests_get.return_value = mock_response(error=http_error(401))
+        client = BasicClient("your-access-key", circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+        with self.assertRaises(FixerioException):
+            client.get_latest()
+
+        self.assertEqual(client.circuit_breaker.state, 'closed')
+
+    @patch('requests.Session.get')
+    def test_serves_stale_cache_while_open(self, mock_requests_get):
+        mock_requests_get.return_value = mock_response({"success": True, "timestamp": 0, "rates": {"USD": 1.1}})
+        cache = TTLCache(60)
+        client = BasicClient("your-access-key", latest_cache=cache, circuit_breaker=CircuitBreaker(failure_threshold=1))
+        client.get_latest()
+
+        mock_requests_get.return_value = mock_response(error=http_error(503))
+        with patch('time.time', return_value=time.time() + 120):
+            with self.assertRaises(FixerioException):
+                client.get_latest()
+
+            self.assertEqual(client.get_latest()["rates"], {"USD": 1.1})
+            with self.assertRaises(CircuitOpen):
+                client.get_symbols()
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientRetryTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_retries_transient_errors(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock(side_effect=[
+            aiohttp.ClientResponseError(MagicMock(), (), status=502), None
+        ])
+
+        async def json_response(content_type=None):
+            return {"success": True}
+
+        response.json = json_response
+        client = AsyncBasicClient("your-access-key", session=session,
+                                  retry=RetryPolicy(backoff=0.001), circuit_breaker=True)
+
+        self.assertEqual(await client.get_latest(), {"success": True})
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(client.circuit_breaker.state, 'closed')
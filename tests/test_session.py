@@ -0,0 +1,70 @@
+import unittest
+import requests
+from unittest.mock import patch, MagicMock
+from fixerio.fixerio_client import FixerioClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+
+
+class FixerioSessionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.access_key = 'your-access-key'
+
+    def test_session_is_created_lazily(self):
+        client = FixerioClient(self.access_key)
+
+        self.assertIsNone(client._session)
+
+    @patch('requests.Session.get')
+    def test_session_is_reused_between_requests(self, mock_requests_get):
+        client = FixerioClient(self.access_key)
+
+        client._symbols()
+        session = client._session
+        client._latest()
+
+        self.assertIsNotNone(session)
+        self.assertIs(client._session, session)
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    def test_pool_size_sets_adapter_pool_maxsize(self):
+        client = ProfessionalPlusClient(self.access_key, pool_size=32)
+
+        adapter = client._get_session().get_adapter("https://data.fixer.io/api/latest")
+
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_close_closes_owned_session(self):
+        client = FixerioClient(self.access_key)
+        session = client._get_session()
+
+        with patch.object(session, 'close') as mock_close:
+            client.close()
+
+        mock_close.assert_called_once()
+        self.assertIsNone(client._session)
+
+    def test_close_does_not_close_passed_session(self):
+        session = MagicMock(spec=requests.Session)
+        client = FixerioClient(self.access_key, session=session)
+
+        client.close()
+
+        session.close.assert_not_called()
+        self.assertIs(client._get_session(), session)
+
+    def test_context_manager_closes_session(self):
+        with FixerioClient(self.access_key) as client:
+            client._get_session()
+
+        self.assertIsNone(client._session)
+
+    @patch('requests.Session.get')
+    def test_passed_session_is_used_for_requests(self, mock_requests_get):
+        session = MagicMock(spec=requests.Session)
+        client = FixerioClient(self.access_key, session=session)
+
+        client._latest()
+
+        session.get.assert_called_once()
+        mock_requests_get.assert_not_called()
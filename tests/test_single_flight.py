@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.singleflight import SingleFlight
+
+
+def latest_response():
+    return {"success": True, "base": "EUR", "rates": {"USD": 1.1, "GBP": 0.85}}
+
+
+class FixerioSingleFlightTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+
+    def blocking_get(self, url, params=None, timeout=None):
+        self.release.wait(5)
+        response = MagicMock()
+        response.json.return_value = latest_response()
+        return response
+
+    def get_concurrently(self, client, calls):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call, client) for call in calls]
+            # Let every thread reach the request in flight before it completes.
+            time.sleep(0.2)
+            self.release.set()
+            return [future.result() for future in futures]
+
+    @patch('requests.Session.get')
+    def test_concurrent_identical_calls_send_one_request(self, mock_requests_get):
+        mock_requests_get.side_effect = self.blocking_get
+        client = BasicClient("your-access-key")
+
+        responses = self.get_concurrently(client, [
+            lambda client: client.get_latest(symbols=["USD", "GBP"], base="EUR"),
+            lambda client: client.get_latest(symbols="gbp,usd", base="eur")
+        ] * 8)
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(responses, [latest_response()] * 16)
+        self.assertEqual(len(set(map(id, responses))), 16)
+        self.assertEqual(len(client._in_flight), 0)
+
+    @patch('requests.Session.get')
+    def test_different_calls_are_not_coalesced(self, mock_requests_get):
+        mock_requests_get.side_effect = self.blocking_get
+        client = BasicClient("your-access-key")
+
+        self.get_concurrently(client, [lambda client: client.get_latest(base="USD"),
+                                       lambda client: client.get_latest(base="GBP")])
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_sequential_calls_send_new_requests(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response()
+        client = BasicClient("your-access-key")
+
+        client.get_latest()
+        client.get_latest()
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_coalescing_can_be_disabled(self, mock_requests_get):
+        mock_requests_get.side_effect = self.blocking_get
+        client = BasicClient("your-access-key", coalesce=False)
+
+        self.get_concurrently(client, [lambda client: client.get_latest()] * 4)
+
+        self.assertEqual(mock_requests_get.call_count, 4)
+
+    def test_exception_is_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            self.release.wait(5)
+            raise FixerioException("Service unavailable")
+
+        def call():
+            try:
+                single_flight.do(("latest",), fail)
+            except FixerioException as ex:
+                return ex
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(call) for _ in range(4)]
+            started.wait(5)
+            time.sleep(0.2)
+            self.release.set()
+            errors = [future.result() for future in futures]
+
+        self.assertEqual(len(set(map(id, errors))), 1)
+        self.assertEqual(len(single_flight), 0)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncSingleFlightTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def mock_session(self, json_response):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+        response.json = json_response
+        return session
+
+    async def test_concurrent_identical_calls_send_one_request(self):
+        async def json_response(content_type=None):
+            await asyncio.sleep(0.01)
+            return latest_response()
+
+        session = self.mock_session(json_response)
+        client = AsyncBasicClient("your-access-key", session=session)
+
+        responses = await asyncio.gather(*(client.get_latest(symbols=["USD", "GBP"]) for _ in range(50)))
+
+        session.get.assert_called_once()
+        self.assertEqual(responses, [latest_response()] * 50)
+        self.assertEqual(len(client._in_flight), 0)
+
+    async def test_exception_is_shared(self):
+        async def json_response(content_type=None):
+            await asyncio.sleep(0.01)
+            raise aiohttp.ClientError("Service unavailable")
+
+        session = self.mock_session(json_response)
+        client = AsyncBasicClient("your-access-key", session=session)
+
+        results = await asyncio.gather(*(client.get_latest() for _ in range(5)), return_exceptions=True)
+
+        session.get.assert_called_once()
+        self.assertTrue(all(isinstance(result, FixerioException) for result in results))
+
+    async def test_cancelled_waiter_does_not_cancel_request(self):
+        async def json_response(content_type=None):
+            await asyncio.sleep(0.02)
+            return latest_response()
+
+        session = self.mock_session(json_response)
+        client = AsyncBasicClient("your-access-key", session=session)
+
+        leader = asyncio.ensure_future(client.get_latest())
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(client.get_latest())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        self.assertEqual(await leader, latest_response())
+        session.get.assert_called_once()
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        async def json_response(content_type=None):
+            await asyncio.sleep(0.02)
+            return latest_response()
+
+        session = self.mock_session(json_response)
+        client = AsyncBasicClient("your-access-key", session=session)
+
+        leader = asyncio.ensure_future(client.get_latest())
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(client.get_latest())
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await waiter, latest_response())
+        self.assertTrue(leader.cancelled())
+        session.get.assert_called_once()
+
+    async def test_request_is_cancelled_with_its_last_caller(self):
+        cancelled = asyncio.Event()
+
+        async def json_response(content_type=None):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        session = self.mock_session(json_response)
+        client = AsyncBasicClient("your-access-key", session=session)
+
+        calls = [asyncio.ensure_future(client.get_latest()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        for call in calls:
+            call.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        self.assertEqual(len(client._in_flight), 0)
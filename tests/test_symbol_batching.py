@@ -0,0 +1,168 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.batching import limit_symbols
+
+TIMEOUT = aiohttp.ClientTimeout(connect=5, sock_read=30) if aiohttp else None
+
+
+def rates_response(params):
+    rates = {"USD": 1.1, "GBP": 0.85, "JPY": 157.1, "CHF": 0.97}
+    symbols = params.get("symbols")
+    if symbols:
+        rates = {symbol: rates[symbol] for symbol in symbols.split(",")}
+    return {"success": True, "base": params.get("base", "EUR"), "rates": rates}
+
+
+def mock_rates_response(url, params=None, timeout=None):
+    response = MagicMock()
+    response.json.return_value = rates_response(params)
+    return response
+
+
+class FixerioLimitSymbolsTestCase(unittest.TestCase):
+
+    def test_limits_rates(self):
+        response = limit_symbols(rates_response({}), "usd, GBP,XXX")
+
+        self.assertEqual(response["rates"], {"USD": 1.1, "GBP": 0.85})
+
+    def test_copies_rates_for_all_symbols(self):
+        response = rates_response({})
+
+        limited = limit_symbols(response, None)
+
+        self.assertEqual(limited, response)
+        self.assertIsNot(limited["rates"], response["rates"])
+
+    def test_error_response_is_returned(self):
+        error = {"success": False, "error": {"code": 202}}
+
+        self.assertIs(limit_symbols(error, "USD"), error)
+
+
+class FixerioSymbolBatchingTestCase(unittest.TestCase):
+
+    def get_concurrently(self, calls):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            return list(executor.map(lambda call: call(), calls))
+
+    @patch('requests.Session.get')
+    def test_one_request_for_union_of_symbols(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_rates_response
+        client = BasicClient("your-access-key", batch_window=0.2)
+
+        responses = self.get_concurrently([
+            lambda: client.get_latest(symbols=["USD"]),
+            lambda: client.get_latest(symbols=["GBP", "JPY"]),
+            lambda: client.get_latest(symbols="usd,chf")
+        ])
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                                  params={"access_key": "your-access-key",
+                                                          "symbols": "CHF,GBP,JPY,USD"}, timeout=(5, 30))
+        self.assertEqual([response["rates"] for response in responses],
+                         [{"USD": 1.1}, {"GBP": 0.85, "JPY": 157.1}, {"USD": 1.1, "CHF": 0.97}])
+
+    @patch('requests.Session.get')
+    def test_all_symbols_when_any_request_has_none(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_rates_response
+        client = BasicClient("your-access-key", batch_window=0.2)
+
+        responses = self.get_concurrently([lambda: client.get_latest(symbols=["USD"]), lambda: client.get_latest()])
+
+        mock_requests_get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                                  params={"access_key": "your-access-key"}, timeout=(5, 30))
+        self.assertEqual(responses[0]["rates"], {"USD": 1.1})
+        self.assertEqual(len(responses[1]["rates"]), 4)
+
+    @patch('requests.Session.get')
+    def test_batches_by_base_and_date(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_rates_response
+        client = BasicClient("your-access-key", batch_window=0.2)
+
+        self.get_concurrently([
+            lambda: client.get_latest(symbols=["USD"], base="GBP"),
+            lambda: client.get_latest(symbols=["JPY"], base="GBP"),
+            lambda: client.get_latest(symbols=["USD"], base="CHF"),
+            lambda: client.get_historical_rates("2020-01-01", symbols=["USD"], base="GBP"),
+            lambda: client.get_historical_rates("2020-01-01", symbols=["CHF"], base="GBP"),
+            lambda: client.get_historical_rates("2020-01-02", symbols=["USD"], base="GBP")
+        ])
+
+        self.assertEqual(sorted((call.args[0], call.kwargs["params"].get("base"), call.kwargs["params"]["symbols"])
+                                for call in mock_requests_get.call_args_list), [
+            ("https://data.fixer.io/api/2020-01-01", "GBP", "CHF,USD"),
+            ("https://data.fixer.io/api/2020-01-02", "GBP", "USD"),
+            ("https://data.fixer.io/api/latest", "CHF", "USD"),
+            ("https://data.fixer.io/api/latest", "GBP", "JPY,USD")
+        ])
+
+    @patch('requests.Session.get')
+    def test_not_batched_by_default(self, mock_requests_get):
+        mock_requests_get.side_effect = mock_rates_response
+        client = BasicClient("your-access-key")
+
+        self.get_concurrently([lambda: client.get_latest(symbols=["USD"]), lambda: client.get_latest(symbols=["GBP"])])
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncSymbolBatchingTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def mock_session(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return rates_response(session.get.call_args.kwargs["params"])
+
+        response.json = json_response
+        return session
+
+    async def test_one_request_for_union_of_symbols(self):
+        session = self.mock_session()
+        client = AsyncBasicClient("your-access-key", session=session, batch_window=0.01)
+
+        responses = await asyncio.gather(client.get_latest(symbols=["USD"]), client.get_latest(symbols=["GBP"]),
+                                         client.get_latest(symbols=["USD", "JPY"]))
+
+        session.get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                            params={"access_key": "your-access-key", "symbols": "GBP,JPY,USD"},
+                                            timeout=TIMEOUT)
+        self.assertEqual([response["rates"] for response in responses],
+                         [{"USD": 1.1}, {"GBP": 0.85}, {"USD": 1.1, "JPY": 157.1}])
+
+    async def test_cancelled_first_request_does_not_cancel_batch(self):
+        session = self.mock_session()
+        client = AsyncBasicClient("your-access-key", session=session, batch_window=0.02)
+
+        first = asyncio.ensure_future(client.get_latest(symbols=["USD"]))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(client.get_latest(symbols=["GBP"]))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual((await second)["rates"], {"GBP": 0.85})
+        self.assertTrue(first.cancelled())
+        session.get.assert_called_once_with("https://data.fixer.io/api/latest",
+                                            params={"access_key": "your-access-key", "symbols": "GBP,USD"},
+                                            timeout=TIMEOUT)
+
+    async def test_batch_is_cancelled_with_its_last_request(self):
+        session = self.mock_session()
+        client = AsyncBasicClient("your-access-key", session=session, batch_window=0.02)
+
+        requests = [asyncio.ensure_future(client.get_latest(symbols=[symbol])) for symbol in ("USD", "GBP")]
+        await asyncio.sleep(0)
+        for request in requests:
+            request.cancel()
+        await asyncio.sleep(0.05)
+
+        session.get.assert_not_called()
+        self.assertEqual(client._batcher._batches, {})
@@ -11,7 +11,7 @@ class FixerioSymbolsTestCase(unittest.TestCase):
         self.client = FixerioClient(self.access_key)
         self.expected_url = "http://data.fixer.io/api/symbols"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_url(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key
@@ -19,9 +19,9 @@ class FixerioSymbolsTestCase(unittest.TestCase):
 
         self.client._symbols()
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_error_raises_fixer_exception(self, mock_requests_get):
         mock_requests_get.side_effect = requests.exceptions.RequestException("Request failed")
 
@@ -0,0 +1,143 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.free_client import FreeClient
+from fixerio.professional_client import ProfessionalClient
+from fixerio.timeseries import missing_ranges
+
+
+def mock_response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+
+def historical_response(url, params=None, timeout=None):
+    return mock_response({
+        "success": True,
+        "historical": True,
+        "date": url.rsplit('/', 1)[-1],
+        "timestamp": 1577923199,
+        "base": params.get("base", "EUR"),
+        "rates": {"USD": 1.1, "GBP": 0.85}
+    })
+
+
+def time_series_response(url, params=None, timeout=None):
+    start_date = datetime.date.fromisoformat(params["start_date"])
+    end_date = datetime.date.fromisoformat(params["end_date"])
+    days = (end_date - start_date).days + 1
+    return mock_response({
+        "success": True,
+        "timeseries": True,
+        "start_date": params["start_date"],
+        "end_date": params["end_date"],
+        "base": params.get("base", "EUR"),
+        "rates": {(start_date + datetime.timedelta(days=day)).isoformat(): {"USD": 1.1, "GBP": 0.85}
+                  for day in range(days)}
+    })
+
+
+class FixerioMissingRangesTestCase(unittest.TestCase):
+
+    def test_all_missing(self):
+        self.assertEqual(missing_ranges("2020-01-01", "2020-01-03", set()),
+                         [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 3))])
+
+    def test_finds_gaps(self):
+        dates = {"2020-01-02", "2020-01-03", "2020-01-06"}
+
+        self.assertEqual(missing_ranges("2020-01-01", "2020-01-07", dates), [
+            (datetime.date(2020, 1, 1), datetime.date(2020, 1, 1)),
+            (datetime.date(2020, 1, 4), datetime.date(2020, 1, 5)),
+            (datetime.date(2020, 1, 7), datetime.date(2020, 1, 7))
+        ])
+
+    def test_nothing_missing(self):
+        self.assertEqual(missing_ranges("2020-01-01", "2020-01-02", {"2020-01-01", "2020-01-02"}), [])
+
+
+class FixerioSyncHistoricalRatesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "rates.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_requires_historical_store(self):
+        with self.assertRaises(ValueError):
+            FreeClient("your-access-key").sync_historical_rates("2020-01-01", "2020-01-02")
+
+    @patch('requests.Session.get')
+    def test_lower_tiers_request_missing_days_only(self, mock_requests_get):
+        mock_requests_get.side_effect = historical_response
+        with BasicClient("your-access-key", symbols=["USD"], historical_store=self.path) as client:
+            client.get_historical_rates("2020-01-03")
+            mock_requests_get.reset_mock()
+
+            ranges = client.sync_historical_rates("2020-01-01", "2020-01-05", base="EUR")
+
+            self.assertEqual(ranges, [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)),
+                                      (datetime.date(2020, 1, 4), datetime.date(2020, 1, 5))])
+            self.assertEqual(sorted(call.args[0] for call in mock_requests_get.call_args_list), [
+                "https://data.fixer.io/api/2020-01-01", "https://data.fixer.io/api/2020-01-02",
+                "https://data.fixer.io/api/2020-01-04", "https://data.fixer.io/api/2020-01-05"
+            ])
+            for call in mock_requests_get.call_args_list:
+                self.assertEqual(call.kwargs["params"], {"access_key": "your-access-key", "base": "EUR"})
+
+            self.assertEqual(client.historical_store.get("2020-01-04")["rates"], {"USD": 1.1, "GBP": 0.85})
+
+    @patch('requests.Session.get')
+    def test_second_sync_only_requests_new_days(self, mock_requests_get):
+        mock_requests_get.side_effect = historical_response
+        with FreeClient("your-access-key", historical_store=self.path) as client:
+            client.sync_historical_rates("2020-01-01", "2020-01-10")
+            mock_requests_get.reset_mock()
+
+            ranges = client.sync_historical_rates("2020-01-01", "2020-01-11")
+
+            self.assertEqual(ranges, [(datetime.date(2020, 1, 11), datetime.date(2020, 1, 11))])
+            mock_requests_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_professional_tier_requests_time_series_windows(self, mock_requests_get):
+        mock_requests_get.side_effect = time_series_response
+        with ProfessionalClient("your-access-key", historical_store=self.path) as client:
+            client.sync_historical_rates("2018-01-01", "2019-12-31", base="USD")
+
+            self.assertEqual(mock_requests_get.call_count, 2)
+            for call in mock_requests_get.call_args_list:
+                self.assertEqual(call.args[0], "https://data.fixer.io/api/timeseries")
+            self.assertEqual(len(client.historical_store.dates("USD")), 730)
+
+            mock_requests_get.reset_mock()
+            client.sync_historical_rates("2018-01-01", "2020-01-02", base="USD")
+
+            mock_requests_get.assert_called_once_with("https://data.fixer.io/api/timeseries",
+                                                      params={"access_key": "your-access-key", "base": "USD",
+                                                              "start_date": "2020-01-01", "end_date": "2020-01-02"},
+                                                      timeout=(5, 30))
+
+    @patch('requests.Session.get')
+    def test_skips_today(self, mock_requests_get):
+        mock_requests_get.side_effect = historical_response
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        with FreeClient("your-access-key", historical_store=self.path) as client:
+            ranges = client.sync_historical_rates(today - datetime.timedelta(days=1), today)
+
+        self.assertEqual(ranges, [(today - datetime.timedelta(days=1), today - datetime.timedelta(days=1))])
+
+    @patch('requests.Session.get')
+    def test_unsuccessful_response_raises_fixer_exception(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": False, "error": {"code": 104}}
+        with ProfessionalClient("your-access-key", historical_store=self.path) as client:
+            with self.assertRaises(FixerioException):
+                client.sync_historical_rates("2020-01-01", "2020-01-02")
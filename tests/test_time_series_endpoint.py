@@ -16,7 +16,7 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
         self.client = FixerioClient(self.access_key)
         self.expected_url = "http://data.fixer.io/api/timeseries"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_url_with_dates(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key,
@@ -26,9 +26,9 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
 
         self.client._time_series(self.start_date_as_date, self.end_date_as_date)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)\
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))\
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_url_with_date_strings(self, mock_requests_get):
         expected_payload = {
             "access_key": self.access_key,
@@ -38,16 +38,16 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
 
         self.client._time_series(self.start_date_as_str, self.end_date_as_str)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_error_raises_fixer_exception(self, mock_requests_get):
         mock_requests_get.side_effect = requests.exceptions.RequestException("Request failed")
 
         with self.assertRaises(FixerioException):
             self.client._time_series(self.start_date_as_date, self.end_date_as_date)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbol_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
 
@@ -60,9 +60,9 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
 
         self.client._time_series(self.start_date_as_date, self.end_date_as_date, symbols=symbols)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_base_in_payload(self, mock_requests_get):
         base = "GBP"
 
@@ -75,9 +75,9 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
 
         self.client._time_series(self.start_date_as_date, self.end_date_as_date, base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_symbols_and_base_in_payload(self, mock_requests_get):
         symbols = ["USD", "EUR"]
         base = "GBP"
@@ -92,4 +92,4 @@ class FixerioTimeSeriesTestCase(unittest.TestCase):
 
         self.client._time_series(self.start_date_as_date, self.end_date_as_date, symbols=symbols, base=base)
 
-        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload)
+        mock_requests_get.assert_called_with(self.expected_url, params=expected_payload, timeout=(5, 30))
@@ -0,0 +1,181 @@
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fixerio.async_client import aiohttp, AsyncProfessionalClient
+from fixerio.exceptions import FixerioException
+from fixerio.professional_client import ProfessionalClient
+from fixerio.rate_matrix import RateMatrix, RateMatrixBuilder, np
+from fixerio.streaming import TimeSeriesParser
+
+
+def time_series_response(start_date, end_date, rates):
+    return {
+        "success": True,
+        "timeseries": True,
+        "start_date": start_date,
+        "end_date": end_date,
+        "base": "EUR",
+        "rates": rates
+    }
+
+
+def time_series_body(params):
+    if params["start_date"] == "2019-01-01":
+        rates = {"2019-01-01": {"USD": 1.1, "GBP": 0.85}, "2019-12-31": {"USD": 1.2, "GBP": 0.86}}
+    else:
+        rates = {"2020-01-01": {"USD": 1.3, "GBP": 0.87}}
+    return json.dumps(time_series_response(params["start_date"], params["end_date"], rates), indent=4).encode()
+
+
+def chunked(body, size=7):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+def parse(body, size):
+    parser = TimeSeriesParser()
+    rows = []
+    for chunk in chunked(body, size):
+        rows.extend(parser.feed(chunk))
+    return rows, parser.close()
+
+
+class FixerioTimeSeriesParserTestCase(unittest.TestCase):
+
+    def test_rows_for_any_chunk_size(self):
+        body = time_series_body({"start_date": "2019-01-01", "end_date": "2019-12-31"})
+
+        for size in (1, 2, 5, 64, len(body)):
+            rows, fields = parse(body, size)
+
+            self.assertEqual(rows, [("2019-01-01", {"USD": 1.1, "GBP": 0.85}),
+                                    ("2019-12-31", {"USD": 1.2, "GBP": 0.86})])
+            self.assertEqual(fields["base"], "EUR")
+            self.assertNotIn("rates", fields)
+
+    def test_numbers_split_across_chunks(self):
+        rows, _ = parse(b'{"success": true, "rates": {"2020-01-01": {"JPY": 157.123}}}', 32)
+
+        self.assertEqual(rows, [("2020-01-01", {"JPY": 157.123})])
+
+    def test_scalar_split_after_decimal_point_or_exponent(self):
+        for first, second, amount in ((b'1.', b'5', 1.5), (b'1e', b'2', 100.0), (b'1E-', b'1', 0.1)):
+            parser = TimeSeriesParser()
+            parser.feed(b'{"success": true, "amount": ' + first)
+            parser.feed(second + b', "rates": {}}')
+
+            self.assertEqual(parser.close()["amount"], amount)
+
+    def test_characters_split_across_chunks(self):
+        body = '{"success": false, "error": {"info": "Déjà vu"}}'.encode()
+
+        with self.assertRaisesRegex(FixerioException, "Déjà vu"):
+            parse(body, 1)
+
+    def test_truncated_response_raises(self):
+        body = time_series_body({"start_date": "2019-01-01", "end_date": "2019-12-31"})
+
+        with self.assertRaises(FixerioException):
+            parse(body[:-10], 7)
+
+    def test_invalid_response_raises(self):
+        with self.assertRaises(FixerioException):
+            parse(b'<html>Bad Gateway</html>', 7)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class FixerioRateMatrixBuilderTestCase(unittest.TestCase):
+
+    def test_rows_with_different_currencies(self):
+        builder = RateMatrixBuilder()
+        builder.append("2020-01-02", {"USD": 1.2})
+        builder.append("2020-01-01", {"USD": 1.1, "GBP": 0.85})
+
+        matrix = builder.build(base="EUR")
+
+        self.assertEqual(matrix.symbols.tolist(), ["USD", "GBP"])
+        self.assertEqual(matrix.to_dict(), {"2020-01-01": {"USD": 1.1, "GBP": 0.85}, "2020-01-02": {"USD": 1.2}})
+
+    def test_concatenate_aligns_currencies(self):
+        first = RateMatrix.from_time_series(time_series_response("2020-01-01", "2020-01-01",
+                                                                 {"2020-01-01": {"USD": 1.1}}))
+        second = RateMatrix.from_time_series(time_series_response("2020-01-02", "2020-01-02",
+                                                                  {"2020-01-02": {"GBP": 0.85}}))
+
+        matrix = RateMatrix.concatenate([first, second])
+
+        self.assertEqual(matrix.to_dict(), {"2020-01-01": {"USD": 1.1}, "2020-01-02": {"GBP": 0.85}})
+
+
+class FixerioStreamingClientTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.responses = []
+
+    def mock_stream_response(self, url, params=None, timeout=None, stream=False):
+        response = MagicMock()
+        response.iter_content.return_value = iter(chunked(time_series_body(params)))
+        self.responses.append(response)
+        return response
+
+    @patch('requests.Session.get')
+    def test_iter_time_series_streams_each_window(self, mock_requests_get):
+        mock_requests_get.side_effect = self.mock_stream_response
+        client = ProfessionalClient("your-access-key")
+
+        rows = list(client.iter_time_series("2019-01-01", "2020-01-01"))
+
+        self.assertEqual([date for date, _ in rows], ["2019-01-01", "2019-12-31", "2020-01-01"])
+        self.assertEqual(rows[2][1], {"USD": 1.3, "GBP": 0.87})
+        mock_requests_get.assert_any_call("https://data.fixer.io/api/timeseries",
+                                          params={"access_key": "your-access-key", "start_date": "2019-01-01",
+                                                  "end_date": "2019-12-31"}, timeout=(5, 30), stream=True)
+        for response in self.responses:
+            response.close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_unsuccessful_response_raises(self, mock_requests_get):
+        mock_requests_get.return_value.iter_content.return_value = [b'{"success": false, "error": {"code": 106}}']
+
+        with self.assertRaises(FixerioException):
+            list(ProfessionalClient("your-access-key").iter_time_series("2020-01-01", "2020-01-31"))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    @patch('requests.Session.get')
+    def test_stream_into_matrix(self, mock_requests_get):
+        mock_requests_get.side_effect = self.mock_stream_response
+        client = ProfessionalClient("your-access-key")
+
+        matrix = client.get_time_series("2019-01-01", "2020-01-01", as_matrix=True, stream=True)
+
+        self.assertEqual(matrix.shape, (3, 2))
+        self.assertEqual(matrix.base, "EUR")
+        self.assertEqual(matrix.rate("2020-01-01", "GBP"), 0.87)
+        mock_requests_get.return_value.json.assert_not_called()
+
+    def test_stream_requires_matrix(self):
+        with self.assertRaises(ValueError):
+            ProfessionalClient("your-access-key").get_time_series("2019-01-01", "2020-01-01", stream=True)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncStreamingClientTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_iter_time_series(self):
+        session = MagicMock()
+
+        async def stream_response(url, params=None, timeout=None):
+            async def iter_chunked(size):
+                for chunk in chunked(time_series_body(params)):
+                    yield chunk
+
+            response = MagicMock()
+            response.content.iter_chunked = iter_chunked
+            return response
+
+        session.get = AsyncMock(side_effect=stream_response)
+        client = AsyncProfessionalClient("your-access-key", session=session)
+
+        rows = [row async for row in client.iter_time_series("2019-01-01", "2020-01-01")]
+
+        self.assertEqual([date for date, _ in rows], ["2019-01-01", "2019-12-31", "2020-01-01"])
+        self.assertEqual(session.get.call_count, 2)
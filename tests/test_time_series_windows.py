@@ -0,0 +1,112 @@
+import datetime
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from fixerio.professional_client import ProfessionalClient
+from fixerio.professional_plus_client import ProfessionalPlusClient
+from fixerio.timeseries import merge_time_series, split_date_range
+
+
+def window_response(start_date, end_date, symbols=None, base=None):
+    return {
+        "success": True,
+        "timeseries": True,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "base": base or "EUR",
+        "rates": {start_date.isoformat(): {"USD": 1.0}, end_date.isoformat(): {"USD": 2.0}}
+    }
+
+
+class FixerioSplitDateRangeTestCase(unittest.TestCase):
+
+    def test_short_range_is_one_window(self):
+        windows = split_date_range("2020-01-01", "2020-12-30")
+
+        self.assertEqual(windows, [(datetime.date(2020, 1, 1), datetime.date(2020, 12, 30))])
+
+    def test_windows_span_at_most_365_days(self):
+        windows = split_date_range(datetime.date(2000, 1, 1), datetime.date(2024, 12, 31))
+
+        self.assertEqual(windows[0][0], datetime.date(2000, 1, 1))
+        self.assertEqual(windows[-1][1], datetime.date(2024, 12, 31))
+        for (start_date, end_date), (next_start_date, _) in zip(windows, windows[1:]):
+            self.assertEqual((end_date - start_date).days, 364)
+            self.assertEqual(next_start_date, end_date + datetime.timedelta(days=1))
+
+    def test_empty_range_has_no_windows(self):
+        self.assertEqual(split_date_range("2020-01-02", "2020-01-01"), [])
+
+
+class FixerioMergeTimeSeriesTestCase(unittest.TestCase):
+
+    def test_merges_rates_and_date_range(self):
+        response = merge_time_series([
+            window_response(datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)),
+            window_response(datetime.date(2020, 1, 3), datetime.date(2020, 1, 4))
+        ])
+
+        self.assertEqual(response["start_date"], "2020-01-01")
+        self.assertEqual(response["end_date"], "2020-01-04")
+        self.assertEqual(list(response["rates"]), ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"])
+        self.assertTrue(response["timeseries"])
+
+    def test_returns_unsuccessful_response(self):
+        error = {"success": False, "error": {"code": 104}}
+
+        response = merge_time_series([window_response(datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)), error])
+
+        self.assertIs(response, error)
+
+
+class FixerioWindowedTimeSeriesTestCase(unittest.TestCase):
+
+    @patch('fixerio.professional_client.ProfessionalClient._time_series')
+    def test_long_range_is_requested_in_windows(self, mock_time_series):
+        mock_time_series.side_effect = window_response
+        client = ProfessionalClient("your-access-key")
+
+        response = client.get_time_series("2015-01-01", "2024-12-31", symbols=["USD"], base="GBP")
+
+        self.assertEqual(mock_time_series.call_count, 11)
+        self.assertEqual(response["start_date"], "2015-01-01")
+        self.assertEqual(response["end_date"], "2024-12-31")
+        self.assertEqual(response["base"], "GBP")
+        self.assertEqual(len(response["rates"]), 22)
+
+    @patch('fixerio.professional_plus_client.ProfessionalPlusClient._time_series')
+    def test_windows_are_requested_concurrently(self, mock_time_series):
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def slow_window_response(*args, **kwargs):
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+            return window_response(*args, **kwargs)
+
+        mock_time_series.side_effect = slow_window_response
+        client = ProfessionalPlusClient("your-access-key", max_workers=3)
+
+        client.get_time_series("2015-01-01", "2024-12-31")
+
+        self.assertEqual(max(max_in_flight), 3)
+
+    @patch('requests.Session.get')
+    def test_windows_are_sent_to_time_series_endpoint(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "rates": {}}
+        client = ProfessionalClient("your-access-key", max_workers=1)
+
+        client.get_time_series("2020-01-01", "2021-01-01")
+
+        mock_requests_get.assert_any_call("https://data.fixer.io/api/timeseries",
+                                          params={"access_key": "your-access-key", "start_date": "2020-01-01",
+                                                  "end_date": "2020-12-30"}, timeout=(5, 30))
+        mock_requests_get.assert_called_with("https://data.fixer.io/api/timeseries",
+                                             params={"access_key": "your-access-key", "start_date": "2020-12-31",
+                                                     "end_date": "2021-01-01"}, timeout=(5, 30))
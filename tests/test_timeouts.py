@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+import requests
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException, FixerioTimeout
+from fixerio.professional_client import ProfessionalClient
+from fixerio.quota import QuotaScheduler
+from fixerio.retry import RetryPolicy
+from fixerio.timeouts import current_timeouts, timeouts
+
+
+class FixerioTimeoutsContextTestCase(unittest.TestCase):
+
+    def test_nested_blocks_keep_earlier_deadline(self):
+        with timeouts(read=1, deadline=10):
+            outer = current_timeouts()
+            with timeouts(connect=2, deadline=60):
+                inner = current_timeouts()
+                self.assertEqual((inner.connect, inner.read), (2, 1))
+                self.assertEqual(inner.expires_at, outer.expires_at)
+
+        self.assertIsNone(current_timeouts())
+
+    def test_remaining_raises_after_deadline(self):
+        with timeouts(deadline=0.01):
+            time.sleep(0.02)
+            with self.assertRaises(FixerioTimeout):
+                current_timeouts().remaining()
+
+    def test_timeout_is_fixer_exception(self):
+        self.assertTrue(issubclass(FixerioTimeout, FixerioException))
+
+
+class FixerioClientTimeoutsTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_client_timeout(self, mock_requests_get):
+        BasicClient("your-access-key", timeout=2).get_symbols()
+
+        self.assertEqual(mock_requests_get.call_args.kwargs["timeout"], (2, 2))
+
+    @patch('requests.Session.get')
+    def test_call_timeouts_override_client_timeout(self, mock_requests_get):
+        with timeouts(read=1):
+            BasicClient("your-access-key").get_symbols()
+
+        self.assertEqual(mock_requests_get.call_args.kwargs["timeout"], (5, 1))
+
+    @patch('requests.Session.get')
+    def test_deadline_shortens_timeouts(self, mock_requests_get):
+        BasicClient("your-access-key", deadline=0.5).get_symbols()
+
+        connect, read = mock_requests_get.call_args.kwargs["timeout"]
+        self.assertTrue(0 < connect <= 0.5 and 0 < read <= 0.5)
+
+    @patch('requests.Session.get')
+    def test_call_timeouts_apply_to_concurrent_windows(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": True, "rates": {}}
+        client = ProfessionalClient("your-access-key")
+
+        with timeouts(read=1):
+            client.get_time_series("2018-01-01", "2019-12-31")
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        for call in mock_requests_get.call_args_list:
+            self.assertEqual(call.kwargs["timeout"], (5, 1))
+
+    @patch('requests.Session.get')
+    def test_request_timeout_raises_fixer_timeout(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ReadTimeout("Read timed out")
+
+        with self.assertRaises(FixerioTimeout):
+            BasicClient("your-access-key").get_latest()
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_deadline_bounds_retries(self, mock_requests_get, mock_sleep):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        client = BasicClient("your-access-key", retry=RetryPolicy(backoff=1, jitter=False), deadline=0.5)
+
+        with self.assertRaises(FixerioTimeout):
+            client.get_latest()
+
+        mock_requests_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_deadline_bounds_quota_wait(self, mock_requests_get):
+        quota = QuotaScheduler(100, rate=1)
+        client = BasicClient("your-access-key", quota=quota, deadline=0.5)
+        client.get_symbols()
+
+        with self.assertRaises(FixerioTimeout):
+            client.get_symbols()
+        self.assertEqual(quota.used, 1)
+
+    @patch('requests.Session.get')
+    def test_deadline_bounds_wait_on_identical_request(self, mock_requests_get):
+        release = threading.Event()
+
+        def blocking_get(url, params=None, timeout=None):
+            release.wait(5)
+            return MagicMock()
+
+        mock_requests_get.side_effect = blocking_get
+        client = BasicClient("your-access-key")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(client.get_latest)
+            time.sleep(0.1)
+            with timeouts(deadline=0.1):
+                with self.assertRaises(FixerioTimeout):
+                    client.get_latest()
+            release.set()
+            leader.result()
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncClientTimeoutsTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_deadline_sets_total_timeout(self):
+        session = MagicMock()
+        session.get.side_effect = asyncio.TimeoutError()
+        client = AsyncBasicClient("your-access-key", session=session, timeout=(1, 2), deadline=0.5)
+
+        with self.assertRaises(FixerioTimeout):
+            await client.get_latest()
+
+        timeout = session.get.call_args.kwargs["timeout"]
+        self.assertTrue(0 < timeout.total <= 0.5)
+        self.assertTrue(timeout.connect <= 0.5 and timeout.sock_read <= 0.5)
@@ -0,0 +1,144 @@
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+from fixerio.async_client import aiohttp, AsyncBasicClient
+from fixerio.basic_client import BasicClient
+from fixerio.exceptions import FixerioException
+from fixerio.professional_plus_client import ProfessionalPlusClient
+from fixerio import results
+from fixerio.results import ConversionResult, FluctuationResult, HistoricalRates, LatestRates
+
+
+def latest_response():
+    return {"success": True, "timestamp": 1695832924, "base": "EUR", "date": "2023-09-27",
+            "rates": {"USD": 1.05, "GBP": 0.87, "JPY": 157.1}}
+
+
+def historical_response():
+    return dict(latest_response(), historical=True, date="2023-09-26")
+
+
+def convert_response():
+    return {"success": True, "query": {"from": "GBP", "to": "USD", "amount": 25},
+            "info": {"timestamp": 1695832924, "rate": 1.2}, "historical": True, "date": "2023-09-26",
+            "result": 30.0}
+
+
+def fluctuation_response():
+    return {"success": True, "fluctuation": True, "start_date": "2023-01-01", "end_date": "2023-06-01",
+            "base": "EUR", "rates": {
+                "USD": {"start_rate": 1.0, "end_rate": 1.1, "change": 0.1, "change_pct": 10.0},
+                "GBP": {"start_rate": 0.0, "end_rate": 0.9, "change": 0.9, "change_pct": None}
+            }}
+
+
+def deep_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key) + deep_size(item) for key, item in value.items())
+    return size
+
+
+class FixerioTypedResultsTestCase(unittest.TestCase):
+
+    def test_rates_lookup(self):
+        result = LatestRates.from_response(latest_response())
+
+        self.assertEqual(result["usd"], 1.05)
+        self.assertIn("GBP", result)
+        self.assertIsNone(result.get("CHF"))
+        self.assertEqual(list(result), ["USD", "GBP", "JPY"])
+        self.assertEqual(result.rates, latest_response()["rates"])
+
+    def test_to_dict(self):
+        self.assertEqual(LatestRates.from_response(latest_response()).to_dict(), latest_response())
+        self.assertEqual(HistoricalRates.from_response(historical_response()).to_dict(), historical_response())
+        self.assertEqual(ConversionResult.from_response(convert_response()).to_dict(), convert_response())
+        self.assertEqual(FluctuationResult.from_response(fluctuation_response()).to_dict(), fluctuation_response())
+
+    def test_results_share_currency_codes(self):
+        first = LatestRates.from_response(latest_response())
+        second = HistoricalRates.from_response(historical_response())
+
+        self.assertIs(first.symbols, second.symbols)
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_shared_currency_codes_are_bounded(self):
+        first = LatestRates.from_response(latest_response())
+        for count in range(results._SYMBOL_INDEXES_MAXSIZE + 10):
+            LatestRates.from_response(dict(latest_response(), rates={f"C{index:03}": 1.0 for index in range(count)}))
+
+        self.assertEqual(len(results._SYMBOL_INDEXES), results._SYMBOL_INDEXES_MAXSIZE)
+        self.assertEqual(first["USD"], 1.05)
+        self.assertIsNot(LatestRates.from_response(latest_response()).symbols, first.symbols)
+
+    def test_smaller_than_response(self):
+        response = dict(latest_response(), rates={f"C{index:02}": index / 7 for index in range(170)})
+        result = LatestRates.from_response(response)
+
+        self.assertLess(sys.getsizeof(result) + sys.getsizeof(result.values), deep_size(response) / 4)
+
+    def test_unsuccessful_response_raises(self):
+        with self.assertRaisesRegex(FixerioException, "101"):
+            LatestRates.from_response({"success": False, "error": {"code": 101}})
+
+
+class FixerioTypedResultsClientTestCase(unittest.TestCase):
+
+    @patch('requests.Session.get')
+    def test_dicts_by_default(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response()
+
+        self.assertEqual(BasicClient("your-access-key").get_latest(), latest_response())
+
+    @patch('requests.Session.get')
+    def test_typed_results(self, mock_requests_get):
+        client = ProfessionalPlusClient("your-access-key", typed_results=True)
+
+        mock_requests_get.return_value.json.return_value = latest_response()
+        self.assertIsInstance(client.get_latest(), LatestRates)
+        mock_requests_get.return_value.json.return_value = historical_response()
+        self.assertIsInstance(client.get_historical_rates("2023-09-26"), HistoricalRates)
+        mock_requests_get.return_value.json.return_value = convert_response()
+        self.assertEqual(client.convert_amount("GBP", "USD", 25).result, 30.0)
+        mock_requests_get.return_value.json.return_value = fluctuation_response()
+        self.assertEqual(client.get_fluctuation("2023-01-01", "2023-06-01")["USD"]["change_pct"], 10.0)
+
+    @patch('requests.Session.get')
+    def test_local_results_are_typed(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = latest_response()
+        client = BasicClient("your-access-key", typed_results=True, local_conversion=True)
+
+        conversion = client.convert_amount("GBP", "USD", 10)
+        fluctuation = client.compute_fluctuation("2023-01-01", "2023-06-01")
+
+        self.assertIsInstance(conversion, ConversionResult)
+        self.assertAlmostEqual(conversion.rate, 1.05 / 0.87)
+        self.assertIsInstance(fluctuation, FluctuationResult)
+
+    @patch('requests.Session.get')
+    def test_unsuccessful_response_raises(self, mock_requests_get):
+        mock_requests_get.return_value.json.return_value = {"success": False, "error": {"code": 104}}
+
+        with self.assertRaises(FixerioException):
+            BasicClient("your-access-key", typed_results=True).get_latest()
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class FixerioAsyncTypedResultsTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_typed_results(self):
+        session = MagicMock()
+        response = session.get.return_value.__aenter__.return_value
+        response.raise_for_status = MagicMock()
+
+        async def json_response(content_type=None):
+            return latest_response()
+
+        response.json = json_response
+        client = AsyncBasicClient("your-access-key", session=session, typed_results=True)
+
+        result = await client.get_latest()
+
+        self.assertIsInstance(result, LatestRates)
+        self.assertEqual(result["JPY"], 157.1)